@@ -0,0 +1,62 @@
+"""
+Benchmark of the creation of progress bars: how many short-lived progress
+bars per second can be created and closed, with the options given to each
+SimpleProgressBar, and with one ProgressBarStyle shared by all of them.
+
+Each progress bar draws only its first and last frame, as in a loop that
+creates a progress bar per small file. The progress bars are written to a
+file descriptor of os.devnull, so that the cost of the console is not
+measured.
+
+Run: python3 -m benchmarks.bench_construct
+"""
+import os
+import time
+from spb import SimpleProgressBar as spb, ProgressBarStyle
+
+
+BARS = 5_000
+
+OPTIONS = dict(len_bar=10, timer='hide', speed='show', color='blue',
+               output='tty')
+
+
+def with_options(n: int, fd: int) -> None:
+    for _ in range(n):
+        with spb(stop=10, stream=fd, **OPTIONS) as pb:
+            pb.update(10, 1024)
+
+
+def with_style(n: int, fd: int) -> None:
+    style = ProgressBarStyle(stream=fd, **OPTIONS)
+    for _ in range(n):
+        with spb(stop=10, style=style) as pb:
+            pb.update(10, 1024)
+
+
+def bars_per_second(loop, fd: int) -> float:
+    best = float('inf')
+    for _ in range(3):
+        start = time.perf_counter()
+        loop(BARS, fd)
+        best = min(best, time.perf_counter() - start)
+    return BARS / best
+
+
+def main() -> None:
+    fd = os.open(os.devnull, os.O_WRONLY)
+    try:
+        results = [
+            ('options per progress bar', bars_per_second(with_options, fd)),
+            ('shared ProgressBarStyle', bars_per_second(with_style, fd)),
+        ]
+    finally:
+        os.close(fd)
+    print(f"{'construction':<26}{'bars/s':>10}{'µs/bar':>10}")
+    for name, rate in results:
+        print(f'{name:<26}{rate:>10.0f}{1e6 / rate:>10.1f}')
+    print(f'speedup: {results[1][1] / results[0][1]:.2f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,92 @@
+"""
+Benchmark of copying a file with the progress bar: the loop over read()
+chunks that counts each chunk by hand (as in the examples) against
+copyfile() with the kernel copy and with the readinto() fallback.
+
+The progress bar is written to os.devnull, so that the cost of the console
+is not measured. The file is created in the temporary directory, whose file
+system decides which kernel copy is available. dst is removed before each
+run, so that truncating the previous copy is not measured.
+
+The wall time is mostly the cost of the page cache and the disk; the user
+CPU time shows what the copy costs the process itself.
+
+Run: python3 -m benchmarks.bench_copy [size in MiB]
+"""
+import errno
+import os
+import sys
+import tempfile
+import time
+from contextlib import redirect_stdout
+from unittest import mock
+from spb import SimpleProgressBar as spb, copyfile
+
+
+CHUNK = 64 * 1024
+
+
+def read_loop(src: str, dst: str) -> None:
+    pb = spb(stop=os.path.getsize(src), speed='show', load='show',
+             len_bar=10, timer='hide')
+    with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+        while True:
+            chunk = fsrc.read(CHUNK)
+            if not chunk:
+                break
+            fdst.write(chunk)
+            pb.loaded_bytes += len(chunk)
+            pb.iteration += len(chunk) - 1
+            next(pb)
+    pb.close()
+
+
+def kernel_copy(src: str, dst: str) -> None:
+    copyfile(src, dst, len_bar=10, timer='hide')
+
+
+def readinto_copy(src: str, dst: str) -> None:
+    def unsupported(*args):
+        raise OSError(errno.ENOSYS, 'disabled by the benchmark')
+
+    with mock.patch('os.copy_file_range', unsupported, create=True), \
+            mock.patch('os.sendfile', unsupported, create=True):
+        copyfile(src, dst, len_bar=10, timer='hide')
+
+
+def best_times(copy, src: str, dst: str) -> tuple:
+    """Return the best wall time, user and system CPU time of 3 copies"""
+    best = (float('inf'),) * 3
+    for _ in range(3):
+        if os.path.exists(dst):
+            os.remove(dst)
+        start, cpu = time.perf_counter(), os.times()
+        copy(src, dst)
+        end, cpu_end = time.perf_counter(), os.times()
+        best = min(best, (end - start, cpu_end.user - cpu.user,
+                          cpu_end.system - cpu.system))
+    return best
+
+
+def main() -> None:
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 256
+    with tempfile.TemporaryDirectory() as tmp:
+        src, dst = os.path.join(tmp, 'src.bin'), os.path.join(tmp, 'dst.bin')
+        with open(src, 'wb') as f:
+            for _ in range(size):
+                f.write(os.urandom(1 << 20))
+        results = []
+        with open(os.devnull, 'w') as devnull, redirect_stdout(devnull):
+            for name, copy in [(f'read() loop, {CHUNK >> 10} KiB', read_loop),
+                               ('copyfile(), readinto()', readinto_copy),
+                               ('copyfile(), kernel copy', kernel_copy)]:
+                results.append((name, best_times(copy, src, dst)))
+    print(f"{'copy of ' + str(size) + ' MiB':<28}{'wall, s':>9}{'MiB/s':>8}"
+          f"{'user, s':>9}{'sys, s':>8}")
+    for name, (seconds, user, system) in results:
+        print(f'{name:<28}{seconds:>9.3f}{size / seconds:>8.0f}'
+              f'{user:>9.2f}{system:>8.2f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,114 @@
+"""
+Benchmark of the accuracy of the eta models on synthetic workloads.
+
+Each workload is a rate of iterations per second as a function of time. The
+models get the state of the progress bar every 0.1 second (as the frames of
+the progress bar), and each estimate is compared with the true remaining
+time. The score of a model on a workload is the mean absolute error of the
+estimated finish time, in percent of the whole duration, over the part of
+the run from 10% to 90% of the iterations (lower is better).
+
+Run: python3 -m benchmarks.bench_eta
+"""
+import math
+import random
+import time
+from spb import AverageEta, EwmaEta, LeastSquaresEta
+
+
+STEP = 0.1  # seconds between two frames
+TOTAL = 1_000_000
+
+
+def steady(t: float) -> float:
+    return 5000
+
+
+def accelerating(t: float) -> float:
+    return 1000 + 100 * t
+
+
+def decelerating(t: float) -> float:
+    return 20_000 / (1 + t / 20)
+
+
+def make_bursty(seed: int = 0):
+    """Bursts of 5 s at a random rate, separated by stalls of up to 3 s"""
+    rng = random.Random(seed)
+    periods = []
+    t = 0.0
+    while t < 10_000:
+        periods.append((t, rng.uniform(5_000, 30_000)))
+        t += 5
+        periods.append((t, 0))
+        t += rng.uniform(0, 3)
+    starts = [start for start, _ in periods]
+
+    def bursty(t: float) -> float:
+        lo, hi = 0, len(starts) - 1
+        while lo < hi:  # the last period that starts before t
+            mid = (lo + hi + 1) // 2
+            if starts[mid] <= t:
+                lo = mid
+            else:
+                hi = mid - 1
+        return periods[lo][1]
+
+    return bursty
+
+
+def sine(t: float) -> float:
+    return 5000 * (1 + 0.8 * math.sin(t / 5))
+
+
+def run(workload) -> list:
+    """Return the states (elapsed, done) of the workload on each frame"""
+    states = []
+    elapsed = done = 0.0
+    while done < TOTAL:
+        elapsed += STEP
+        done = min(done + workload(elapsed) * STEP, TOTAL)
+        states.append((elapsed, done))
+    return states
+
+
+def score(model, states: list) -> float:
+    duration = states[-1][0]
+    errors = []
+    for elapsed, done in states:
+        remaining = model.estimate(elapsed, done, TOTAL)
+        if 0.1 * TOTAL <= done <= 0.9 * TOTAL:
+            errors.append(abs(elapsed + remaining - duration))
+    return sum(errors) / len(errors) / duration * 100
+
+
+def main() -> None:
+    workloads = [('steady', steady), ('accelerating', accelerating),
+                 ('decelerating', decelerating), ('bursty', make_bursty()),
+                 ('sine', sine)]
+    models = [('average', AverageEta), ('ewma', EwmaEta),
+              ('lsq', LeastSquaresEta)]
+    runs = [(name, run(workload)) for name, workload in workloads]
+
+    print('mean error of the finish time, % of the duration (lower is '
+          'better)')
+    print(f"{'workload':<14}{'duration, s':>12}" +
+          ''.join(f'{name:>10}' for name, _ in models))
+    for name, states in runs:
+        row = [score(model(), states) for _, model in models]
+        print(f'{name:<14}{states[-1][0]:>12.1f}' +
+              ''.join(f'{error:>10.2f}' for error in row))
+
+    print(f"\n{'model':<14}{'us/estimate':>12}")
+    states = runs[0][1]
+    for name, model in models:
+        estimator = model()
+        start = time.perf_counter()
+        for elapsed, done in states:
+            estimator.estimate(elapsed, done, TOTAL)
+        cost = (time.perf_counter() - start) / len(states) * 1e6
+        print(f'{name:<14}{cost:>12.2f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,64 @@
+"""
+Benchmark of the per-item overhead of the progress bar wrapped around an
+iterable, compared with a bare loop over the same iterable.
+
+The progress bar is written to os.devnull, so that the cost of the console
+is not measured.
+
+Run: python3 -m benchmarks.bench_iterable
+"""
+import os
+import time
+from contextlib import redirect_stdout
+from spb import SimpleProgressBar as spb
+
+
+ITEMS = 2_000_000
+
+
+def bare_loop(n: int) -> None:
+    for _ in range(n):
+        pass
+
+
+def iterable_loop(n: int) -> None:
+    for _ in spb(iterable=range(n)):
+        pass
+
+
+def next_loop(n: int) -> None:
+    pb = spb(stop=n)
+    for _ in range(n):
+        next(pb)
+
+
+def for_over_bar_loop(n: int) -> None:
+    for _ in spb(stop=n):
+        pass
+
+
+def ns_per_item(loop) -> float:
+    best = float('inf')
+    for _ in range(3):
+        start = time.perf_counter()
+        loop(ITEMS)
+        best = min(best, time.perf_counter() - start)
+    return best / ITEMS * 1e9
+
+
+def main() -> None:
+    with open(os.devnull, 'w') as devnull, redirect_stdout(devnull):
+        bare = ns_per_item(bare_loop)
+        results = [
+            ('spb(iterable=range(n))', ns_per_item(iterable_loop)),
+            ('for _ in spb(stop=n)', ns_per_item(for_over_bar_loop)),
+            ('next(pb) in range(n)', ns_per_item(next_loop)),
+        ]
+    print(f"{'loop':<26}{'ns/item':>10}{'overhead, ns':>14}")
+    print(f"{'bare for loop':<26}{bare:>10.1f}{'-':>14}")
+    for name, ns in results:
+        print(f'{name:<26}{ns:>10.1f}{ns - bare:>14.1f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,127 @@
+"""
+Benchmark of the cost of one frame of the progress bar, before and after the
+render plan, for the option mixes used in examples/base_examples.py.
+
+"before" is the frame builder of spb 0.1.1, which formats every part of the
+line (brackets, colour escapes, names and icons of the indicators) on every
+frame. "after" is the current SimpleProgressBar, where the static parts are
+compiled once in __init__().
+
+Only the preparation of the line is measured, nothing is written to the
+console.
+
+Run: python3 -m benchmarks.bench_render
+"""
+import io
+import timeit
+from contextlib import redirect_stdout
+from spb import SimpleProgressBar as spb
+from benchmarks.bench_units import legacy_format
+
+
+FRAMES = 20_000
+
+# The option mixes of examples/base_examples.py
+EXAMPLES = {
+    'base example №1': dict(start=0, stop=1_000_00),
+    'base example №2': dict(start=0, stop=5_000_00, len_bar=25,
+                            variant_bar='decreasing', variant_space=' ',
+                            color='yellow',
+                            variant_icon_timer='▁▂▃▄▅▆▇█▇▆▅▄▃▂▁',
+                            end_msg='Complete.'),
+    'base example №3': dict(stop=5_000_00, variant_bar='increasing',
+                            color='blue', variant_icon_timer='⣾⣷⣯⣟⡿⢿⣻⣽'),
+    'base example №4': dict(start=1500_00, stop=5_000_00, timer_str='',
+                            color='white'),
+    'base example №5': dict(start=5000_00, stop=1_000_000,
+                            variant_bar='decreasing',
+                            variant_timer='decreasing', reverse_timer_str=''),
+}
+
+
+def legacy_frame(pb) -> str:
+    """The frame builder of spb 0.1.1 (before the render plan)"""
+    share_of_iterations = pb._calculate_share_of_iterations()
+    arrow = round(share_of_iterations * pb._len_bar - 1) * pb._v_arrow
+    percent = round(share_of_iterations * 100, 1)
+    spaces = ''
+    brackets = list(pb._v_brackets)
+    diff_bar = (pb._len_bar - len(arrow) - 1)
+    if pb._v_bar == 'static':
+        spaces = diff_bar * pb._v_sp
+    else:
+        brackets[0] = ' '
+        brackets[1] = ''
+    if pb._v_bar == 'decreasing':
+        arrow = diff_bar * pb._v_arrow
+        percent = 100 - percent
+
+    if pb._v_timer == 'decreasing':
+        sec = pb._calculate_remaining_time()
+        mes = ' ' + pb._reverse_timer_str
+    else:
+        sec = pb._calculate_passed_time()
+        mes = ' ' + pb._timer_str
+    minutes = int(sec // 60)
+    hours = int(minutes // 60)
+    seconds = round(sec % 60, 1)
+    res_hours = ''
+    if 0 < hours < 23:
+        res_hours = f'0{hours}:' if len(str(hours)) < 2 else f'{hours}:'
+    prefix_min = '0' if len(str(minutes)) < 2 else ''
+    prefix_sec = '0' if len(str(seconds)) < 2 else ''
+    timer = f"{pb._select_icon_to_timer()}{mes}[\x1b[3" \
+            f"{str(pb._color)}m{res_hours}{prefix_min}{minutes}:" \
+            f"{prefix_sec}{seconds}\x1b[0m]"
+
+    progress = '\x1b[3{}m{:0.1f}\x1b[0m%'.format(pb._color, percent) \
+        if pb._percent == 'show' else ''
+    if pb._progress_bar == 'show':
+        progress_bar = f"{brackets[0]}\x1b[3{pb._color}m" \
+                       f"{arrow}\x1b[0m{spaces}{brackets[1]} "
+    elif pb._progress_bar == 'hide' and pb._progress_str != '':
+        progress_bar = ' '
+        progress = pb._progress_str + progress
+    else:
+        progress_bar = ''
+        progress = ''
+    timer = '' if pb._timer != 'show' else timer
+    speed = ''
+    if pb._speed == 'show':
+        speed = f"{pb._select_icon_to_speed()}{pb._speed_str}[" \
+                f"{legacy_format(pb._calculate_rate(), 'bit/s')}]"
+    loaded = ''
+    if pb._load == 'show':
+        loaded = f"{pb._select_icon_to_load()}{pb._load_str}[" \
+                 f"{legacy_format(pb.loaded_bytes)}]"
+
+    return "\r" + progress_bar + progress + timer + speed + loaded + "  \b"
+
+
+def current_frame(pb) -> str:
+    return pb._prepare_string_progress_bar(
+        *pb._calculate_basic_element_progress_bar()
+    )
+
+
+def ns_per_frame(frame, pb) -> float:
+    timer = timeit.Timer(lambda: frame(pb))
+    return min(timer.repeat(repeat=5, number=FRAMES)) / FRAMES * 1e9
+
+
+def main() -> None:
+    print(f"{'option mix':<28}{'before, ns':>12}{'after, ns':>12}"
+          f"{'speedup':>10}")
+    for name, options in EXAMPLES.items():
+        with redirect_stdout(io.StringIO()):
+            pb = spb(**options)
+        pb.iteration = (pb.iteration + options['stop']) // 2
+        pb.loaded_bytes = 12_345_678
+        before = ns_per_frame(legacy_frame, pb)
+        after = ns_per_frame(current_frame, pb)
+        print(f'{name:<28}{before:>12.0f}{after:>12.0f}'
+              f'{before / after:>9.2f}x')
+
+
+if __name__ == '__main__':
+    main()
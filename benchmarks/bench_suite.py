@@ -0,0 +1,304 @@
+"""
+Benchmark suite of the overhead of the progress bar, across the matrix of
+the indicators: the variant of the bar (static, increasing, decreasing), the
+timer (increasing, decreasing), the icon of the timer (animated, static) and
+the Speed and Loaded indicators (off, on).
+
+For each combination three costs are measured:
+    next_ns       - ns per iteration of next(pb), with the default
+                    throttling of the redraws, in the steady state;
+    frame_ns      - ns per frame drawn by progress_bar(), each frame
+                    differs from the previous one, so that it is written;
+    construct_us  - us per creation of a SimpleProgressBar.
+
+The progress bars are written to two sinks:
+    null  - a text stream that drops everything, the cost of spb itself;
+    pty   - a pseudo-terminal (Unix only), the cost with a real terminal
+            driver; a thread reads and drops the output on the other side.
+
+The results are written as JSON (--json) and compared with a stored
+baseline (benchmarks/baseline.json by default). The timings are divided by
+the time of a calibration loop (string formatting, without spb) measured in
+the same rounds, so that the drift of the speed of the machine, and a
+baseline made on another machine, are roughly compensated. A regression is
+a cost of a combination grown by more than --tolerance, or the geometric
+mean of a cost over the whole matrix grown by more than --mean-tolerance
+(which catches a small slowdown of everything despite the noise of single
+measurements). The regressions are listed and the exit status is 1.
+
+The stored baseline was made on one machine: after a change of the machine
+or of the Python version, make your own with --save-baseline.
+
+Run: python3 -m benchmarks.bench_suite [--json results.json]
+                                        [--baseline PATH] [--save-baseline]
+                                        [--tolerance 0.5] [--quick]
+"""
+import argparse
+import itertools
+import json
+import math
+import os
+import platform
+import sys
+import threading
+import time
+from spb import SimpleProgressBar as spb
+
+
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                        'baseline.json')
+
+METRICS = ('next_ns', 'frame_ns', 'construct_us')
+
+MATRIX = {
+    'variant_bar': ('static', 'increasing', 'decreasing'),
+    'variant_timer': ('increasing', 'decreasing'),
+    'icon_timer': ('animated', 'static'),
+    'speed_load': ('off', 'on'),
+}
+
+
+class NullStream:
+    """A text stream that drops everything written to it"""
+
+    def write(self, text: str) -> int:
+        return len(text)
+
+    def flush(self) -> None:
+        pass
+
+    def isatty(self) -> bool:
+        return True
+
+
+class Pty:
+    """A pseudo-terminal, the progress bar writes to the slave side, a thread
+    reads and drops the output on the master side.
+    """
+
+    def __init__(self) -> None:
+        import pty
+        self._master, self.fd = pty.openpty()
+        self._reader = threading.Thread(target=self._drain, daemon=True)
+        self._reader.start()
+
+    def _drain(self) -> None:
+        try:
+            while os.read(self._master, 65536):
+                pass
+        except OSError:  # the slave side is closed
+            pass
+
+    def close(self) -> None:
+        os.close(self.fd)
+        self._reader.join()
+        os.close(self._master)
+
+
+def combinations() -> list:
+    """Return the name and the options of each combination of the matrix"""
+    result = []
+    for values in itertools.product(*MATRIX.values()):
+        bar, timer, icon, speed_load = values
+        options = dict(variant_bar=bar, variant_timer=timer,
+                       icon_timer=icon, output='tty')
+        if speed_load == 'on':
+            options.update(speed='show', load='show')
+        result.append(('/'.join(values), options))
+    return result
+
+
+def warmed_up(stream, options: dict):
+    """Return a progress bar after a few mininterval of next(pb): with the
+    default miniters=0, the number of iterations between the checks of the
+    clock is adapted after the first redraws.
+    """
+    pb = spb(stop=10 ** 12, stream=stream, **options)
+    deadline = time.perf_counter() + 0.25
+    while time.perf_counter() < deadline:
+        for _ in range(1000):
+            next(pb)
+    return pb
+
+
+def measure_next(pb, iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        next(pb)
+    return (time.perf_counter() - start) / iterations * 1e9
+
+
+def measure_frame(stream, options: dict, frames: int) -> float:
+    # At stop=1000 each iteration changes the percent by 0.1%, so that each
+    # frame differs from the previous one.
+    elapsed = 0.0
+    for _ in range(frames // 999 + 1):
+        pb = spb(stop=1000, stream=stream, **options)
+        start = time.perf_counter()
+        for i in range(1, 1000):
+            pb.iteration = i
+            pb.progress_bar()
+        elapsed += time.perf_counter() - start
+    return elapsed / ((frames // 999 + 1) * 999) * 1e9
+
+
+def measure_construct(stream, options: dict, bars: int) -> float:
+    start = time.perf_counter()
+    for _ in range(bars):
+        spb(stop=100, stream=stream, **options)
+    return (time.perf_counter() - start) / bars * 1e6
+
+
+def calibrate(iterations: int) -> float:
+    """Return the ns per iteration of a loop that formats, joins and encodes
+    a short line, the same kind of work as a frame, without spb.
+    """
+    parts = ['\r', ' |', '▇' * 10, '-' * 24, '| ']
+    start = time.perf_counter()
+    for i in range(iterations // 10):
+        (f'{i / 7:6.2f}' + ''.join(parts)).encode()
+    return (time.perf_counter() - start) / (iterations // 10) * 1e9
+
+
+def run(quick: bool, repeat: int) -> dict:
+    """Measure all the combinations in each of the repeat rounds, and keep
+    the best time of each cost. The rounds go over the whole matrix, so that
+    a burst of the load of the machine does not spoil all the repeats of
+    one combination.
+    """
+    iterations, frames, bars = (20_000, 999, 200) if quick else \
+        (200_000, 2_000, 500)
+    sinks = [('null', NullStream(), None)]
+    if os.name == 'posix':
+        terminal = Pty()
+        sinks.append(('pty', terminal.fd, terminal))
+
+    try:
+        cases = [(f'{sink}/{name}', stream, options)
+                 for sink, stream, _ in sinks
+                 for name, options in combinations()]
+        warm = {name: warmed_up(stream, options)
+                for name, stream, options in cases}
+        results = {name: dict.fromkeys(METRICS, float('inf'))
+                   for name, _, _ in cases}
+        calibration = float('inf')
+        for _ in range(repeat):
+            calibration = min(calibration, calibrate(iterations))
+            for name, stream, options in cases:
+                costs = results[name]
+                costs['next_ns'] = min(
+                    costs['next_ns'], measure_next(warm[name], iterations))
+                costs['frame_ns'] = min(
+                    costs['frame_ns'], measure_frame(stream, options, frames))
+                costs['construct_us'] = min(
+                    costs['construct_us'],
+                    measure_construct(stream, options, bars))
+    finally:
+        for _, _, terminal in sinks:
+            if terminal is not None:
+                terminal.close()
+
+    return {
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'machine': platform.machine(),
+        'calibration_ns': calibration,
+        'results': results,
+    }
+
+
+def compare(report: dict, baseline: dict, tolerance: float,
+            mean_tolerance: float) -> list:
+    """Return the regressions: (name, metric, change), where change is the
+    relative growth of the cost, both costs divided by the calibration. The
+    name of the geometric mean of a metric over the matrix is 'mean'.
+    """
+    regressions = []
+    scale = baseline['calibration_ns'] / report['calibration_ns']
+    changes = {metric: [] for metric in METRICS}
+    for name, costs in report['results'].items():
+        base = baseline['results'].get(name)
+        if base is None:
+            continue
+        for metric in METRICS:
+            change = costs[metric] * scale / base[metric] - 1
+            changes[metric].append(change)
+            if change > tolerance:
+                regressions.append((name, metric, change))
+    for metric, values in changes.items():
+        if values:
+            change = math.exp(sum(math.log1p(x) for x in values) /
+                              len(values)) - 1
+            if change > mean_tolerance:
+                regressions.append(('mean', metric, change))
+    return regressions
+
+
+def print_report(report: dict) -> None:
+    print(f"{'sink/variant_bar/variant_timer/icon_timer/speed_load':<52}" +
+          ''.join(f'{metric:>14}' for metric in METRICS))
+    for name, costs in report['results'].items():
+        print(f'{name:<52}' +
+              ''.join(f'{costs[metric]:>14.1f}' for metric in METRICS))
+    print(f"calibration: {report['calibration_ns']:.1f} ns per line")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        description='Benchmark suite of the overhead of spb')
+    parser.add_argument('--json', help='write the results to this file')
+    parser.add_argument('--baseline', default=BASELINE,
+                        help='the baseline to compare with')
+    parser.add_argument('--save-baseline', action='store_true',
+                        help='store the results as the baseline')
+    parser.add_argument('--tolerance', type=float, default=0.5,
+                        help='the allowed growth of a cost of one '
+                             'combination [default: 0.5]')
+    parser.add_argument('--mean-tolerance', type=float, default=0.15,
+                        help='the allowed growth of the geometric mean of a '
+                             'cost [default: 0.15]')
+    parser.add_argument('--repeat', type=int, default=5,
+                        help='the number of rounds [default: 5]')
+    parser.add_argument('--quick', action='store_true',
+                        help='fewer iterations, less accurate')
+    args = parser.parse_args(argv)
+
+    # The same full layout of the line for any console
+    os.environ['COLUMNS'] = '200'
+    report = run(args.quick, args.repeat)
+    print_report(report)
+
+    regressions = None
+    if args.save_baseline:
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f'baseline saved to {args.baseline}')
+    elif not os.path.exists(args.baseline):
+        print(f'no baseline at {args.baseline}, use --save-baseline')
+    else:
+        with open(args.baseline, encoding='utf-8') as f:
+            baseline = json.load(f)
+        regressions = compare(report, baseline, args.tolerance,
+                              args.mean_tolerance)
+        report['regressions'] = [
+            {'name': name, 'metric': metric, 'change': change}
+            for name, metric, change in regressions
+        ]
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+
+    if not regressions:
+        if regressions is not None:
+            print(f'no regressions against {args.baseline}')
+        return 0
+    print(f'REGRESSIONS against {args.baseline} (tolerance '
+          f'{args.tolerance:.0%}, mean {args.mean_tolerance:.0%}):',
+          file=sys.stderr)
+    for name, metric, change in regressions:
+        print(f'  {name} {metric}: +{change:.0%}', file=sys.stderr)
+    return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
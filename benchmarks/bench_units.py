@@ -0,0 +1,62 @@
+"""
+Benchmark of the human-readable units of the Speed and Loaded indicators,
+before and after the unit formatter.
+
+"before" is the conversion of spb 0.1.1, which divides the value by 1000
+unit by unit and formats it with str.format() on every frame. "after" is
+_UnitFormatter, which picks the unit by a binary search in the precomputed
+limits of the units.
+
+The values are spread over all the magnitudes from 1 B to 1 YB (uniformly
+in the logarithm), so that the cost of the loop of "before" over the units
+is counted in its true share. The formatter is measured with distinct
+values ("after") and with the same value on each call ("after, same"), as
+the loaded bytes between two frames without new data.
+
+Run: python3 -m benchmarks.bench_units
+"""
+import random
+import timeit
+from spb.units_spb import _UnitFormatter
+
+
+VALUES = 10_000
+COLOR_ON = '\x1b[32m'
+COLOR_OFF = '\x1b[0m'
+
+
+def legacy_format(byte: float, suf: str = 'B', color_on: str = COLOR_ON,
+                  color_off: str = COLOR_OFF) -> str:
+    """The conversion of spb 0.1.1 (before the unit formatter)"""
+    for unit in ['', 'k', 'M', 'G', 'T', 'P', 'E', 'Z', 'Y']:
+        if abs(byte) < 1000:
+            return color_on + '{:6.2f}'.format(byte) + color_off + unit + \
+                   str(suf)
+        byte /= 1000
+
+    return '?'
+
+
+def ns_per_value(function, values: list) -> float:
+    timer = timeit.Timer(lambda: [function(value) for value in values])
+    return min(timer.repeat(repeat=5, number=20)) / (20 * len(values)) * 1e9
+
+
+def main() -> None:
+    rng = random.Random(1)
+    values = [10 ** rng.uniform(0, 24) for _ in range(VALUES)]
+    same = [values[0]] * VALUES
+
+    before = ns_per_value(legacy_format, values)
+    print(f"{'units':<8}{'before, ns':>12}{'after, ns':>12}"
+          f"{'after, same':>13}{'speedup':>10}")
+    for units in ('si', 'iec'):
+        format_size = _UnitFormatter(units, 'B', 1, COLOR_ON, COLOR_OFF)
+        after = ns_per_value(format_size, values)
+        cached = ns_per_value(format_size, same)
+        print(f'{units:<8}{before:>12.0f}{after:>12.0f}{cached:>13.0f}'
+              f'{before / after:>9.2f}x')
+
+
+if __name__ == '__main__':
+    main()
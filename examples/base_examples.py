@@ -94,6 +94,14 @@ try:
 except KeyboardInterrupt:
     print("\n\x1b[?25h Work aborted.")
 
+# Base example №6 (wrap an iterable, the loop ends with it):
+try:
+    for item in spb(iterable=range(1_000_000), color='cyan'):
+        # your code ...
+        pass
+except KeyboardInterrupt:
+    print("\n\x1b[?25h Work aborted.")
+
 # Examples setup param: variant_brackets, variant_arrow and variant_space:
 # ------------------------------------------------------------------------
 # by default:
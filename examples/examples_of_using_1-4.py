@@ -25,8 +25,7 @@ try:
             for chunk in req.iter_content(chunk_size=1024):
                 if chunk:
                     f.write(chunk)
-                    pb.loaded_bytes += len(chunk)  # for ⭳[weight] & [speed]
-                    next(pb)
+                    pb.update(1, len(chunk))  # for ⭳[weight] & [speed]
     else:
         raise ConnectionError
 except (ConnectionError, KeyboardInterrupt):
@@ -61,8 +60,7 @@ for url in urls:
                 for chunk in req.iter_content(chunk_size=1024):
                     if chunk:
                         f.write(chunk)
-                        pb.loaded_bytes += len(chunk)
-                        next(pb)
+                        pb.update(1, len(chunk))
         else:
             raise ConnectionError
     except (ConnectionError, KeyboardInterrupt):
@@ -100,8 +98,7 @@ for url in urls:
                 for chunk in req.stream(1024):
                     if chunk:
                         f.write(chunk)
-                        pb.loaded_bytes += len(chunk)
-                        next(pb)
+                        pb.update(1, len(chunk))
         else:
             raise ConnectionError
     except (ConnectionError, KeyboardInterrupt):
@@ -140,8 +137,7 @@ def url_response(urls):
                     for chunk in req.iter_content(chunk_size=1024):
                         if chunk:
                             f.write(chunk)
-                            pb.loaded_bytes += len(chunk)
-                            next(pb)
+                            pb.update(1, len(chunk))
             else:
                 raise ConnectionError
         except (ConnectionError, KeyboardInterrupt):
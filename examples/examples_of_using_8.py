@@ -6,7 +6,7 @@ not knowing the content-length, then you need to remove the progress bar and
 remove the percentage.
 """
 import requests
-from spb import SimpleProgressBar as spb
+from spb import SimpleProgressBar as spb, ProgressFile
 
 # We have a link to a public file:
 # https://drive.google.com/file/d/1d3V33JRUS0i0cRHLqnmQ1tfT8peXt-9f/view?usp=sharing
@@ -45,14 +45,13 @@ try:
             speed='show',
             load='show'
         )
-        with open(file_name, "wb") as f:
+        # ProgressFile counts the bytes actually written (the last chunk is
+        # usually shorter than chunk_size).
+        with ProgressFile(open(file_name, "wb"), pb) as f:
             for chunk in response.iter_content(chunk_size=32768):
                 if chunk:
-                    pb.loaded_bytes += 32768
                     f.write(chunk)
-                    next(pb)
-            else:
-                print('\n')
+        pb.close()
     else:
         raise ConnectionError
 except (ConnectionError, KeyboardInterrupt):
@@ -38,6 +38,7 @@ if __name__ == "__main__":
         packages=find_packages(exclude=[
             '*.tests', '*.tests.*', 'tests',
             '*.examples', '*.examples.*', 'examples',
+            '*.benchmarks', '*.benchmarks.*', 'benchmarks',
             '*..github', '*..github.*', '.github'
         ]),
         include_package_data=True,
@@ -1,2 +1,10 @@
 from .spb import SimpleProgressBar
 from .check_params_spb import _CheckParams
+from .shared_spb import SharedCounter
+from .async_spb import AsyncProgressBar
+from .manager_spb import ProgressBarManager
+from .io_spb import ProgressFile, copyfile
+from .eta_spb import EtaEstimator, AverageEta, EwmaEta, LeastSquaresEta
+from .telemetry_spb import TelemetrySink, JsonLinesSink, \
+    PrometheusTextfileSink, StatsdSink
+from .style_spb import ProgressBarStyle
@@ -0,0 +1,156 @@
+import asyncio
+from .spb import SimpleProgressBar, _NullProgressBar
+
+
+class AsyncProgressBar(SimpleProgressBar):
+    """Progress bar for asyncio programs.
+
+    The counters are updated in the event loop by `async for` or by
+    `await update()`, while the progress bar is drawn by its own asyncio
+    task, which writes to the console in a thread of the default executor,
+    so that a slow console never blocks the event loop (and all the
+    in-flight transfers with it).
+
+        async with AsyncProgressBar(stop=content_length, speed='show',
+                                    load='show') as pb:
+            async for chunk in response.content.iter_chunked(1024):
+                f.write(chunk)
+                await pb.update(len(chunk), len(chunk))
+
+        async for item in AsyncProgressBar(stop=100, aiterable=source()):
+            ...
+
+    Parameters
+    ----------
+    All the parameters of SimpleProgressBar, and:
+
+    aiterable  : asynchronous iterable, optional
+        If set, `async for` over the progress bar returns the items of
+        aiterable, counting one iteration per item. Otherwise `async for`
+        returns the number of the iteration, up to stop.
+        [default: None]
+
+    refresh_rate  : int or float, > 0, optional
+        How many times per second the progress bar is redrawn by the render
+        task.
+        [default: 10]
+    """
+
+    def __init__(self, *args, aiterable=None, refresh_rate: float = 10,
+                 **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        if not isinstance(refresh_rate, (int, float)) or refresh_rate <= 0:
+            raise ValueError(f'refresh_rate must be > 0, not {refresh_rate}')
+        # next() never draws, all the frames are drawn by the render task.
+        self._background = True
+        self._next_check = self._stop + 1
+        self._interval = 1 / refresh_rate
+        self._aiterator = aiterable.__aiter__() if aiterable is not None \
+            else None
+        self._render_task = None
+
+    @staticmethod
+    def _null_class() -> type:
+        return _NullAsyncProgressBar
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if self._render_task is None:
+            self._start_render_task()
+
+        if self._aiterator is not None:
+            try:
+                item = await self._aiterator.__anext__()
+            except StopAsyncIteration:
+                await self.aclose()
+                raise
+            self.iteration += 1
+            return item
+
+        if self.iteration >= self._stop:
+            await self.aclose()
+            raise StopAsyncIteration
+        self.iteration += 1
+
+        return self.iteration
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.aclose()
+
+    async def update(self, n: int = 1, nbytes: int = 0) -> None:
+        """Increase the counters by n iterations and nbytes loaded bytes.
+
+        Nothing is drawn here: the frame is drawn by the render task.
+        """
+        if self._render_task is None:
+            self._start_render_task()
+        self.iteration += n
+        self.loaded_bytes += nbytes
+
+    def _start_render_task(self) -> None:
+        self._render_task = asyncio.ensure_future(self._render())
+
+    async def _render(self) -> None:
+        """Redraw the progress bar every self._interval seconds, until
+        iteration reaches stop or aclose() is called. If stop is reached
+        before the first frame or while a frame is drawn, the final frame is
+        drawn once more.
+
+        The frame is drawn in a thread of the default executor, see
+        "Executing code in thread or process pools" in:
+        https://docs.python.org/3/library/asyncio-eventloop.html
+        """
+        loop = asyncio.get_event_loop()
+        while self._counted_iterations() < self._stop:
+            await asyncio.sleep(self._interval)
+            await loop.run_in_executor(None, self.progress_bar)
+        if not self._finished:
+            await loop.run_in_executor(None, self.progress_bar)
+
+    async def aclose(self) -> None:
+        """Stop the render task, draw the last frame, show the console cursor
+        and the end message, without blocking the event loop.
+        """
+        if self._render_task is not None and not self._render_task.done():
+            self._render_task.cancel()
+            try:
+                await self._render_task
+            except asyncio.CancelledError:
+                pass
+        await asyncio.get_event_loop().run_in_executor(None, self.close)
+
+
+class _NullAsyncProgressBar(_NullProgressBar, AsyncProgressBar):
+    """The disabled AsyncProgressBar, see _NullProgressBar. Protected class.
+    Designed for internal use.
+    """
+
+    def __init__(self, *args, aiterable=None, refresh_rate: float = 10,
+                 **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._aiterable = aiterable
+
+    def __aiter__(self):
+        if self._aiterable is not None:
+            return self._aiterable.__aiter__()
+
+        return self
+
+    async def __anext__(self):
+        if self.iteration >= self._stop:
+            raise StopAsyncIteration
+        self.iteration += 1
+
+        return self.iteration
+
+    async def update(self, n: int = 1, nbytes: int = 0) -> None:
+        self.iteration += n
+        self.loaded_bytes += nbytes
+
+    async def aclose(self) -> None:
+        pass
@@ -1,5 +1,7 @@
-import shutil
+import time
 from typing import Union
+from .eta_spb import EtaEstimator, ETA_MODELS
+from .telemetry_spb import TelemetrySink
 
 
 class _CheckParams:
@@ -32,7 +34,25 @@ class _CheckParams:
             variant_icon_load: str = '⭳',
             load_str: str = 'Loaded',
             color: str = 'green',
-            end_msg: str = ""
+            end_msg: str = "",
+            mininterval: float = 0.1,
+            miniters: int = 0,
+            maxinterval: float = 10,
+            redraw: str = 'line',
+            refresh_rate: float = 0,
+            speed_window: float = 5,
+            clock=time.monotonic,
+            eta='average',
+            output: str = 'auto',
+            log_interval: float = 30,
+            log_percent: float = 10,
+            telemetry=None,
+            telemetry_interval: float = 1,
+            telemetry_labels: dict = None,
+            overhead: str = 'hide',
+            units: str = 'si',
+            speed_unit: str = 'bit/s',
+            stream=None
     ) -> None:
         """
         The name of the properties does not always coincide with the names
@@ -71,22 +91,89 @@ class _CheckParams:
         self._load_str = load_str
         self._color = color
         self._end_msg = end_msg
+        self._mininterval = mininterval
+        self._miniters = miniters
+        self._maxinterval = maxinterval
+        self._redraw = redraw
+        self._refresh_rate = refresh_rate
+        self._speed_window = speed_window
+        self._clock = clock
+        self._eta = eta
+        self._output = output
+        self._log_interval = log_interval
+        self._log_percent = log_percent
+        self._telemetry = telemetry
+        self._telemetry_interval = telemetry_interval
+        self._telemetry_labels = telemetry_labels
+        self._overhead = overhead
+        self._units = units
+        self._speed_unit = speed_unit
+        self._stream = stream
 
-        if not self._check_types() \
+        if not self._check_start_stop_types(self._start, self._stop,
+                                            self._telemetry_labels) \
+                or not self._check_types() \
                 or not self._is_length_string_parameter_is_one() \
                 or not self._is_length_string_parameter_is_two_or_null()\
                 or not self._is_number_in_row() \
                 or not self._correct_value_in_list() \
                 or not self._is_positive_numbers() \
-                or not self._correct_start_stop() \
-                or not self._correct_terminal_size():
+                or not self._check_start_stop_values(self._start, self._stop):
             raise SystemExit(1)
 
+    @classmethod
+    def check_start_stop(cls, start: int, stop: int,
+                         telemetry_labels: dict = None) -> None:
+        """Check only start, stop and telemetry_labels: the parameters of a
+        progress bar created with a ProgressBarStyle, whose other parameters
+        have been checked once, when the style was created.
+        """
+        if not cls._check_start_stop_types(start, stop, telemetry_labels) \
+                or not cls._check_start_stop_values(start, stop):
+            raise SystemExit(1)
+
+    @classmethod
+    def _check_start_stop_types(cls, start: int, stop: int,
+                                telemetry_labels: dict) -> bool:
+        """Type checking for the parameters of each progress bar"""
+        try:
+            cls._is_instance(start, 'start', int)
+            cls._is_instance(stop, 'stop', int)
+            if telemetry_labels is not None:
+                cls._is_instance(telemetry_labels, 'telemetry_labels', dict)
+        except TypeError as err:
+            cls._print_wrong_type(err)
+            return False
+
+        return True
+
+    @classmethod
+    def _check_start_stop_values(cls, start: int, stop: int) -> bool:
+        """Check that start and stop are positive and start < stop"""
+        try:
+            if start < 0:
+                raise ValueError(start, 'start')
+            if stop < 0:
+                raise ValueError(stop, 'stop')
+        except ValueError as err:
+            cls._print_not_positive(err)
+            return False
+
+        return cls._correct_start_stop(start, stop)
+
+    @staticmethod
+    def _print_wrong_type(err: TypeError) -> None:
+        print(f'Wrong Input: {err.args[1]} must bee {err.args[2]}, not '
+              f'{type(err.args[0])}')
+
+    @staticmethod
+    def _print_not_positive(err: ValueError) -> None:
+        print(f"Wrong Input: '{err.args[1]}' must bee positive, not "
+              f"{err.args[0]}")
+
     def _check_types(self) -> bool:
         """Type checking for accepted arguments"""
         try:
-            self._is_instance(self._start, 'start', int)
-            self._is_instance(self._stop, 'stop', int)
             self._is_instance(self._progress_bar, 'progress_bar', str)
             self._is_instance(self._v_bar, 'variant_bar', str)
             self._is_instance(self._progress_str, 'progress_str', str)
@@ -111,15 +198,43 @@ class _CheckParams:
             self._is_instance(self._load_str, 'load_str', str)
             self._is_instance(self._color, 'color', str)
             self._is_instance(self._end_msg, 'end_msg', str)
+            self._is_instance(self._mininterval, 'mininterval', (int, float))
+            self._is_instance(self._miniters, 'miniters', int)
+            self._is_instance(self._maxinterval, 'maxinterval', (int, float))
+            self._is_instance(self._redraw, 'redraw', str)
+            self._is_instance(self._refresh_rate, 'refresh_rate', (int, float))
+            self._is_instance(self._speed_window, 'speed_window', (int, float))
+            if not callable(self._clock):
+                raise TypeError(self._clock, 'clock', 'callable')
+            self._is_instance(self._eta, 'eta', (str, EtaEstimator))
+            self._is_instance(self._output, 'output', str)
+            self._is_instance(self._log_interval, 'log_interval', (int, float))
+            self._is_instance(self._log_percent, 'log_percent', (int, float))
+            sinks = self._telemetry
+            if isinstance(sinks, (list, tuple)):
+                for sink in sinks:
+                    self._is_instance(sink, 'telemetry', TelemetrySink)
+            elif sinks is not None:
+                self._is_instance(sinks, 'telemetry', TelemetrySink)
+            self._is_instance(self._telemetry_interval, 'telemetry_interval',
+                              (int, float))
+            self._is_instance(self._overhead, 'overhead', str)
+            self._is_instance(self._units, 'units', str)
+            self._is_instance(self._speed_unit, 'speed_unit', str)
+            if self._stream is not None and \
+                    not isinstance(self._stream, int) and \
+                    not hasattr(self._stream, 'write'):
+                raise TypeError(self._stream, 'stream',
+                                'a text stream or a file descriptor')
         except TypeError as err:
-            print(f'Wrong Input: {err.args[1]} must bee {err.args[2]}, not '
-                  f'{type(err.args[0])}')
+            self._print_wrong_type(err)
             return False
 
         return True
 
     @staticmethod
-    def _is_instance(val: Union[int, str], name: str, type_is: type) -> None:
+    def _is_instance(val: Union[int, float, str], name: str,
+                     type_is: Union[type, tuple]) -> None:
         """
         For the accepted argument val of this function, we use typing.Union
         when something can be one of several types (for type checking).
@@ -195,6 +310,17 @@ class _CheckParams:
             self._not_in_list(self._color.strip(), 'color',
                               ['black', 'red', 'green', 'yellow', 'blue',
                                'magenta', 'cyan', 'gray', 'white'])
+            self._not_in_list(self._redraw.strip(), 'redraw',
+                              ['line', 'changes'])
+            if isinstance(self._eta, str):
+                self._not_in_list(self._eta.strip(), 'eta', list(ETA_MODELS))
+            self._not_in_list(self._output.strip(), 'output',
+                              ['auto', 'tty', 'log'])
+            self._not_in_list(self._overhead.strip(), 'overhead',
+                              ['show', 'hide'])
+            self._not_in_list(self._units.strip(), 'units', ['si', 'iec'])
+            self._not_in_list(self._speed_unit.strip(), 'speed_unit',
+                              ['bit/s', 'B/s'])
         except ValueError as err:
             print(f"Wrong Input: {err.args[0]}, param {err.args[1]} must bee"
                   f" {err.args[2]}")
@@ -210,81 +336,42 @@ class _CheckParams:
     def _is_positive_numbers(self) -> bool:
         """Check if the numbers are positive"""
         try:
-            if self._start < 0:
-                raise ValueError(self._start, 'start')
-            if self._stop < 0:
-                raise ValueError(self._stop, 'stop')
+            if self._mininterval < 0:
+                raise ValueError(self._mininterval, 'mininterval')
+            if self._miniters < 0:
+                raise ValueError(self._miniters, 'miniters')
+            if self._maxinterval < 0:
+                raise ValueError(self._maxinterval, 'maxinterval')
+            if self._refresh_rate < 0:
+                raise ValueError(self._refresh_rate, 'refresh_rate')
+            if self._speed_window < 0:
+                raise ValueError(self._speed_window, 'speed_window')
+            if self._log_interval < 0:
+                raise ValueError(self._log_interval, 'log_interval')
+            if self._log_percent < 0:
+                raise ValueError(self._log_percent, 'log_percent')
+            if isinstance(self._stream, int) and self._stream < 0:
+                raise ValueError(self._stream, 'stream')
+            if self._telemetry_interval < 0:
+                raise ValueError(self._telemetry_interval,
+                                 'telemetry_interval')
         except ValueError as err:
-            print(f"Wrong Input: '{err.args[1]}' must bee positive, not "
-                  f"{err.args[0]}")
+            self._print_not_positive(err)
             return False
 
         return True
 
-    def _correct_start_stop(self) -> bool:
+    @staticmethod
+    def _correct_start_stop(start: int, stop: int) -> bool:
         """
         Checking the correctness of the start and stop parameters of the
         progress bar
         """
         try:
-            if self._start > self._stop or self._stop == 0:
+            if start > stop or stop == 0:
                 raise ValueError
         except ValueError:
             print(f"Wrong Input: 'start' must bee < 'stop' and 'stop' > 0")
             return False
 
         return True
-
-    def _correct_terminal_size(self) -> bool:
-        """Check correct the size of a terminal.
-
-        https://docs.python.org/3.6/library/os.html#querying-the-size-of-a-terminal
-        Availability: Unix, Windows.
-
-        Since resizing the window is a very difficult process, since it
-        depends on the type of operating system and the console shell used,
-        if the console window is not large enough for the correct output, the
-        bar progress will display an error message and terminate the script.
-        It will be necessary to reduce the len_bar parameter or other
-        parameters to an acceptable value and restart the script.
-
-        The length of the entire string is the sum of the length of the
-        displayed string elements, brackets and spaces between indicators.
-        """
-        if self._progress_bar == 'show':
-            elem_1 = (self._len_bar - 1)*' ' + self._v_brackets
-        else:
-            elem_1 = self._progress_str
-        elem_1 += ' 100.0% '
-
-        elem_2 = ''
-        if self._timer == 'show':
-            elem_2 = 2*' ' if self._icon_timer != 'hide' else ''
-            elem_2 += self._timer_str if self._v_timer == 'increasing' else \
-                self._reverse_timer_str
-            elem_2 += '[00:00:00.0] '
-
-        elem_3 = ''
-        if self._speed == 'show':
-            if self._icon_speed == 'show':
-                elem_3 = self._v_icon_speed + ' '
-            elem_3 += self._speed_str + '[000.00kbit/s] '
-
-        elem_4 = ''
-        if self._load == 'show':
-            if self._icon_load == 'show':
-                elem_4 = self._v_icon_load + ' '
-            elem_4 += self._load_str + '[000.00MB] '
-
-        columns, _ = shutil.get_terminal_size()
-        try:
-            if len(elem_1 + elem_2 + elem_3 + elem_4) >= columns:
-                raise ValueError
-        except ValueError:
-            print('Error: The size of your console (terminal) window is too '
-                  'small for the progress bar to display correctly. Resize '
-                  'the console window or hide some elements of the progress '
-                  'bar and restart th')
-            return False
-
-        return True
@@ -0,0 +1,41 @@
+import threading
+
+
+class _ShardedCounter:
+    """Counter of iterations and loaded bytes for many threads. Protected
+    class. Designed for internal use.
+
+    Each thread gets its own shard - a list [iterations, loaded_bytes] - which
+    only this thread writes to, so that writers never contend on a lock and
+    no update is lost. The lock is taken only once per thread, to register
+    its shard. The shards are summed only when the totals are needed (at
+    render time), and the totals are exact as soon as the writers are done.
+    https://docs.python.org/3/library/threading.html#thread-local-data
+    """
+
+    def __init__(self) -> None:
+        self._local = threading.local()
+        self._shards = []
+        self._lock = threading.Lock()
+
+    def add(self, n: int, nbytes: int) -> None:
+        """Add n iterations and nbytes loaded bytes to the shard of the
+        calling thread.
+        """
+        try:
+            shard = self._local.shard
+        except AttributeError:
+            shard = self._local.shard = [0, 0]
+            with self._lock:
+                self._shards.append(shard)
+        shard[0] += n
+        shard[1] += nbytes
+
+    def totals(self) -> tuple:
+        """Return the sum of iterations and loaded bytes of all shards"""
+        iterations = nbytes = 0
+        for shard in tuple(self._shards):
+            iterations += shard[0]
+            nbytes += shard[1]
+
+        return iterations, nbytes
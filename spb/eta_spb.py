@@ -0,0 +1,161 @@
+from collections import deque
+
+
+class EtaEstimator:
+    """Base class of the models of the estimated remaining time (eta), shown
+    by the decreasing timer (variant_timer='decreasing').
+
+    A model gets the state of the progress bar on each frame and returns the
+    remaining time. To make your own model, override estimate():
+
+        class MyEta(EtaEstimator):
+            def estimate(self, elapsed, done, total):
+                ...
+
+        pb = SimpleProgressBar(stop=n, variant_timer='decreasing',
+                               eta=MyEta())
+
+    A model keeps the samples of one progress bar, so do not share an
+    instance between progress bars.
+    """
+
+    def estimate(self, elapsed: float, done: float, total: float) -> float:
+        """Return the remaining time in seconds.
+
+        elapsed - the time since the start of the progress bar, in seconds,
+                  without the pauses;
+        done - the number of iterations made (self.iteration);
+        total - the number of iterations at the end (stop).
+        """
+        raise NotImplementedError
+
+    @staticmethod
+    def _average(elapsed: float, done: float, total: float) -> float:
+        """The remaining time at the average rate since the start"""
+        if done <= 0:
+            return 0.0
+
+        return abs(elapsed * total / done - elapsed)
+
+
+class AverageEta(EtaEstimator):
+    """The remaining time at the average rate since the start.
+
+    It is exact when the rate is constant, but after a change of the rate it
+    converges slowly, the slower the longer the progress bar has been
+    running.
+    """
+
+    def estimate(self, elapsed: float, done: float, total: float) -> float:
+        return self._average(elapsed, done, total)
+
+
+class EwmaEta(EtaEstimator):
+    """The remaining time at the exponentially weighted moving average of
+    the rate.
+
+    The weight of a rate measured t seconds ago is halved every half_life
+    seconds, regardless of how often the frames are drawn. The estimate
+    follows the changes of the rate within a few half_life.
+
+    Parameters
+    ----------
+    half_life  : int or float, > 0, optional
+        The time, in seconds, after which a measured rate counts half as
+        much.
+        [default: 10]
+    """
+
+    def __init__(self, half_life: float = 10) -> None:
+        if not isinstance(half_life, (int, float)) or half_life <= 0:
+            raise ValueError(f'half_life must be > 0, not {half_life!r}')
+        self._half_life = half_life
+        self._last = None  # (elapsed, done) of the previous call
+        self._rate = None
+
+    def estimate(self, elapsed: float, done: float, total: float) -> float:
+        if self._last is None:
+            self._last = (elapsed, done)
+            return self._average(elapsed, done, total)
+
+        last_elapsed, last_done = self._last
+        delta_t = elapsed - last_elapsed
+        if delta_t > 0:
+            rate = (done - last_done) / delta_t
+            if self._rate is None:
+                self._rate = rate
+            else:
+                weight = 1 - 0.5 ** (delta_t / self._half_life)
+                self._rate += weight * (rate - self._rate)
+            self._last = (elapsed, done)
+
+        if not self._rate or self._rate <= 0:
+            return self._average(elapsed, done, total)
+
+        return max(total - done, 0) / self._rate
+
+
+class LeastSquaresEta(EtaEstimator):
+    """The remaining time at the rate of the least-squares line through the
+    samples (elapsed, done) of the last window seconds.
+
+    Unlike the rate between two moments, the slope of the line is little
+    affected by single bursts and stalls inside the window.
+
+    Parameters
+    ----------
+    window  : int or float, > 0, optional
+        The time, in seconds, covered by the samples.
+        [default: 30]
+
+    samples  : int, >= 2, optional
+        The maximum number of samples, kept at least window / samples seconds
+        apart.
+        [default: 32]
+    """
+
+    def __init__(self, window: float = 30, samples: int = 32) -> None:
+        if not isinstance(window, (int, float)) or window <= 0:
+            raise ValueError(f'window must be > 0, not {window!r}')
+        if not isinstance(samples, int) or samples < 2:
+            raise ValueError(f'samples must be int >= 2, not {samples!r}')
+        self._spacing = window / samples
+        self._samples = deque(maxlen=samples)
+
+    def estimate(self, elapsed: float, done: float, total: float) -> float:
+        samples = self._samples
+        if not samples or elapsed - samples[-1][0] >= self._spacing:
+            samples.append((elapsed, done))
+
+        slope = self._slope()
+        if slope is None or slope <= 0:
+            return self._average(elapsed, done, total)
+
+        return max(total - done, 0) / slope
+
+    def _slope(self):
+        """Return the slope of the least-squares line, or None if there are
+        not enough samples.
+
+        The times are taken relative to their mean, so that the sums stay
+        small however long the progress bar has been running.
+        """
+        samples = self._samples
+        n = len(samples)
+        if n < 2:
+            return None
+        mean_t = sum(t for t, _ in samples) / n
+        mean_d = sum(d for _, d in samples) / n
+        s_tt = s_td = 0.0
+        for t, d in samples:
+            t -= mean_t
+            s_tt += t * t
+            s_td += t * (d - mean_d)
+        if s_tt == 0:
+            return None
+
+        return s_td / s_tt
+
+
+# The models that can be chosen by name with the eta parameter
+ETA_MODELS = {'average': AverageEta, 'ewma': EwmaEta, 'lsq': LeastSquaresEta}
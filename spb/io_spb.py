@@ -0,0 +1,297 @@
+import errno
+import os
+import shutil
+from .spb import SimpleProgressBar
+
+
+COPY_CHUNK_SIZE = 1 << 20  # bytes
+
+# Errors of os.copy_file_range() and os.sendfile(), after which the copy
+# continues by the next method (from the current offsets of the files).
+_FALLBACK_ERRNOS = {errno.ENOSYS, errno.EXDEV, errno.EINVAL, errno.EOPNOTSUPP,
+                    errno.ENOTSUP, errno.ENOTSOCK, errno.EBADF, errno.EPERM,
+                    errno.ETXTBSY}
+
+
+def _count_bytes(pb: SimpleProgressBar, nbytes: int, iterations: bool) -> None:
+    """Count nbytes in the progress bar: as loaded bytes, and as iterations
+    if the progress bar counts bytes up to the known size.
+    """
+    if iterations:
+        pb.update(nbytes, nbytes)
+    else:
+        pb.add_bytes(nbytes)
+
+
+class ProgressFile:
+    """Wrapper around a binary file object, which counts the bytes read and
+    written through it in the progress bar, instead of pb.loaded_bytes +=
+    len(chunk) by hand.
+
+    read(), read1(), readinto(), readinto1(), readline(), the iteration over
+    lines and write() are counted; all other attributes and methods (seek(),
+    tell(), flush(), fileno(), etc.) are those of the wrapped file.
+
+    readinto() and readinto1() pass the caller's buffer (for example, a
+    memoryview) straight to the wrapped file, so that wrapping a file adds no
+    copies of the data.
+
+        with open('big.iso', 'rb') as src:
+            pb = SimpleProgressBar(stop=os.fstat(src.fileno()).st_size,
+                                   speed='show', load='show')
+            buffer = memoryview(bytearray(1 << 20))
+            reader = ProgressFile(src, pb, iterations=True)
+            while reader.readinto(buffer):
+                ...
+
+        with ProgressFile.open('big.iso', 'rb') as reader:  # the same
+            ...
+
+    Parameters
+    ----------
+    file  : binary file object
+        The file to read from or to write to.
+
+    progress_bar  : SimpleProgressBar
+        The progress bar that counts the bytes.
+
+    iterations  : bool, optional
+        If True, each byte is also counted as one iteration. Use it when the
+        total size is known and set as stop of the progress bar, to show the
+        progress bar and the percent.
+        [default: False]
+
+    Notes:
+    ------
+    Bytes that are transferred by the operating system via fileno() (for
+    example, by os.sendfile()) are not counted.
+    """
+
+    def __init__(self, file, progress_bar: SimpleProgressBar,
+                 iterations: bool = False) -> None:
+        self._file = file
+        self._pb = progress_bar
+        self._iterations = iterations
+        self._own_progress_bar = False
+
+    @classmethod
+    def open(cls, path, mode: str = 'rb', **kwargs) -> 'ProgressFile':
+        """Open a file in binary mode with its own progress bar.
+
+        When reading, stop of the progress bar is the size of the file and
+        each byte is counted as one iteration. When writing, the size is
+        unknown: set stop yourself, or hide the progress bar and the percent.
+        kwargs are the parameters of SimpleProgressBar.
+        """
+        if 'b' not in mode:
+            mode += 'b'
+        file = open(path, mode)
+        iterations = False
+        if 'r' in mode and 'stop' not in kwargs:
+            size = os.fstat(file.fileno()).st_size
+            if size > 0:
+                kwargs['stop'] = size
+                iterations = True
+        kwargs.setdefault('speed', 'show')
+        kwargs.setdefault('load', 'show')
+        try:
+            progress_bar = SimpleProgressBar(**kwargs)
+        except BaseException:
+            # For example, SystemExit on a wrong parameter.
+            file.close()
+            raise
+        progress_file = cls(file, progress_bar, iterations)
+        progress_file._own_progress_bar = True
+
+        return progress_file
+
+    def __getattr__(self, name: str):
+        return getattr(self._file, name)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def __iter__(self):
+        return self
+
+    def __next__(self) -> bytes:
+        line = self._file.readline()
+        if not line:
+            raise StopIteration
+        self._count(len(line))
+
+        return line
+
+    def _count(self, nbytes: int) -> None:
+        _count_bytes(self._pb, nbytes, self._iterations)
+
+    def read(self, size: int = -1) -> bytes:
+        data = self._file.read(size)
+        if data:
+            self._count(len(data))
+
+        return data
+
+    def read1(self, size: int = -1) -> bytes:
+        data = self._file.read1(size)
+        if data:
+            self._count(len(data))
+
+        return data
+
+    def readinto(self, buffer) -> int:
+        nbytes = self._file.readinto(buffer)
+        if nbytes:
+            self._count(nbytes)
+
+        return nbytes
+
+    def readinto1(self, buffer) -> int:
+        nbytes = self._file.readinto1(buffer)
+        if nbytes:
+            self._count(nbytes)
+
+        return nbytes
+
+    def readline(self, size: int = -1) -> bytes:
+        line = self._file.readline(size)
+        if line:
+            self._count(len(line))
+
+        return line
+
+    def write(self, data) -> int:
+        nbytes = self._file.write(data)
+        # A raw file in non-blocking mode returns None if nothing was written
+        if nbytes:
+            self._count(nbytes)
+
+        return nbytes
+
+    def close(self) -> None:
+        """Close the wrapped file, and the progress bar if it was created by
+        open().
+        """
+        self._file.close()
+        if self._own_progress_bar:
+            self._pb.close()
+
+
+def copyfile(src, dst, progress_bar: SimpleProgressBar = None,
+             iterations: bool = None, chunk_size: int = COPY_CHUNK_SIZE,
+             **kwargs) -> int:
+    """Copy the contents of the file src to the file dst (like
+    shutil.copyfile()), showing the loaded bytes and the speed of the copy.
+
+    The data is copied by the kernel, without passing through the memory of
+    the process, with os.copy_file_range() (Linux, Python 3.8+) or
+    os.sendfile(), where the operating system and the file systems allow it.
+    Otherwise a single preallocated buffer is filled by readinto() and
+    written out, without a new bytes object per chunk.
+
+    The progress bar is updated once per chunk of chunk_size bytes and is
+    redrawn no more often than its mininterval.
+
+        copyfile('build/image.iso', '/mnt/artifacts/image.iso')
+
+        pb = SimpleProgressBar(stop=total_size, speed='show', load='show')
+        for src, dst in files:
+            copyfile(src, dst, progress_bar=pb, iterations=True)
+        pb.close()
+
+    Parameters
+    ----------
+    src, dst  : path-like
+        The files to copy from and to.
+
+    progress_bar  : SimpleProgressBar, optional
+        The progress bar that counts the copied bytes, for example one
+        progress bar for many files. It is not closed by copyfile().
+        [default: None - a new progress bar with stop equal to the size of
+        src, closed at the end of the copy; kwargs are its parameters]
+
+    iterations  : bool, optional
+        If True, each byte is also counted as one iteration.
+        [default: None - True for the new progress bar of a non-empty file,
+        False for progress_bar]
+
+    chunk_size  : int, > 0, optional
+        The number of bytes copied by one system call.
+        [default: 1 MiB]
+
+    Returns the number of copied bytes.
+    """
+    if not isinstance(chunk_size, int) or chunk_size <= 0:
+        raise ValueError(f'chunk_size must be int > 0, not {chunk_size!r}')
+    if os.path.exists(dst) and os.path.samefile(src, dst):
+        raise shutil.SameFileError(f'{src!r} and {dst!r} are the same file')
+
+    with open(src, 'rb', buffering=0) as fsrc, \
+            open(dst, 'wb', buffering=0) as fdst:
+        size = os.fstat(fsrc.fileno()).st_size
+        pb = progress_bar
+        if pb is None:
+            if size > 0 and 'stop' not in kwargs:
+                kwargs['stop'] = size
+                if iterations is None:
+                    iterations = True
+            kwargs.setdefault('speed', 'show')
+            kwargs.setdefault('load', 'show')
+            pb = SimpleProgressBar(**kwargs)
+        iterations = bool(iterations)
+
+        try:
+            copied = _copy(fsrc, fdst, size, pb, iterations, chunk_size)
+        finally:
+            if progress_bar is None:
+                pb.close()
+
+    return copied
+
+
+def _copy(fsrc, fdst, size: int, pb: SimpleProgressBar, iterations: bool,
+          chunk_size: int) -> int:
+    """Copy fsrc to fdst by the fastest available method.
+
+    A kernel method that fails or returns 0 before the known size is reached
+    (some file systems, such as procfs, report the size 0) hands the rest of
+    the copy over to the next method; the readinto() loop always copies up
+    to the real end of the file.
+    """
+    infd, outfd = fsrc.fileno(), fdst.fileno()
+    copied = 0
+    kernel_copies = []
+    if hasattr(os, 'copy_file_range'):
+        kernel_copies.append(os.copy_file_range)
+    if hasattr(os, 'sendfile'):
+        kernel_copies.append(lambda i, o, n: os.sendfile(o, i, None, n))
+
+    for kernel_copy in kernel_copies:
+        try:
+            while True:
+                nbytes = kernel_copy(infd, outfd, chunk_size)
+                if not nbytes:
+                    break
+                copied += nbytes
+                _count_bytes(pb, nbytes, iterations)
+        except OSError as err:
+            if err.errno not in _FALLBACK_ERRNOS:
+                raise
+        if size and copied >= size:
+            return copied
+
+    view = memoryview(bytearray(chunk_size))
+    while True:
+        nbytes = fsrc.readinto(view)
+        if not nbytes:
+            break
+        written = 0
+        while written < nbytes:
+            written += fdst.write(view[written:nbytes])
+        copied += nbytes
+        _count_bytes(pb, nbytes, iterations)
+
+    return copied
@@ -0,0 +1,239 @@
+import threading
+from .output_spb import _Output
+from .spb import SimpleProgressBar, _NullProgressBar, \
+    _disabled_by_environment
+from .terminal_spb import _terminal
+
+
+class ProgressBarManager:
+    """Draws many progress bars at once, one line per progress bar, for
+    example when files are downloaded concurrently.
+
+    The manager keeps a block of lines at the bottom of the console, one line
+    per active progress bar. On each refresh, only the lines that have changed
+    are rewritten, and all of them in a single write to the console. When a
+    progress bar is finished, its last line is printed above the block, and
+    the block shrinks to make room for new progress bars.
+
+        with ProgressBarManager() as manager:
+            def download(url):
+                ...
+                pb = manager.add(stop=kB, speed='show', load='show')
+                for chunk in req.iter_content(chunk_size=1024):
+                    f.write(chunk)
+                    pb.loaded_bytes += len(chunk)
+                    next(pb)
+                pb.close()
+
+            with ThreadPool(8) as pool:
+                pool.map(download, urls)
+
+    The progress bars are drawn by the thread of the manager: next() and
+    increment() of a managed progress bar only increase its counters.
+
+    Parameters
+    ----------
+    refresh_rate  : int or float, > 0, optional
+        How many times per second the lines are redrawn.
+        [default: 10]
+
+    stream  : text stream or int, optional
+        Where the lines are written: a text stream or a file descriptor (see
+        the stream parameter of SimpleProgressBar).
+        [default: None - sys.stdout]
+
+    output  : str, optional
+        Choose the kind of output, from the list: ['auto', 'tty', 'log']
+        'tty' - the block of lines redrawn in place, with the ANSI cursor
+                movement.
+        'log' - no ANSI escape codes: only the last line of each finished
+                progress bar is written, as a line of a log (the cursor
+                cannot be moved back in a pipe or a file).
+        'auto' - 'tty' if the stream is a terminal, otherwise 'log'.
+        The progress bars of the manager get the same output, unless it is
+        given to add().
+        [default: 'auto']
+
+    disable  : bool, optional
+        Disable the manager and all its progress bars (see the disable
+        parameter of SimpleProgressBar): nothing is written and no thread is
+        started. The environment variable SPB_DISABLE=1 does the same.
+        [default: False]
+
+    Public methods, that can be used in your code:
+    ----------------------------------------------
+    add()
+    refresh()
+    close()
+
+    Notes:
+    ------
+    If there are more active progress bars than lines in the console, the
+    last line shows the number of progress bars that are not displayed.
+
+    Cursor movement:
+    https://en.wikipedia.org/wiki/ANSI_escape_code#CSI_codes
+    """
+
+    def __init__(self, refresh_rate: float = 10, stream=None,
+                 output: str = 'auto', disable: bool = False) -> None:
+        if not isinstance(refresh_rate, (int, float)) or refresh_rate <= 0:
+            raise ValueError(f'refresh_rate must be > 0, not {refresh_rate}')
+        if output not in ('auto', 'tty', 'log'):
+            raise ValueError(f"output must be 'auto', 'tty' or 'log', not "
+                             f"{output!r}")
+        self._stream = stream
+        self._output = _Output(stream)
+        self._log = output == 'log' or output == 'auto' and \
+            not self._output.isatty()
+        self._bars = []
+        self._lines = []  # lines of the block, as drawn on the console
+        self._resized = False
+        self._lock = threading.Lock()
+        self._disabled = disable or _disabled_by_environment()
+        self._refresh_thread = None
+        if self._disabled:
+            return
+        self._max_lines = max(_terminal.lines(self._output.fileno()) - 1, 1)
+        if not self._log:
+            self._output.write('\x1b[?25l')
+            self._output.flush()
+
+        self._stop_refresh = threading.Event()
+        self._refresh_thread = threading.Thread(
+            target=self._refresh_in_background, args=(1 / refresh_rate,),
+            name='spb-manager-refresh', daemon=True
+        )
+        self._refresh_thread.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def add(self, *args, **kwargs) -> SimpleProgressBar:
+        """Create a progress bar drawn by this manager on its own line.
+
+        Accepts all the parameters of SimpleProgressBar.
+        """
+        kwargs.setdefault('stream', self._stream)
+        kwargs.setdefault('output', 'log' if self._log else 'tty')
+        if self._disabled:
+            kwargs['disable'] = True
+        pb = SimpleProgressBar(*args, manager=self, **kwargs)
+        if isinstance(pb, _NullProgressBar):
+            return pb
+        with self._lock:
+            self._bars.append(pb)
+            self._resized = True
+
+        return pb
+
+    def _refresh_in_background(self, interval: float) -> None:
+        while not self._stop_refresh.wait(interval):
+            self.refresh()
+
+    def refresh(self) -> None:
+        """Redraw the changed lines of the block in a single write"""
+        if self._disabled:
+            return
+        with self._lock:
+            for pb in self._bars:
+                pb.progress_bar()
+
+            finished = [pb for pb in self._bars if pb._finished]
+            if finished:
+                self._bars = [pb for pb in self._bars if not pb._finished]
+            if self._log:
+                frame = self._prepare_log_lines(finished)
+                if frame:
+                    self._output.write(frame)
+                    self._output.flush()
+                return
+            lines = [pb._managed_line for pb in self._bars]
+            if len(lines) > self._max_lines:
+                hidden = len(lines) - self._max_lines + 1
+                lines = lines[:self._max_lines - 1] + \
+                    [f' ... and {hidden} more']
+
+            if finished or self._resized or len(lines) != len(self._lines):
+                frame = self._prepare_block(finished, lines)
+            else:
+                frame = self._prepare_changed_lines(lines)
+            self._resized = False
+            self._lines = lines
+
+            if frame:
+                self._output.write(frame)
+                self._output.flush()
+
+    def _prepare_log_lines(self, finished: list) -> str:
+        """Return the last lines of the finished progress bars (and their
+        end messages) as plain lines of a log, for the 'log' output.
+        """
+        frame = []
+        for pb in finished:
+            frame += [pb._managed_line, '\n']
+            if pb._end_msg != '':
+                frame += [pb._end_msg, '\n']
+
+        return ''.join(frame)
+
+    def _prepare_block(self, finished: list, lines: list) -> str:
+        """Return the string that rewrites the whole block: the last lines of
+        the finished progress bars (which leave the block) and the lines of
+        the active progress bars. What remains of the old block below is
+        cleared.
+
+        The cursor rests at the beginning of the line below the block.
+        """
+        frame = [f'\x1b[{len(self._lines)}F' if self._lines else '\r']
+        for pb in finished:
+            frame += [pb._managed_line, '\x1b[K\n']
+            if pb._end_msg != '':
+                frame += [pb._end_msg, '\x1b[K\n']
+        for line in lines:
+            frame += [line, '\x1b[K\n']
+        frame.append('\x1b[J')
+
+        return ''.join(frame)
+
+    def _prepare_changed_lines(self, lines: list) -> str:
+        """Return the string that rewrites only the changed lines of the
+        block, moving the cursor up and down between them.
+        """
+        frame = []
+        row = len(lines)  # the line below the block
+        for i, (line, old_line) in enumerate(zip(lines, self._lines)):
+            if line == old_line:
+                continue
+            if row > i:
+                frame.append(f'\r\x1b[{row - i}A')
+            elif i > row:
+                frame.append(f'\r\x1b[{i - row}B')
+            else:
+                frame.append('\r')
+            frame += [line, '\x1b[K']
+            row = i
+        if frame:
+            frame.append(f'\r\x1b[{len(lines) - row}B')
+
+        return ''.join(frame)
+
+    def close(self) -> None:
+        """Stop the thread of the manager, draw the last lines of all the
+        progress bars and show the console cursor.
+        """
+        if self._refresh_thread is None:
+            return
+        self._stop_refresh.set()
+        self._refresh_thread.join()
+        self._refresh_thread = None
+        with self._lock:
+            for pb in self._bars:
+                pb.close()
+        self.refresh()
+        if not self._log:
+            self._output.write('\x1b[?25h')
+            self._output.flush()
@@ -0,0 +1,59 @@
+import threading
+import time
+import weakref
+
+
+class _Monitor:
+    """The thread that wakes up the progress bars which have not been redrawn
+    for maxinterval seconds. Protected class. Designed for internal use.
+
+    With the adaptive miniters, next() checks the clock only once every
+    miniters iterations. After a fast phase of a loop miniters is large, and
+    if the loop then slows down, the next check (and the next frame) could
+    be hours away. Once per interval seconds the monitor asks each watched
+    progress bar to check the clock on its next iteration (see
+    SimpleProgressBar._check_maxinterval()), then the redraw adapts miniters
+    to the new rate.
+
+    The thread is started by the first watched progress bar and ends when
+    no watched progress bar is left. It never draws: the frames are still
+    drawn by the thread of the loop.
+    """
+
+    def __init__(self, interval: float = 1.0) -> None:
+        self._interval = interval
+        self._bars = weakref.WeakSet()
+        self._lock = threading.Lock()
+        self._thread = None
+
+    def watch(self, pb) -> None:
+        """Start watching a progress bar, until unwatch() or its deletion"""
+        with self._lock:
+            self._bars.add(pb)
+            # A thread does not survive a fork: start a new one in the child.
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name='spb-monitor', daemon=True)
+                self._thread.start()
+
+    def unwatch(self, pb) -> None:
+        with self._lock:
+            self._bars.discard(pb)
+
+    def _run(self) -> None:
+        while True:
+            time.sleep(self._interval)
+            with self._lock:
+                if not self._bars:
+                    self._thread = None
+                    return
+            self._check()
+
+    def _check(self) -> None:
+        with self._lock:
+            bars = list(self._bars)
+        for pb in bars:
+            pb._check_maxinterval()
+
+
+_monitor = _Monitor()
@@ -0,0 +1,78 @@
+import os
+import sys
+
+
+class _Output:
+    """The stream that a progress bar writes to. Protected class. Designed for
+    internal use.
+
+    A text stream (for example, sys.stderr) is written to through its own
+    text layer, as sys.stdout. A file descriptor is the fast path: the text
+    written for a frame is collected until flush(), then encoded once and
+    written with a single os.write(), without the text and buffer layers of
+    a file object and without a separate flush.
+
+    Parameters
+    ----------
+    stream  : text stream or int, optional
+        A text stream, or a file descriptor open for writing (for example,
+        2 for stderr).
+        [default: None - sys.stdout, looked up on each write, so that it can
+        be redirected after the progress bar is created]
+
+    encoding  : str, optional
+        The encoding of the text written to a file descriptor, the symbols
+        that cannot be encoded are replaced with '?'.
+        [default: 'utf-8']
+    """
+
+    def __init__(self, stream=None, encoding: str = 'utf-8') -> None:
+        self._stream = stream
+        self._fd = stream if isinstance(stream, int) else None
+        self._encoding = encoding
+        self._pending = []
+
+    @property
+    def stream(self):
+        """The text stream or the file descriptor"""
+        return sys.stdout if self._stream is None else self._stream
+
+    def write(self, text: str) -> None:
+        if self._fd is None:
+            self.stream.write(text)
+        else:
+            self._pending.append(text)
+
+    def flush(self) -> None:
+        if self._fd is None:
+            self.stream.flush()
+            return
+        if not self._pending:
+            return
+        data = ''.join(self._pending).encode(self._encoding, 'replace')
+        self._pending.clear()
+        view = memoryview(data)
+        while view:
+            view = view[os.write(self._fd, view):]
+
+    def fileno(self):
+        """Return the file descriptor of the stream, or None if it has none
+        (for example, io.StringIO)
+        """
+        if self._fd is not None:
+            return self._fd
+        fileno = getattr(self.stream, 'fileno', None)
+        try:
+            return fileno() if fileno else None
+        except (OSError, ValueError):  # io.UnsupportedOperation, closed
+            return None
+
+    def isatty(self) -> bool:
+        """Check if the stream is a terminal (not a pipe or a file)"""
+        if self._fd is not None:
+            return os.isatty(self._fd)
+        isatty = getattr(self.stream, 'isatty', None)
+        try:
+            return bool(isatty and isatty())
+        except ValueError:  # a closed stream
+            return False
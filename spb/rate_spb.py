@@ -0,0 +1,64 @@
+class _RateEstimator:
+    """Transfer rate over a sliding window of time.
+
+    The samples (time, total of bytes) are kept in a ring buffer of a fixed
+    size, at least window / SLOTS seconds apart, so that the buffer always
+    covers the whole window. The rate is the difference between the current
+    total and the total of the newest sample that is at least window seconds
+    old, divided by the time between them. So, after a stall or a burst, the
+    rate shows the current throughput within window seconds, and each call
+    costs the same time, however long the transfer is.
+
+    Until the transfer lasts for a whole window, the rate is the average
+    since the first sample.
+
+    Parameters
+    ----------
+    window  : int or float, > 0
+        The length of the window, in seconds.
+
+    now  : float
+        The time of the first sample (time.monotonic()).
+
+    total  : int or float, optional
+        The total of the first sample.
+        [default: 0]
+    """
+    SLOTS = 32
+
+    def __init__(self, window: float, now: float, total: float = 0) -> None:
+        self._window = window
+        self._spacing = window / self.SLOTS
+        self._times = [now] * self.SLOTS
+        self._totals = [total] * self.SLOTS
+        self._head = 0  # the newest sample
+        self._tail = 0  # the sample the rate is measured from
+        self._size = 1  # the samples from tail to head
+
+    def rate(self, now: float, total: float) -> float:
+        """Add the sample (now, total) and return the rate per second over
+        the last window seconds.
+        """
+        times = self._times
+        slots = self.SLOTS
+        if now - times[self._head] >= self._spacing:
+            self._head = (self._head + 1) % slots
+            times[self._head] = now
+            self._totals[self._head] = total
+            if self._size == slots:
+                self._tail = (self._tail + 1) % slots
+            else:
+                self._size += 1
+
+        # Move the tail to the newest sample that is still at least window
+        # seconds old.
+        start = now - self._window
+        while self._size > 1 and times[(self._tail + 1) % slots] <= start:
+            self._tail = (self._tail + 1) % slots
+            self._size -= 1
+
+        delta_t = now - times[self._tail]
+        if delta_t <= 0:
+            return 0.0
+
+        return (total - self._totals[self._tail]) / delta_t
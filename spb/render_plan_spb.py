@@ -0,0 +1,200 @@
+import re
+import unicodedata
+from functools import lru_cache
+from .units_spb import _widest_value
+
+
+_ANSI_ESCAPE = re.compile(r'\x1b\[[0-9;?]*[A-Za-z]')
+
+# The smallest length of the bar in a narrow console (the smallest value of
+# len_bar).
+MIN_LEN_BAR = 10
+
+# The widest values of the dynamic fields, to measure the width of a layout
+_WIDEST_TIME = '00:00:00.0'
+_WIDEST_OVERHEAD = '100.0'
+
+
+@lru_cache(maxsize=None)
+def _percent_table(color_on: str, color_off: str) -> tuple:
+    """Return the pre-coloured strings of all the 1001 values of the percent
+    indicator (0.0% - 100.0%), indexed by the percent multiplied by 10.
+
+    There are only 9 colors, so the tables are shared by all the progress
+    bars of the same color.
+    """
+    return tuple(f'{color_on}{i / 10:0.1f}{color_off}%' for i in range(1001))
+
+
+@lru_cache(maxsize=1024)
+def _display_width(text: str) -> int:
+    """Return the number of console columns taken by the text.
+
+    ANSI escape codes take no columns, wide and full-width Unicode-symbols
+    (East Asian Width 'W' and 'F', for example most emoji) take two columns,
+    combining symbols take none.
+    https://www.unicode.org/reports/tr11/
+    """
+    width = 0
+    for char in _ANSI_ESCAPE.sub('', text):
+        if unicodedata.combining(char):
+            continue
+        width += 2 if unicodedata.east_asian_width(char) in 'WF' else 1
+
+    return width
+
+
+class _RenderPlan:
+    """Static parts of the progress bar line. Protected class. Designed for
+    internal use.
+
+    The plan is compiled once from the options of the SimpleProgressBar()
+    object: brackets, colour escapes, labels and icons with their padding do
+    not change from frame to frame, so that each frame only has to fill in
+    the dynamic fields: arrow, percent, time, speed, loaded bytes and
+    overhead.
+
+    A plan is one layout of the line: the bar of len_bar symbols, with or
+    without the icons and the labels of the indicators (see
+    _fit_layout()). width is the number of console columns taken by the
+    widest line of the layout.
+
+    Colors in console:
+    https://en.wikipedia.org/wiki/ANSI_escape_code#SGR_parameters
+    """
+
+    def __init__(self, pb, len_bar: int = None, icons: bool = True,
+                 labels: bool = True) -> None:
+        self.len_bar = len_bar = len_bar or pb._len_bar
+        # The log output is plain text, without ANSI escape codes.
+        plain = pb._log
+        self.color_on = '' if plain else f'\x1b[3{pb._color}m'
+        self.color_off = '' if plain else '\x1b[0m'
+
+        # Progress bar and percent indicator
+        self.show_bar = pb._progress_bar == 'show'
+        self.show_percent = pb._percent == 'show'
+        self.progress_label = ''
+        if pb._progress_bar == 'hide':
+            # Without the bar and its name, the percent indicator is hidden
+            self.show_percent = self.show_percent and pb._progress_str != ''
+            if pb._progress_str != '' and labels:
+                self.progress_label = ' ' + pb._progress_str
+        # On a increasing and decreasing progress bar, brackets are not
+        # needed, only the indent from the left edge of the console.
+        brackets = pb._v_brackets if pb._v_bar == 'static' else [' ', '']
+        self.bar_open = brackets[0] + self.color_on
+        self.bar_close = brackets[1] + ' '
+
+        # Segments of the bar, indexed by the number of arrows (or spaces):
+        # len_bar is no more than 100, so they are built once instead of
+        # multiplying strings on every frame.
+        self.arrows = tuple(
+            self.bar_open + pb._v_arrow * i + self.color_off
+            for i in range(len_bar)
+        )
+        if pb._v_bar == 'static':
+            self.spaces = tuple(pb._v_sp * i + self.bar_close
+                                for i in range(len_bar))
+        else:
+            self.spaces = (self.bar_close,) * len_bar
+        self.percents = _percent_table(self.color_on, self.color_off)
+
+        # Timer indicator
+        self.show_timer = pb._timer == 'show'
+        self.animated_timer = pb._icon_timer == 'animated' and icons and \
+            not plain
+        self.decreasing_timer = pb._v_timer == 'decreasing'
+        timer_icon = {'static': ' ⏱', 'hide': ''}.get(pb._icon_timer, '') \
+            if icons else ''
+        timer_str = pb._reverse_timer_str if self.decreasing_timer \
+            else pb._timer_str
+        timer_str = timer_str if labels else ''
+        self.timer_open = f'{timer_icon} {timer_str}[{self.color_on}'
+        self.timer_close = self.color_off + ']'
+
+        # Speed and load indicators
+        self.show_speed = pb._speed == 'show'
+        self.speed_open = (pb._select_icon_to_speed() if icons else ' ') + \
+            (pb._speed_str if labels else '') + '['
+        self.show_load = pb._load == 'show'
+        self.load_open = (pb._select_icon_to_load() if icons else ' ') + \
+            (pb._load_str if labels else '') + '['
+        self.field_close = ']'
+        self.show_overhead = pb._overhead == 'show'
+        self.overhead_open = ' spb ' + self.color_on
+        self.overhead_close = self.color_off + '%'
+
+        self.line_open = '' if plain else '\r'
+        self.line_close = '\n' if plain else '  \b'
+
+        # The widest line: the full bar, 100.0%, the widest icon of the
+        # animated timer and the widest values of the fields, with the two
+        # spaces of line_close.
+        widest = [max(self.arrows[-1] + self.spaces[0],
+                      self.arrows[0] + self.spaces[-1], key=_display_width)
+                  if self.show_bar else '', self.progress_label]
+        if self.show_percent:
+            widest.append(self.percents[1000])
+        if self.show_timer:
+            if self.animated_timer:
+                widest.append(' ' + max(pb._v_icon_timer or ' ',
+                                        key=_display_width))
+            widest.append(self.timer_open + _WIDEST_TIME + self.timer_close)
+        if self.show_speed:
+            widest.append(self.speed_open +
+                          _widest_value(pb._units, pb._speed_unit) +
+                          self.field_close)
+        if self.show_load:
+            widest.append(self.load_open + _widest_value(pb._units, 'B') +
+                          self.field_close)
+        if self.show_overhead:
+            widest.append(self.overhead_open + _WIDEST_OVERHEAD +
+                          self.overhead_close)
+        self.width = sum(map(_display_width, widest)) + \
+            (0 if plain else 2)
+        # The number of columns added by each symbol of the bar
+        self.bar_unit = max(_display_width(pb._v_arrow),
+                            _display_width(pb._v_sp)
+                            if pb._v_bar == 'static' else 0, 1)
+
+
+def _fit_layout(pb, columns: int, plans: dict) -> _RenderPlan:
+    """Return the render plan of the widest layout that fits into the
+    console of the given number of columns (None - of any width).
+
+    The full layout is used if it fits. Otherwise the bar is shrunk (down to
+    MIN_LEN_BAR symbols), then the icons and then the labels of the
+    indicators are dropped, and the bar is shrunk again. If even the smallest
+    layout does not fit, it is used anyway and the line wraps.
+
+    The last column of the console is left free, since writing to it may
+    move the cursor to the next line.
+
+    The plans are compiled once and kept in the plans dict, by the key
+    (len_bar, icons, labels), shared by the progress bars of a style.
+    """
+    def compile_plan(*layout) -> _RenderPlan:
+        plan = plans.get(layout)
+        if plan is None:
+            plan = plans[layout] = _RenderPlan(pb, *layout)
+        return plan
+
+    full = compile_plan(pb._len_bar, True, True)
+    if columns is None or full.width < columns:
+        return full
+
+    len_bar = MIN_LEN_BAR
+    for icons, labels in ((True, True), (False, True), (False, False)):
+        # The width of the layout with a bar of one symbol
+        shortest = compile_plan(1, icons, labels)
+        if not shortest.show_bar:
+            if shortest.width < columns:
+                return compile_plan(pb._len_bar, icons, labels)
+            continue
+        len_bar = min((columns - 1 - shortest.width) // shortest.bar_unit + 1,
+                      pb._len_bar)
+        if len_bar >= MIN_LEN_BAR:
+            return compile_plan(len_bar, icons, labels)
+
+    return compile_plan(max(len_bar, 1), False, False)
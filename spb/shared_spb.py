@@ -0,0 +1,224 @@
+import mmap
+import multiprocessing
+import os
+import sys
+import threading
+
+try:
+    from multiprocessing import shared_memory  # Python 3.8+
+except ImportError:
+    shared_memory = None
+
+
+class SharedCounter:
+    """Counter of iterations and loaded bytes in shared memory, for child
+    processes (for example, the workers of multiprocessing.Pool) that report
+    their progress to the progress bar of the parent process.
+
+    The memory block is divided into slots, one slot per writer (a thread of
+    a process). A writer claims its slot once, and then increment() is only
+    an addition in its own slot, without a lock and without sending anything
+    to the parent process (no Queue round trip per item). Each slot takes a
+    whole cache line (64 bytes), so that writers on different CPU cores do
+    not slow each other down. The parent process sums the slots when the
+    progress bar draws a frame:
+
+        counter = SharedCounter(slots=64)
+        pb = SimpleProgressBar(stop=len(items), refresh_rate=10)
+        pb.attach(counter)
+        with Pool(initializer=init_worker, initargs=(counter,)) as pool:
+            pool.map(work, items)  # work() calls counter.increment()
+        pb.close()
+        counter.close()
+
+    Like multiprocessing.Lock, the counter must be passed to child processes
+    through inheritance: as an argument of Process() or as initargs of
+    Pool(), not as an argument of a task.
+
+    Parameters
+    ----------
+    slots  : int, > 0, optional
+        The maximum number of writers (processes or threads) at once. A
+        writer keeps its slot while its process is alive. On Unix, the slot
+        of a process that has exited (for example, a worker replaced by a
+        Pool with maxtasksperchild) is reused by a new writer, and its
+        counts are kept in the totals. On other systems the slots are never
+        reused: there, slots is the number of writers over the life of the
+        counter.
+        [default: 64]
+
+    context  : str, optional
+        The multiprocessing start method of the processes that will use the
+        counter: ['fork', 'spawn', 'forkserver'], as in
+        multiprocessing.get_context().
+        [default: None - the default start method]
+
+    Notes:
+    ------
+    multiprocessing.shared_memory is used with Python 3.8 or higher. On
+    older versions an anonymous mmap is used instead, which is shared only
+    with child processes created by fork.
+    https://docs.python.org/3/library/multiprocessing.shared_memory.html
+    """
+    SLOT_SIZE = 64  # bytes, one cache line
+    _FIELDS = SLOT_SIZE // 8  # unsigned 64-bit integers per slot
+    # The fields of a slot: iterations, loaded bytes and the pid of the
+    # writer. The last slot of the block keeps the counts of the writers
+    # that have exited.
+    _PID = 2
+
+    def __init__(self, slots: int = 64, context: str = None) -> None:
+        if not isinstance(slots, int) or slots <= 0:
+            raise ValueError(f'slots must be int > 0, not {slots!r}')
+        self._slots = slots
+        self._owner_pid = os.getpid()
+        self._claimed = multiprocessing.get_context(context).Value('i', 0)
+        size = (slots + 1) * self.SLOT_SIZE
+        if shared_memory is not None:
+            self._shm = shared_memory.SharedMemory(create=True, size=size)
+            self._view = self._shm.buf.cast('Q')
+        else:
+            self._shm = mmap.mmap(-1, size)
+            self._view = memoryview(self._shm).cast('Q')
+        self._local = threading.local()
+
+    def __getstate__(self) -> dict:
+        if shared_memory is None:
+            raise TypeError('SharedCounter can be passed only to the child '
+                            'processes created by fork with Python < 3.8')
+        return {'name': self._shm.name, 'slots': self._slots,
+                'claimed': self._claimed}
+
+    def __setstate__(self, state: dict) -> None:
+        self._slots = state['slots']
+        self._owner_pid = None
+        self._claimed = state['claimed']
+        self._shm = _attach_shared_memory(state['name'])
+        self._view = self._shm.buf.cast('Q')
+        self._local = threading.local()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def _claim_slot(self) -> int:
+        """Claim a free slot for the calling thread of the current process.
+
+        This is the only place where the processes synchronize, once per
+        writer. When all the slots have been claimed, the slot of a process
+        that has exited is reused (see _retire_slot()).
+        """
+        pid = os.getpid()
+        with self._claimed.get_lock():
+            slot = self._claimed.value
+            if slot < self._slots:
+                self._claimed.value += 1
+            else:
+                slot = self._find_retired_slot()
+            index = slot * self._FIELDS
+            self._view[index + self._PID] = pid
+        self._local.pid = pid
+        self._local.index = index
+
+        return index
+
+    def _find_retired_slot(self) -> int:
+        """Return the first slot whose writer process has exited, with its
+        counts moved to the last slot of the block. The lock of the slots
+        must be held.
+        """
+        view = self._view
+        for slot in range(self._slots):
+            index = slot * self._FIELDS
+            if not _is_alive(view[index + self._PID]):
+                self._retire_slot(index)
+                return slot
+
+        raise ValueError(f'SharedCounter has only {self._slots} slots, '
+                         f'increase the slots parameter')
+
+    def _retire_slot(self, index: int) -> None:
+        """Move the counts of a slot to the last slot of the block.
+
+        totals() reads the slots without the lock, so each count is first
+        cleared and then added: totals() may show a little less for a
+        moment, but never more than was counted.
+        """
+        view = self._view
+        retired = self._slots * self._FIELDS
+        for field in (0, 1):
+            count = view[index + field]
+            view[index + field] = 0
+            view[retired + field] += count
+
+    def increment(self, n: int = 1, nbytes: int = 0) -> None:
+        """Add n iterations and nbytes loaded bytes to the slot of the
+        calling writer.
+        """
+        local = self._local
+        # After fork, the child process must not write to the slot of the
+        # parent process.
+        if getattr(local, 'pid', None) == os.getpid():
+            index = local.index
+        else:
+            index = self._claim_slot()
+        view = self._view
+        view[index] += n
+        view[index + 1] += nbytes
+
+    def totals(self) -> tuple:
+        """Return the sum of iterations and loaded bytes of all slots
+        (and of the writers that have exited)
+        """
+        view = self._view
+        return sum(view[0::self._FIELDS]), sum(view[1::self._FIELDS])
+
+    def close(self) -> None:
+        """Release the shared memory. The block is destroyed when the counter
+        is closed by the process that created it.
+        """
+        if self._view is None:
+            return
+        self._view.release()
+        self._view = None
+        self._shm.close()
+        if self._owner_pid == os.getpid() and shared_memory is not None:
+            self._shm.unlink()
+
+
+def _is_alive(pid: int) -> bool:
+    """Check if the process pid exists. Only on Unix: elsewhere os.kill()
+    would terminate the process, so every writer is taken as alive.
+    """
+    if os.name != 'posix':
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:  # a process of another user
+        return True
+
+    return True
+
+
+def _attach_shared_memory(name: str):
+    """Attach to an existing shared memory block.
+
+    Until Python 3.13, attaching registers the block in the resource tracker
+    of the child process as if the child had created it, so that it would
+    be destroyed (or reported as leaked) when the child exits. Only the
+    process that created the block must destroy it.
+    https://github.com/python/cpython/issues/82300
+    """
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+
+    shm = shared_memory.SharedMemory(name=name)
+    if os.name == 'posix':
+        from multiprocessing import resource_tracker
+        resource_tracker.unregister(shm._name, 'shared_memory')
+
+    return shm
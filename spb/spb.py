@@ -19,10 +19,32 @@ documentation: https://github.com/patsuckow/spb/wiki/1.-Home-(en)
 
 Русская документация - https://github.com/patsuckow/spb/wiki/1.-Home-(ru)
 """
+import copy
+import os
 import sys
+import threading
 import time
 from collections import deque
+from operator import length_hint
 from .check_params_spb import _CheckParams
+from .style_spb import ProgressBarStyle
+from .counters_spb import _ShardedCounter
+from .eta_spb import ETA_MODELS
+from .rate_spb import _RateEstimator
+from .output_spb import _Output
+from .render_plan_spb import _display_width, _fit_layout
+from .telemetry_spb import TelemetrySink
+from .terminal_spb import _terminal
+from .monitor_spb import _monitor
+from .units_spb import _UnitFormatter
+
+
+def _disabled_by_environment() -> bool:
+    """Check the SPB_DISABLE environment variable: '1', 'true', 'yes' or
+    'on' (in any case) disable all the progress bars.
+    """
+    return os.environ.get('SPB_DISABLE', '').strip().lower() in \
+        ('1', 'true', 'yes', 'on')
 
 
 try:
@@ -47,7 +69,8 @@ class SimpleProgressBar:
         The final number of iterations. This can be either an integer number o
         f iterations, or an integer number of bits of information when
         uploading or downloading a file.
-        [default: 100]
+        [default: None - start plus the length of the iterable, if it is
+        known, otherwise 100]
 
     progress_bar  : str, optional
         Choose show or hide the progress bar: ['show', 'hide']
@@ -227,6 +250,173 @@ class SimpleProgressBar:
     end_msg  : str, optional
         The message after the completion of the progress bar (if necessary).
 
+    mininterval  : int or float, >= 0, optional
+        Minimum time, in seconds, between two redraws of the progress bar
+        made by next(). Iterations made in between only increase the counter.
+        The final state (iteration == stop) is always drawn.
+        [default: 0.1]
+
+    miniters  : int, >= 0, optional
+        Minimum number of iterations between two checks of the clock made by
+        next(). If 0, the value is adapted after every redraw, so that the
+        clock is checked about once per mininterval.
+        [default: 0]
+
+    maxinterval  : int or float, >= 0, optional
+        Maximum time, in seconds, between two redraws with the adaptive
+        miniters (miniters=0): when a loop slows down after a fast phase, the
+        progress bar is redrawn within about maxinterval seconds and miniters
+        is adapted to the new rate.
+        [default: 10]
+
+    redraw  : str, optional
+        Choose how a new frame is written to the console: ['line', 'changes']
+        'line' - the whole line is rewritten.
+        'changes' - only the changed indicators (for example, the digits of
+                    the timer) are rewritten, using the ANSI cursor
+                    positioning. This reduces the output to the terminal, for
+                    example over SSH, but requires a terminal that displays
+                    wide Unicode-symbols in two columns.
+        In both cases a frame that is the same as the previous one is not
+        written.
+        [default: 'line']
+
+    refresh_rate  : int or float, >= 0, optional
+        If greater than 0, the progress bar is redrawn refresh_rate times per
+        second by a background (daemon) thread, and next() only increases the
+        counter, so that slow writes to the console never stall your loop.
+        The thread draws the final frame when iteration reaches stop, or
+        when close() is called.
+        If 0, the progress bar is redrawn by next() itself (see mininterval
+        and miniters).
+        [default: 0]
+
+    speed_window  : int or float, >= 0, optional
+        The Speed indicator shows the transfer rate over the last
+        speed_window seconds, so that it follows the current throughput
+        after a stall or a burst. If 0, the average rate since the start is
+        shown.
+        [default: 5]
+
+    clock  : callable, optional
+        The monotonic clock of the progress bar: a function without
+        arguments that returns the time in seconds. Each progress bar counts
+        its time from its own creation. For example, pass a fake clock in
+        tests, or time.perf_counter for a finer resolution.
+        [default: time.monotonic]
+
+    eta  : str or EtaEstimator, optional
+        The model of the remaining time, shown by the decreasing timer:
+        ['average', 'ewma', 'lsq'] or your own subclass of EtaEstimator.
+        'average' - the rate since the start: exact when the rate is
+                    constant, but slow to follow its changes.
+        'ewma' - the exponentially weighted moving average of the rate
+                 (EwmaEta), follows the changes of the rate.
+        'lsq' - the slope of the least-squares line through the samples of
+                the last 30 seconds (LeastSquaresEta), steady when the rate
+                is bursty.
+        It only makes sense when variant_timer='decreasing'
+        [default: 'average']
+
+    output  : str, optional
+        Choose how the progress bar is written: ['auto', 'tty', 'log']
+        'tty' - the line is redrawn in place with '\r' and ANSI escape codes.
+        'log' - plain text lines without ANSI escape codes (no colors, no
+                cursor hiding, no animated timer icon), one line every
+                log_interval seconds or every log_percent percent, and the
+                last one. For logs of CI jobs and containers, where stdout is
+                a pipe or a file.
+        'auto' - 'tty' if stdout is a terminal, otherwise 'log'.
+        [default: 'auto']
+
+    log_interval  : int or float, >= 0, optional
+        In the log output, the maximum time, in seconds, between two lines.
+        [default: 30]
+
+    log_percent  : int or float, >= 0, optional
+        In the log output, a line is also written each time the percent
+        reaches the next multiple of log_percent. If 0, only log_interval
+        is used.
+        [default: 10]
+
+    telemetry  : TelemetrySink or list of TelemetrySink, optional
+        Where to write the state of the progress bar (iteration, stop,
+        percent, elapsed, eta, rate, loaded_bytes), besides the console:
+        JsonLinesSink, PrometheusTextfileSink, StatsdSink or your own
+        subclass of TelemetrySink.
+        [default: None]
+
+    telemetry_interval  : int or float, >= 0, optional
+        The minimum time, in seconds, between two writes of the state to the
+        telemetry sinks. The final state is always written.
+        [default: 1]
+
+    telemetry_labels  : dict, optional
+        The labels that tell this progress bar apart in the telemetry, for
+        example {'job': 'backup', 'file': name}.
+        [default: None]
+
+    overhead  : str, optional, 'show' or 'hide'
+        Choose to show or hide the overhead indicator: ['show', 'hide']
+        The share of the wall time since the creation of the progress bar
+        that it has spent drawing its frames, for example 'spb 0.4%'. The
+        same numbers are the overhead_time and overhead properties.
+        [default: 'hide']
+
+    units  : str, optional
+        The prefixes of the units of the Speed and Loaded indicators, from
+        the list: ['si', 'iec']
+        'si' - decimal prefixes (1 kB = 1000 B), 'iec' - binary prefixes
+        (1 KiB = 1024 B).
+        [default: 'si']
+
+    speed_unit  : str, optional
+        The unit of the Speed indicator, from the list: ['bit/s', 'B/s']
+        [default: 'bit/s']
+
+    stream  : text stream or int, optional
+        Where the progress bar is written: a text stream, for example
+        sys.stderr, so that stdout stays clean for data, or a file
+        descriptor, for example 2. A frame written to a file descriptor is
+        encoded once and written with a single os.write(), which is the
+        fastest way.
+        [default: None - sys.stdout]
+
+    iterable  : iterable, optional
+        If set, iterating over the progress bar returns the items of the
+        iterable (a list, a generator, a file, etc.), counting one iteration
+        per item, and the loop ends with the iterable:
+            for item in SimpleProgressBar(iterable=items):
+                ...
+        If stop is not set, it is taken from len() or __length_hint__() of
+        the iterable. If the length is unknown (for example, for a
+        generator), then set stop yourself. An explicit stop is always kept,
+        for example to show a part of a longer iterable.
+        [default: None]
+
+    manager  : ProgressBarManager, optional
+        The manager that draws this progress bar on its own line, together
+        with other progress bars. It is set by ProgressBarManager.add(), the
+        progress bar itself then writes nothing to the console.
+        [default: None]
+
+    style  : ProgressBarStyle, optional
+        The options of the progress bar, validated once for many progress
+        bars (see ProgressBarStyle). If set, the parameters from
+        progress_bar to stream above, except telemetry_labels, are taken
+        from the style and the ones given here are ignored.
+        [default: None]
+
+    disable  : bool, optional
+        Disable the progress bar, for example in production batch runs:
+        then an object with the same methods is returned, which checks no
+        parameters, writes nothing, and whose next() and update() only
+        increase the counters. Iterating over it with the iterable
+        parameter returns the iterator of the iterable itself, so that a
+        disabled progress bar costs nothing per item. The environment
+        variable SPB_DISABLE=1 disables all the progress bars.
+        [default: False]
+
     Public properties, that can be used in your code:
     -------------------------------------------------
     self.iteration  : int
@@ -237,10 +427,30 @@ class SimpleProgressBar:
         Required to store the number of bytes loaded (down/up).
         [default: self.loaded_bytes = 0]
 
+    self.overhead_time  : float
+        The time, in seconds, that the progress bar has spent drawing its
+        frames (read only).
+
+    self.overhead  : float
+        overhead_time as a share of the wall time since the creation of the
+        progress bar (until its final frame), from 0 to 1 (read only).
+
+    To update the counters from several threads at once, use increment()
+    instead of changing these properties.
+
     Public methods, that can be used in your code:
     ----------------------------------------------
     next()
+    update()
+    add_bytes()
     progress_bar()
+    increment()
+    attach()
+    pause()
+    resume()
+    close()
+
+    The progress bar is also a context manager, which calls close() on exit.
 
     Returns
     -------
@@ -257,13 +467,33 @@ class SimpleProgressBar:
        possible indicators and inscriptions in the progress bar line.
        But thanks to the settings, you can display those indicators, icons
        and exchanges of indicators that you need and hide what you do not need.
+       If the line does not fit into the console, the progress bar shrinks
+       the bar and then drops the icons and the names of the indicators.
+       When the console window is resized, the line is fitted to the new
+       width on the next frame.
     """
-    START_TIME = time.monotonic()  # set up start time one time
+    def __new__(cls, *args, disable: bool = False, **kwargs):
+        """Return the disabled progress bar (see _NullProgressBar) if disable
+        is set or by the SPB_DISABLE environment variable.
+        """
+        if not disable and not _disabled_by_environment():
+            return super().__new__(cls)
+        null = super().__new__(cls._null_class())
+        if not isinstance(null, cls):
+            # __init__() is called by Python only for an instance of cls
+            null.__init__(*args, **kwargs)
+
+        return null
+
+    @staticmethod
+    def _null_class() -> type:
+        """Return the class of the disabled progress bar"""
+        return _NullProgressBar
 
     def __init__(
             self,
             start: int = 0,
-            stop: int = 100,
+            stop: int = None,
             progress_bar: str = 'show',
             variant_bar: str = 'static',
             variant_brackets: str = '||',
@@ -287,50 +517,196 @@ class SimpleProgressBar:
             variant_icon_load: str = '⭳',
             load_str: str = 'Loaded',
             color: str = 'green',
-            end_msg: str = ""
+            end_msg: str = "",
+            mininterval: float = 0.1,
+            miniters: int = 0,
+            maxinterval: float = 10,
+            redraw: str = 'line',
+            refresh_rate: float = 0,
+            speed_window: float = 5,
+            clock=time.monotonic,
+            eta='average',
+            output: str = 'auto',
+            log_interval: float = 30,
+            log_percent: float = 10,
+            telemetry=None,
+            telemetry_interval: float = 1,
+            telemetry_labels: dict = None,
+            overhead: str = 'hide',
+            units: str = 'si',
+            speed_unit: str = 'bit/s',
+            stream=None,
+            manager=None,
+            iterable=None,
+            style=None,
+            disable: bool = False
     ) -> None:
 
-        # Run check input parameters
-        _CheckParams(start, stop, progress_bar, variant_bar, variant_brackets,
-                     variant_arrow, variant_space, len_bar, progress_str,
-                     percent, timer, variant_timer, icon_timer,
-                     variant_icon_timer, timer_str, reverse_timer_str, speed,
-                     icon_speed, variant_icon_speed, speed_str, load, icon_load,
-                     variant_icon_load, load_str, color, end_msg)
+        if stop is None:
+            # len() or __length_hint__(), 0 if unknown
+            length = length_hint(iterable) if iterable is not None else 0
+            stop = start + length if length > 0 else 100
+
+        own_style = style is None
+        if own_style:
+            style = ProgressBarStyle(
+                progress_bar=progress_bar, variant_bar=variant_bar,
+                variant_brackets=variant_brackets,
+                variant_arrow=variant_arrow, variant_space=variant_space,
+                len_bar=len_bar, progress_str=progress_str, percent=percent,
+                timer=timer, variant_timer=variant_timer,
+                icon_timer=icon_timer, variant_icon_timer=variant_icon_timer,
+                timer_str=timer_str, reverse_timer_str=reverse_timer_str,
+                speed=speed, icon_speed=icon_speed,
+                variant_icon_speed=variant_icon_speed, speed_str=speed_str,
+                load=load, icon_load=icon_load,
+                variant_icon_load=variant_icon_load, load_str=load_str,
+                color=color, end_msg=end_msg, mininterval=mininterval,
+                miniters=miniters, maxinterval=maxinterval, redraw=redraw,
+                refresh_rate=refresh_rate,
+                speed_window=speed_window, clock=clock, eta=eta,
+                output=output, log_interval=log_interval,
+                log_percent=log_percent, telemetry=telemetry,
+                telemetry_interval=telemetry_interval, overhead=overhead,
+                units=units, speed_unit=speed_unit, stream=stream
+            )
+        elif not isinstance(style, ProgressBarStyle):
+            raise TypeError(f'style must be ProgressBarStyle, not '
+                            f'{type(style)}')
+        _CheckParams.check_start_stop(start, stop, telemetry_labels)
+
+        # The attributes derived from the options are compiled once per
+        # style and shared by all its progress bars (they are not changed by
+        # a progress bar, only replaced).
+        compiled = style._compiled
+        if compiled is None:
+            compiled = self._compile_style(style.options)
+            style._cache('_compiled', compiled)
+        self.__dict__.update(compiled)
+        options = style.options
 
         self.iteration = start
         self._stop = stop
-        self._progress_bar = progress_bar.strip()
-        self._v_bar = variant_bar.strip()
-        self._progress_str = progress_str.strip()
-        self._v_brackets = self._return_list_brackets(variant_brackets.strip())
-        self._v_arrow = variant_arrow.strip()
-        self._v_sp = variant_space
-        self._len_bar = len_bar
-        self._percent = percent
-        self._timer = timer
-        self._v_timer = variant_timer.strip()
-        self._icon_timer = icon_timer.strip()
-        self._stack_v_icon_timer = deque(list(variant_icon_timer.strip()))
-        self._timer_str = timer_str.strip()
-        self._reverse_timer_str = reverse_timer_str.strip()
-        self._speed = speed.strip()
-        self._icon_speed = icon_speed.strip()
-        self._v_icon_speed = variant_icon_speed.strip()
-        self._speed_str = speed_str.strip()
-        self._load = load.strip()
-        self._icon_load = icon_load.strip()
-        self._v_icon_load = variant_icon_load.strip()
-        self._load_str = load_str.strip()
-        self._color = self._choose_indicator_color(color.strip())
-        self._end_msg = end_msg.strip()
-        self._second_step = self._calculate_passed_time()
+        self._stack_v_icon_timer = deque(self._v_icon_timer)
+        self._start_time = self._clock()
+        # The overhead is measured in the wall time, whatever the clock.
+        self._wall_start = time.perf_counter()
+        self._wall_stop = None
+        self._overhead_time = 0.0
+        self._paused_at = None
+        self._paused_time = 0.0
+        self._second_step = self._start_time
+        eta = options['eta']
+        if isinstance(eta, str):
+            self._eta = ETA_MODELS[eta.strip()]()
+        else:
+            # A model keeps the samples of one progress bar.
+            self._eta = eta if own_style else copy.deepcopy(eta)
         self.loaded_bytes = 0
-        self._hide_console_cursor()
+        self._next_check = min(start + 1, stop)
+        self._last_print_time = float('-inf')
+        self._last_print_iteration = start
+        self._output = _Output(options['stream'])
+        output = options['output'].strip()
+        self._log = output == 'log' or output == 'auto' and \
+            not self._output.isatty()
+        self._next_log_time = float('-inf')
+        self._next_log_percent = 0.0
+        self._telemetry_labels = dict(telemetry_labels or {})
+        self._next_telemetry_time = float('-inf')
+        self._last_segments = []
+        self._last_widths = []
+        # The render plans of the style for this output: by the layout and
+        # by the number of columns of the console (see _fit_to_console()).
+        self._plans = style._plans.setdefault(self._log, {})
+        self._plan = None
+        if not self._log:
+            _terminal.watch()
+        self._fit_to_console()
+        # The formatters of the Speed and Loaded indicators remember their
+        # last value, so they are not shared with the other progress bars.
+        color_on, color_off = self._plan.color_on, self._plan.color_off
+        self._format_rate = _UnitFormatter(
+            self._units, self._speed_unit,
+            8 if self._speed_unit == 'bit/s' else 1, color_on, color_off)
+        self._format_size = _UnitFormatter(self._units, 'B', 1, color_on,
+                                           color_off)
+        self._finished = False
+        self._render_lock = threading.Lock()
+        self._counter = _ShardedCounter()
+        self._counters = [self._counter]
+        self._folded_iterations = 0
+        self._folded_bytes = 0
+        self._manager = manager
+        self._managed_line = ''
+        self._iterable = iterable
+        # The rate is measured in the time of the progress bar without the
+        # pauses (see _calculate_passed_time()).
+        speed_window = options['speed_window']
+        self._rate = _RateEstimator(speed_window, 0.0) \
+            if speed_window > 0 else None
+
+        # In the background mode, all the frames are drawn by the manager or
+        # by the background thread, and next() reaches the check only at
+        # the last iteration, to draw the final frame (see _refresh()).
+        refresh_rate = options['refresh_rate']
+        self._background = manager is not None or refresh_rate > 0
+        if self._background:
+            self._next_check = stop
+        elif self._dynamic_miniters:
+            _monitor.watch(self)
+
+        self._refresh_thread = None
+        if manager is None and not self._log:
+            self._hide_console_cursor()
+        if refresh_rate > 0 and manager is None:
+            self._stop_refresh = threading.Event()
+            self._refresh_thread = threading.Thread(
+                target=self._refresh_in_background, args=(1 / refresh_rate,),
+                name='spb-refresh', daemon=True
+            )
+            self._refresh_thread.start()
 
     def __iter__(self):
+        """Return the progress bar itself, or, if the iterable parameter is
+        set, a generator of the items of the iterable.
+        """
+        if self._iterable is not None:
+            return self._iterate()
+
+        return self
+
+    def _iterate(self):
+        """Return the items of the iterable one by one, counting them.
+
+        The counting is the same as in __next__(), but it stops when the
+        iterable is exhausted, not at stop, and then the progress bar is
+        finished by close(). close() is also called when the loop is left
+        early (break or exception).
+
+        The counter is kept in a local variable, which is faster than the
+        attribute; self.iteration is still updated on every item for the
+        background thread. The next check is read from the attribute, since
+        the monitor thread may move it (see _check_maxinterval()).
+        """
+        iteration = self.iteration
+        try:
+            for item in self._iterable:
+                yield item
+                iteration += 1
+                self.iteration = iteration
+                if iteration >= self._next_check:
+                    self._refresh()
+                    iteration = self.iteration
+        finally:
+            self.close()
+
+    def __enter__(self):
         return self
 
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
     def __next__(self) -> int:
         """
         Implementing an iterator eliminates the need to use a singleton:
@@ -338,12 +714,221 @@ class SimpleProgressBar:
         console. This also allows you to set the arguments to __init__ only
         once and only once to check their correctness, which will speed up
         the operation of the SimpleProgressBar class.
+
+        Most calls only increase the counter: the progress bar is redrawn by
+        _refresh() only once every self._miniters iterations and no more often
+        than once per self._mininterval seconds.
+
+        After the last iteration (stop), StopIteration is raised, so that the
+        progress bar can be used in a for loop. The check is made only when
+        the counter reaches self._next_check, which is never beyond stop + 1.
+        In the background mode the progress bar is closed at stop, so that
+        the final frame is drawn and the cursor is shown when the loop ends,
+        not when the background thread wakes up.
         """
         self.iteration += 1
-        self.progress_bar()
+        if self.iteration >= self._next_check:
+            if self.iteration > self._stop:
+                self.iteration -= 1
+                if self._background:
+                    self.close()
+                raise StopIteration
+            self._refresh()
+
+        return self.iteration
+
+    def update(self, n: int = 1, nbytes: int = 0) -> int:
+        """Increase the counters by n iterations and nbytes loaded bytes with
+        one call, and redraw the progress bar at most once.
+
+        For example, when the records are processed in blocks, or when a file
+        is downloaded in chunks:
+            pb.update(len(block))
+            pb.update(1, len(chunk))
+
+        The redraw follows the same rules as in __next__(): mininterval,
+        miniters, and the final frame at stop. Unlike __next__(), update()
+        never raises StopIteration.
+
+        Returns the number of the iteration.
+        """
+        self.iteration += n
+        self.loaded_bytes += nbytes
+        if self.iteration >= self._next_check:
+            self._refresh()
 
         return self.iteration
 
+    def add_bytes(self, nbytes: int) -> None:
+        """Increase the number of loaded bytes and redraw the progress bar if
+        mininterval seconds have passed since the last redraw.
+
+        For the downloads with unknown size, when only the speed and the
+        loaded bytes are shown.
+        """
+        self.loaded_bytes += nbytes
+        if not self._background and \
+                self._clock() - self._last_print_time >= self._mininterval:
+            self._refresh()
+
+    def _refresh(self) -> None:
+        """Redraw the progress bar if enough time has passed since the last
+        redraw, or if the last iteration has been reached.
+
+        When miniters is adaptive, it is recalculated from the rate of the
+        iterations between the two last redraws, so that the next check of
+        the clock happens approximately after mininterval seconds.
+        """
+        if self._background:
+            # Only reached at stop, and then after it by an iterable longer
+            # than stop: the final frame is drawn now, not when the
+            # background thread wakes up.
+            self.close()
+            self._next_check = self._stop + 1 \
+                if self.iteration == self._stop else float('inf')
+            return
+
+        now = self._clock()
+        delta_t = now - self._last_print_time
+        if delta_t >= self._mininterval or self.iteration >= self._stop:
+            if self._dynamic_miniters and delta_t > 0:
+                delta_it = self.iteration - self._last_print_iteration
+                self._miniters = max(
+                    1, int(delta_it * self._mininterval / delta_t)
+                )
+            self._last_print_time = now
+            self._last_print_iteration = self.iteration
+            self.progress_bar()
+
+        # The check is made at stop, then right after it (see __next__()),
+        # and then, if an iterable is longer than stop, as usual.
+        if self.iteration < self._stop:
+            self._next_check = min(self.iteration + self._miniters,
+                                   self._stop)
+        elif self.iteration == self._stop:
+            self._next_check = self._stop + 1
+        else:
+            self._next_check = self.iteration + self._miniters
+
+    def _check_maxinterval(self) -> None:
+        """Make the next iteration check the clock, if maxinterval seconds
+        have passed since the last redraw. Called by the monitor thread (see
+        _Monitor), with the adaptive miniters only.
+
+        Only self._next_check is written. If _refresh() overwrites it at the
+        same moment, the next call of the monitor sets it again.
+        """
+        if not self._finished and not self._background and \
+                self._clock() - self._last_print_time >= self._maxinterval:
+            self._next_check = self.iteration + 1
+
+    def _refresh_in_background(self, interval: float) -> None:
+        """Redraw the progress bar every interval seconds until iteration
+        reaches stop or close() is called (refresh_rate > 0).
+
+        The 0.1 second step of the animated timer icon corresponds to the
+        refresh rate of 10 per second.
+        """
+        while not self._stop_refresh.wait(interval):
+            self.progress_bar()
+            if self._counted_iterations() >= self._stop:
+                break
+
+    def pause(self) -> None:
+        """Stop the timer of the progress bar, for example while waiting
+        for the user or for the next file of a playlist. The time until
+        resume() is left out of the Timer, the Speed and the eta.
+
+        Calling pause() on a paused progress bar does nothing.
+        """
+        with self._render_lock:
+            if self._paused_at is None:
+                self._paused_at = self._clock()
+
+    def resume(self) -> None:
+        """Start the timer stopped by pause() again.
+
+        Calling resume() on a running progress bar does nothing.
+        """
+        with self._render_lock:
+            if self._paused_at is not None:
+                self._paused_time += self._clock() - self._paused_at
+                self._paused_at = None
+
+    def close(self) -> None:
+        """Finish the progress bar: stop the background thread (if any),
+        draw the last frame, show the console cursor and the end message.
+
+        Calling close() on a finished progress bar does nothing.
+        """
+        if self._refresh_thread is not None:
+            self._stop_refresh.set()
+            self._refresh_thread.join()
+            self._refresh_thread = None
+
+        if not self._finished:
+            self._next_log_time = float('-inf')  # the last line of the log
+            self._next_telemetry_time = float('-inf')  # the last state
+            self.progress_bar()
+        if not self._finished:
+            self._finish()
+            self._output.flush()
+
+    @classmethod
+    def _compile_style(cls, options) -> dict:
+        """Return the attributes of the progress bar derived from the
+        options of a style: the stripped strings, the brackets and the color
+        number, the throttling and the output parameters.
+        """
+        telemetry = options['telemetry']
+        if telemetry is None:
+            telemetry = ()
+        elif isinstance(telemetry, TelemetrySink):
+            telemetry = (telemetry,)
+
+        return {
+            '_progress_bar': options['progress_bar'].strip(),
+            '_v_bar': options['variant_bar'].strip(),
+            '_progress_str': options['progress_str'].strip(),
+            '_v_brackets': cls._return_list_brackets(
+                options['variant_brackets'].strip()),
+            '_v_arrow': options['variant_arrow'].strip(),
+            '_v_sp': options['variant_space'],
+            '_len_bar': options['len_bar'],
+            '_percent': options['percent'],
+            '_timer': options['timer'],
+            '_v_timer': options['variant_timer'].strip(),
+            '_icon_timer': options['icon_timer'].strip(),
+            '_v_icon_timer': options['variant_icon_timer'].strip(),
+            '_timer_str': options['timer_str'].strip(),
+            '_reverse_timer_str': options['reverse_timer_str'].strip(),
+            '_speed': options['speed'].strip(),
+            '_icon_speed': options['icon_speed'].strip(),
+            '_v_icon_speed': options['variant_icon_speed'].strip(),
+            '_speed_str': options['speed_str'].strip(),
+            '_load': options['load'].strip(),
+            '_icon_load': options['icon_load'].strip(),
+            '_v_icon_load': options['variant_icon_load'].strip(),
+            '_load_str': options['load_str'].strip(),
+            '_color': cls._choose_indicator_color(options['color'].strip()),
+            '_end_msg': options['end_msg'].strip(),
+            '_clock': options['clock'],
+            '_mininterval': options['mininterval'],
+            # With miniters=0 the number of iterations between checks of the
+            # clock is adapted after each redraw (see _refresh()).
+            '_dynamic_miniters': options['miniters'] == 0,
+            '_miniters': options['miniters'] or 1,
+            '_maxinterval': options['maxinterval'],
+            '_redraw': options['redraw'].strip(),
+            '_log_interval': options['log_interval'],
+            '_log_percent': options['log_percent'],
+            '_telemetry': tuple(telemetry),
+            '_telemetry_interval': options['telemetry_interval'],
+            '_overhead': options['overhead'].strip(),
+            '_units': options['units'].strip(),
+            '_speed_unit': options['speed_unit'].strip(),
+        }
+
     @staticmethod
     def _return_list_brackets(brackets: str) -> list:
         """
@@ -369,61 +954,287 @@ class SimpleProgressBar:
                 'magenta': 5, 'cyan': 6, 'gray': 7, 'white': 8}[color]
 
     def progress_bar(self) -> None:
-        """Calculate, prepare view and display progress bar"""
-        self._write_progress_bar_to_console(
-            self._prepare_string_progress_bar(
-                *self._calculate_basic_element_progress_bar()
-            )
+        """Calculate, prepare view and display progress bar.
+
+        Frames are drawn one at a time, so that the progress bar can be
+        called from several threads without interleaving the output.
+        """
+        with self._render_lock:
+            self._draw()
+
+    def increment(self, n: int = 1, nbytes: int = 0) -> None:
+        """Thread-safe increase of the counters by n iterations and nbytes
+        loaded bytes.
+
+        Unlike self.iteration += n and self.loaded_bytes += nbytes, no update
+        is lost when many threads call it at the same time: each thread
+        writes to its own shard of the counter, without taking a lock. The
+        totals of the shards are shown by the progress bar together with
+        self.iteration and self.loaded_bytes, but are not added to them.
+
+        The progress bar is redrawn no more often than once per mininterval
+        seconds, by the thread that happens to be the first, the others do
+        not wait for it. Call close() when all threads are done, to draw the
+        exact totals.
+        """
+        self._counter.add(n, nbytes)
+        if self._refresh_thread is None \
+                and self._clock() - self._last_print_time >= \
+                self._mininterval \
+                and self._render_lock.acquire(blocking=False):
+            try:
+                self._last_print_time = self._clock()
+                self._draw()
+            finally:
+                self._render_lock.release()
+
+    def attach(self, counter) -> None:
+        """Show the progress of other processes: add the totals of a
+        SharedCounter (or of any object with a totals() method that returns
+        the numbers of iterations and loaded bytes) to the counters of the
+        progress bar.
+        """
+        with self._render_lock:
+            self._counters.append(counter)
+
+    def _fold_counter(self) -> None:
+        """Take the totals of what the threads (and the processes of the
+        attached counters) have added, for the frame.
+
+        The totals are kept in their own attributes: self.iteration and
+        self.loaded_bytes belong to the thread of the loop, and a frame may
+        be drawn by another thread (the background thread, the manager or
+        the executor of AsyncProgressBar), so they are never written here.
+        """
+        iterations = nbytes = 0
+        for counter in self._counters:
+            counter_iterations, counter_bytes = counter.totals()
+            iterations += counter_iterations
+            nbytes += counter_bytes
+        self._folded_iterations = iterations
+        self._folded_bytes = nbytes
+
+    def _counted_iterations(self) -> int:
+        """The number of iterations shown by the progress bar: self.iteration
+        and the iterations of the counters taken by the last frame.
+        """
+        return self.iteration + self._folded_iterations
+
+    def _counted_bytes(self) -> int:
+        """The number of loaded bytes shown by the progress bar, see
+        _counted_iterations().
+        """
+        return self.loaded_bytes + self._folded_bytes
+
+    @property
+    def overhead_time(self) -> float:
+        """The time, in seconds, spent drawing the frames"""
+        return self._overhead_time
+
+    @property
+    def overhead(self) -> float:
+        """The share of the wall time since the creation of the progress bar
+        (until its final frame) spent drawing the frames, from 0 to 1.
+        """
+        stop = self._wall_stop or time.perf_counter()
+        wall = stop - self._wall_start
+        return self._overhead_time / wall if wall > 0 else 0.0
+
+    def _draw(self) -> None:
+        """Draw one frame of the progress bar (see _draw_frame()) and add
+        the time spent to overhead_time, the render lock must be held.
+
+        The time is measured by time.perf_counter() (monotonic, with the
+        highest resolution), whatever the clock parameter: its two calls
+        take well under a microsecond, a frame takes several. Only the
+        frames are timed: counting the iterations between the frames is
+        cheaper than reading the clock (see benchmarks/).
+        """
+        start = time.perf_counter()
+        self._draw_frame()
+        stop = time.perf_counter()
+        self._overhead_time += stop - start
+        if self._finished and self._wall_stop is None:
+            self._wall_stop = stop
+
+    def _draw_frame(self) -> None:
+        """Draw one frame of the progress bar, the render lock must be held.
+
+        If the new frame is the same as the previous one, nothing is written
+        to the console (except for the final frame). With redraw='changes'
+        only the changed segments of the line are rewritten.
+
+        Nothing is drawn after the final frame.
+        """
+        if self._finished:
+            return
+        if self._console_generation != _terminal.generation:
+            self._fit_to_console()
+        self._fold_counter()
+        if self._telemetry:
+            self._write_telemetry()
+        if self._log and self._manager is None and not self._log_line_due():
+            return
+        segments = self._prepare_segments(
+            *self._calculate_basic_element_progress_bar()
         )
+        final = self._counted_iterations() >= self._stop
+        if self._log and self._manager is None:
+            self._write_progress_bar_to_console(''.join(segments) + '\n')
+            return
+        if segments == self._last_segments and not final:
+            return
+
+        if self._manager is not None:
+            # The manager writes the line to the console.
+            self._last_segments = segments
+            self._managed_line = ''.join(segments)
+            self._finished = final
+            return
+
+        if self._redraw == 'changes' and self._last_segments and not final:
+            bar = self._prepare_changes_progress_bar(segments)
+        else:
+            bar = self._plan.line_open + ''.join(segments) + \
+                  self._plan.line_close
+            if self._redraw == 'changes':
+                self._last_widths = [_display_width(x) for x in segments]
+        self._last_segments = segments
+
+        self._write_progress_bar_to_console(bar)
+
+    def _fit_to_console(self) -> None:
+        """Select the layout of the progress bar line for the width of the
+        console: on creation, and on the next frame after the console has
+        been resized (see _TerminalWidth). In a narrow console, the bar is
+        shrunk and then the icons and the labels are dropped, see
+        _fit_layout(). The log output is not limited by the console.
+
+        The layout for each width is compiled once, so that a resize costs
+        only a lookup in a dict.
+        """
+        self._console_generation = _terminal.generation
+        columns = None if self._log else \
+            _terminal.columns(self._output.fileno())
+        plan = self._plans.get(columns)
+        if plan is None:
+            plan = self._plans[columns] = _fit_layout(self, columns,
+                                                      self._plans)
+        if self._plan is not None and plan is not self._plan:
+            # Redraw the whole line of the new layout, and erase the rest of
+            # the previous, longer line (CSI K - Erase in Line).
+            self._last_segments = []
+            self._last_widths = []
+            if self._manager is None:
+                self._output.write('\r\x1b[K')
+        self._plan = plan
+
+    def _write_telemetry(self) -> None:
+        """Write the state of the progress bar to the telemetry sinks, if
+        telemetry_interval seconds have passed since the previous write, or
+        if it is the final state.
+        """
+        now = self._clock()
+        iteration = self._counted_iterations()
+        if now < self._next_telemetry_time and iteration < self._stop:
+            return
+        self._next_telemetry_time = now + self._telemetry_interval
+
+        state = {
+            'iteration': iteration,
+            'stop': self._stop,
+            'percent': round(self._calculate_share_of_iterations() * 100, 3),
+            'elapsed': round(self._calculate_passed_time(), 3),
+            'eta': round(self._calculate_remaining_time(), 3),
+            'rate': round(self._calculate_rate(), 3),
+            'loaded_bytes': self._counted_bytes(),
+            'time': round(time.time(), 3),
+            'labels': self._telemetry_labels,
+        }
+        for sink in self._telemetry:
+            sink.write(state)
+
+    def _log_line_due(self) -> bool:
+        """Return True if the next line of the log output is due: the final
+        one, after log_interval seconds, or at the next multiple of
+        log_percent percent.
+        """
+        now = self._clock()
+        percent = self._calculate_share_of_iterations() * 100
+        if self._counted_iterations() < self._stop and \
+                now < self._next_log_time and \
+                not (self._log_percent and self._plan.show_percent and
+                     percent >= self._next_log_percent):
+            return False
+
+        self._next_log_time = now + self._log_interval
+        if self._log_percent:
+            self._next_log_percent = \
+                (percent // self._log_percent + 1) * self._log_percent
+
+        return True
 
     def _calculate_basic_element_progress_bar(self) -> tuple:
         """
         Calculate all the basic necessary elements for the progress bar:
         arrow, spaces, percent.
+
+        The arrow and the spaces are pre-coloured segments of the bar, which
+        are taken from the tables of the render plan by their length.
         """
         share_of_iterations = self._calculate_share_of_iterations()
-        arrow = round(share_of_iterations * self._len_bar - 1) * self._v_arrow
+        len_bar = self._plan.len_bar
+        len_arrow = min(max(round(share_of_iterations * len_bar - 1), 0),
+                        len_bar - 1)
         percent = round(share_of_iterations * 100, 1)
-        # On a increasing and decreasing progress bar, spaces in the form of
-        # any characters are not needed.
-        spaces = ''
 
-        diff_bar = (self._len_bar - len(arrow) - 1)
-
-        if self._v_bar == 'static':
-            spaces = diff_bar * self._v_sp
-        else:
-            self._v_brackets[0] = ' '
-            self._v_brackets[1] = ''
+        diff_bar = (len_bar - len_arrow - 1)
 
         if self._v_bar == 'decreasing':
-            arrow = diff_bar * self._v_arrow
+            len_arrow = diff_bar
             percent = 100 - percent
 
-        return arrow, spaces, percent, self._get_time_string()
+        timer = self._get_time_string() if self._plan.show_timer else ''
+
+        return (self._plan.arrows[len_arrow], self._plan.spaces[diff_bar],
+                percent, timer)
 
     def _calculate_share_of_iterations(self) -> float:
         """Calculate the share of iterations passed from the total number of
-        iterations.
+        iterations, at most 1: update() may overshoot stop, for example with
+        the last block of a file that has grown while it was read.
         """
-        return self.iteration / self._stop
+        return min(self._counted_iterations() / self._stop, 1.0)
 
-    @staticmethod
-    def _calculate_passed_time() -> float:
-        """Calculate passed of time elapsed since launch.
+    def _calculate_passed_time(self) -> float:
+        """Calculate passed of time elapsed since the creation of the
+        progress bar, without the pauses.
 
         https://docs.python.org/3.7/library/time.html?#time.monotonic
         """
-        return time.monotonic() - SimpleProgressBar.START_TIME
+        paused_at = self._paused_at
+        now = self._clock() if paused_at is None else paused_at
 
-    def _calculate_remaining_time(self) -> float:
-        """Calculate estimated remaining time"""
-        percent = self._calculate_share_of_iterations() * 100
-        if percent >= 1 / self._stop:
-            time_pass = self._calculate_passed_time()
-            return abs(100 / (percent / time_pass) - time_pass)
+        return now - self._start_time - self._paused_time
+
+    def _calculate_rate(self) -> float:
+        """Calculate the transfer rate, in loaded bytes per second, over the
+        last speed_window seconds, or since the start if speed_window is 0.
+        """
+        elapsed = self._calculate_passed_time()
+        loaded_bytes = self._counted_bytes()
+        if self._rate is not None:
+            return self._rate.rate(elapsed, loaded_bytes)
 
-        return .0
+        return loaded_bytes / elapsed if elapsed > 0 else 0.0
+
+    def _calculate_remaining_time(self) -> float:
+        """Calculate estimated remaining time by the model of the eta
+        parameter.
+        """
+        return float(self._eta.estimate(self._calculate_passed_time(),
+                                        self._counted_iterations(),
+                                        self._stop))
 
     def _get_time_string(self) -> str:
         """Get the finished string with time.
@@ -436,31 +1247,25 @@ class SimpleProgressBar:
         For example, a process can be slowed down or accelerated by processes
         independent of the script, for example, increasing or decreasing the
         speed of downloading a file on the server side, etc.
+
+        The icon and the name of the timer are taken from the render plan.
         """
-        if self._v_timer == 'decreasing':
+        if self._plan.decreasing_timer:
             sec = self._calculate_remaining_time()
-            mes = ' ' + self._reverse_timer_str
         else:
             sec = self._calculate_passed_time()
-            mes = ' ' + self._timer_str
 
         minutes = int(sec // 60)
-        hours = int(minutes // 60)
-
-        # Rounding seconds to 1 decimal place. The so-called “bank rounding”
-        # is used, that is, rounding to the nearest even.
-        seconds = round(sec % 60, 1)
-
-        res_hours = ''
-        if 0 < hours < 23:
-            res_hours = f'0{hours}:' if len(str(hours)) < 2 else f'{hours}:'
+        hours = minutes // 60
+        res_hours = f'{hours:02d}:' if 0 < hours < 23 else ''
 
-        prefix_min = '0' if len(str(minutes)) < 2 else ''
-        prefix_sec = '0' if len(str(seconds)) < 2 else ''
+        clock = self._select_icon_to_timer() if self._plan.animated_timer \
+            else ''
 
-        return f"{self._select_icon_to_timer()}{mes}[\x1b[3" \
-               f"{str(self._color)}m{res_hours}{prefix_min}{minutes}:" \
-               f"{prefix_sec}{seconds}\x1b[0m]"
+        # Seconds are rounded to 1 decimal place. The so-called “bank
+        # rounding” is used, that is, rounding to the nearest even.
+        return f"{clock}{self._plan.timer_open}{res_hours}{minutes:02d}:" \
+               f"{sec % 60:.1f}{self._plan.timer_close}"
 
     def _select_icon_to_timer(self) -> str:
         """Select the displayed icon to timer, or you can completely hide this
@@ -474,14 +1279,14 @@ class SimpleProgressBar:
             clock = ' ' + self._stack_v_icon_timer[0]
             # If one tenth of a second or more has passed, then rearrange
             # the stack
-            if self._second_step + 0.1 <= time.monotonic():
+            if self._second_step + 0.1 <= self._clock():
                 if self._v_timer == 'increasing':
                     self._stack_v_icon_timer.append(
                         self._stack_v_icon_timer.popleft())
                 else:
                     self._stack_v_icon_timer.appendleft(
                         self._stack_v_icon_timer.pop())
-                self._second_step = time.monotonic()
+                self._second_step = self._clock()
         elif self._icon_timer == 'hide':
             clock = ''
         else:
@@ -544,87 +1349,215 @@ class SimpleProgressBar:
         data transferred by the transfer time, taking into account that 1
         megabyte is equal to 1000 kbyte (Decimal prefixes (SI)).
         Units: 'bit/s', 'kbit/s', 'Mbit/s', 'Gbit/s', etc.
-        bps, bit/s - reduction of "bits per second".
-        """
-        byte = self.loaded_bytes / self._calculate_passed_time() \
-            if suf == 'bit/s' else self.loaded_bytes
+        bps, bit/s - reduction of "bits per second". The rate is measured in
+        bytes per second, so it is multiplied by 8 for bit/s.
 
-        for unit in ['', 'k', 'M', 'G', 'T', 'P', 'E', 'Z', 'Y']:
-            if abs(byte) < 1000:
-                return f'\x1b[3{str(self._color)}m'+'{:6.2f}'.format(byte) + \
-                       '\x1b[0m' + unit + str(suf)
-            byte /= 1000
+        3. With units='iec', the binary prefixes are used instead: 'KiB',
+        'MiB', ... and 'Kibit/s', 'Mibit/s', ..., 1 KiB = 1024 B.
 
-        # If the number of bytes is transferred even more than 'Yotta', (which
-        # is unlikely to happen), then we will return the question mark.
-        return '?'
+        suf='B' returns the loaded bytes, any other suf - the rate, in the
+        unit of the speed_unit parameter. The text is made by the formatters
+        of the indicators (see _UnitFormatter).
+        """
+        if suf == 'B':
+            return self._format_size(self._counted_bytes())
 
-    def _prepare_string_progress_bar(self, arrow: str, spaces: str,
-                                     percent: int, timer: str) -> str:
-        """Return prepared string progress bar.
+        return self._format_rate(self._calculate_rate())
 
-        Colors in console:
-        https://en.wikipedia.org/wiki/ANSI_escape_code#SGR_parameters
+    def _prepare_string_progress_bar(self, arrow: str, spaces: str,
+                                     percent: float, timer: str) -> str:
+        """Return prepared string progress bar."""
+        return self._plan.line_open + ''.join(
+            self._prepare_segments(arrow, spaces, percent, timer)
+        ) + self._plan.line_close
+
+    def _prepare_segments(self, arrow: str, spaces: str, percent: float,
+                          timer: str) -> list:
+        """Return the segments of the progress bar line: bar, percent, timer,
+        speed, loaded and overhead. The segment of a hidden indicator is an
+        empty string, so that the segments of two frames can be compared one
+        by one.
+
+        The static parts of the line (brackets, colour escapes, names of the
+        indicators and icons) are taken from the render plan compiled in
+        __init__(), only the dynamic fields are formatted here.
+
+        The arrow and spaces are the ready segments of the bar, the percent
+        (0.0% - 100.0%, see _calculate_share_of_iterations()) is taken from
+        the table of the render plan.
         """
-        progress = '\x1b[3{}m{:0.1f}\x1b[0m%'.format(self._color, percent) \
-            if self._percent == 'show' else ''
+        plan = self._plan
+        bar = arrow + spaces if plan.show_bar else ''
 
-        if self._progress_bar == 'show':
-            progress_bar = f"{self._v_brackets[0]}\x1b[3{self._color}m" \
-                           f"{arrow}\x1b[0m{spaces}{self._v_brackets[1]} "
-        elif self._progress_bar == 'hide' and self._progress_str != '':
-            progress_bar = ' '
-            progress = self._progress_str + progress
-        else:
-            progress_bar = ''
-            progress = ''
-
-        timer = '' if self._timer != 'show' else timer
+        progress = plan.progress_label
+        if plan.show_percent:
+            progress += plan.percents[round(percent * 10)]
 
         speed = ''
-        if self._speed == 'show':
-            speed = f"{self._select_icon_to_speed()}{self._speed_str}[" \
-                    f"{self._convert_bytes_to_human_readable(suf='bit/s')}]"
+        if plan.show_speed:
+            speed = plan.speed_open + \
+                self._format_rate(self._calculate_rate()) + plan.field_close
 
         loaded = ''
-        if self._load == 'show':
-            loaded = f"{self._select_icon_to_load()}{self._load_str}[" \
-                     f"{self._convert_bytes_to_human_readable(suf='B')}]"
+        if plan.show_load:
+            loaded = plan.load_open + \
+                self._format_size(self._counted_bytes()) + plan.field_close
+
+        overhead = ''
+        if plan.show_overhead:
+            overhead = f'{plan.overhead_open}{self.overhead * 100:0.1f}' \
+                       f'{plan.overhead_close}'
 
-        return "\r" + progress_bar + progress + timer + speed + loaded + "  \b"
+        return [bar, progress, timer, speed, loaded, overhead]
+
+    def _prepare_changes_progress_bar(self, segments: list) -> str:
+        """Return the string that redraws only the changed segments of the
+        progress bar line (redraw='changes').
+
+        The cursor is moved to the column of a changed segment with ANSI
+        escape codes ('\r' and CSI n C - Cursor Forward). If the width of a
+        changed segment differs from the previous frame, then all the rest of
+        the line is redrawn from this segment.
+        https://en.wikipedia.org/wiki/ANSI_escape_code#CSI_codes
+        """
+        changes = []
+        widths = []
+        column = 0
+        for i, segment in enumerate(segments):
+            width = self._last_widths[i]
+            if segment != self._last_segments[i]:
+                width = _display_width(segment)
+                move = f'\r\x1b[{column}C' if column else '\r'
+                if width != self._last_widths[i]:
+                    changes += [move, ''.join(segments[i:]),
+                                self._plan.line_close]
+                    widths += [width] + [_display_width(x)
+                                         for x in segments[i + 1:]]
+                    break
+                changes += [move, segment]
+            widths.append(width)
+            column += width
+
+        self._last_widths = widths
+
+        return ''.join(changes)
 
     def _write_progress_bar_to_console(self, bar: str) -> None:
-        """Write progress bar to console.
+        """Write progress bar to console (to the stream of the progress
+        bar). The frame, with the end of the progress bar if it is the final
+        one, is written by a single flush.
 
         Buffered IO:
         https://stackoverflow.com/questions/1450551/buffered-vs-unbuffered-io
         """
-        sys.stdout.write(bar)
-        if self.iteration == self._stop and self._percent == 'show':
-            sys.stdout.write('\n')
-            self._show_console_cursor()
-            self._show_end_message()
-            sys.stdout.write('\n')
-        elif self._percent == 'hide':
+        self._output.write(bar)
+        if self._counted_iterations() >= self._stop and \
+                self._percent == 'show':
+            self._finish()
+        elif self._percent == 'hide' and not self._log:
             self._show_console_cursor()
-        sys.stdout.flush()
+        self._output.flush()
 
-    @staticmethod
-    def _hide_console_cursor() -> None:
+    def _finish(self) -> None:
+        """Move to the next line after the final frame, show the console
+        cursor and the end message.
+        """
+        self._finished = True
+        _monitor.unwatch(self)
+        if self._manager is not None:
+            return
+        if self._log:
+            # The last line of the log has already ended with '\n'.
+            if self._end_msg != '':
+                self._output.write(self._end_msg + '\n')
+            return
+        self._output.write('\n')
+        self._show_console_cursor()
+        self._show_end_message()
+        self._output.write('\n')
+
+    def _hide_console_cursor(self) -> None:
         """Hide console cursor: '\x1b[?25l'
         https://en.wikipedia.org/wiki/ANSI_escape_code#CSI_codes
         ('\033' same as '\x1b')
         """
-        sys.stdout.write('\n\x1b[?25l')
+        self._output.write('\n\x1b[?25l')
 
-    @staticmethod
-    def _show_console_cursor() -> None:
+    def _show_console_cursor(self) -> None:
         """Show console cursor: '\x1b[?25h' """
-        sys.stdout.write('\x1b[?25h')
+        self._output.write('\x1b[?25h')
 
     def _show_end_message(self) -> None:
         """Show the message after the completion of the progress bar (if
         necessary).
         """
         if self._end_msg != '':
-            sys.stdout.write(self._end_msg)
+            self._output.write(self._end_msg)
+
+
+class _NullProgressBar(SimpleProgressBar):
+    """The disabled progress bar (disable=True or SPB_DISABLE=1). Protected
+    class. Designed for internal use.
+
+    It has the public methods and properties of SimpleProgressBar, but
+    checks no parameters, queries nothing and writes nothing: next(),
+    update() and the others only increase the counters. Iterating over it
+    with the iterable parameter returns the iterator of the iterable itself,
+    without any cost per item.
+    """
+
+    def __init__(self, start: int = 0, stop: int = None, *args,
+                 iterable=None, **kwargs) -> None:
+        self.iteration = start
+        self.loaded_bytes = 0
+        self._stop = stop if stop is not None else 100
+        self._iterable = iterable
+
+    def __iter__(self):
+        if self._iterable is not None:
+            return iter(self._iterable)
+
+        return self
+
+    def __next__(self) -> int:
+        if self.iteration >= self._stop:
+            raise StopIteration
+        self.iteration += 1
+
+        return self.iteration
+
+    def update(self, n: int = 1, nbytes: int = 0) -> int:
+        self.iteration += n
+        self.loaded_bytes += nbytes
+
+        return self.iteration
+
+    def increment(self, n: int = 1, nbytes: int = 0) -> None:
+        self.iteration += n
+        self.loaded_bytes += nbytes
+
+    def add_bytes(self, nbytes: int) -> None:
+        self.loaded_bytes += nbytes
+
+    def attach(self, counter) -> None:
+        pass
+
+    def progress_bar(self) -> None:
+        pass
+
+    def pause(self) -> None:
+        pass
+
+    def resume(self) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+    @property
+    def overhead_time(self) -> float:
+        return 0.0
+
+    @property
+    def overhead(self) -> float:
+        return 0.0
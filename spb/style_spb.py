@@ -0,0 +1,101 @@
+import inspect
+from types import MappingProxyType
+from .check_params_spb import _CheckParams
+
+
+# The options of a style are all the parameters of SimpleProgressBar, except
+# the ones of each progress bar: start, stop, telemetry_labels, manager and
+# iterable. The defaults are the same as in SimpleProgressBar.
+_DEFAULTS = {
+    name: parameter.default
+    for name, parameter in inspect.signature(
+        _CheckParams.__init__).parameters.items()
+    if name not in ('self', 'start', 'stop', 'telemetry_labels')
+}
+
+
+class ProgressBarStyle:
+    """Immutable set of the options of progress bars, validated once.
+
+    Creating a SimpleProgressBar checks all its parameters (including a
+    query of the size of the console) and compiles its render plan. When a
+    loop creates a progress bar per file, create a style once and pass it to
+    each progress bar: then a progress bar only sets up its own counters,
+    and all the progress bars of a style share their compiled parts.
+
+        style = ProgressBarStyle(speed='show', load='show', len_bar=20)
+        for name in files:
+            with SimpleProgressBar(stop=size(name), style=style) as pb:
+                ...
+
+    The options are the parameters of SimpleProgressBar, except start, stop,
+    telemetry_labels, manager and iterable, which belong to each progress
+    bar. When style is passed to SimpleProgressBar, the options given to
+    SimpleProgressBar itself are ignored: use replace() to make a style with
+    other options.
+
+    An EtaEstimator given as the eta option is copied for each progress bar,
+    since it keeps the samples of one progress bar. The telemetry sinks are
+    shared.
+
+    Parameters
+    ----------
+    **options
+        The options of SimpleProgressBar, with the same defaults.
+
+    Public properties and methods, that can be used in your code:
+    -------------------------------------------------------------
+    options  : mapping
+        All the options of the style (read only).
+    replace()
+    """
+    __slots__ = ('_options', '_compiled', '_plans')
+
+    def __init__(self, **options) -> None:
+        unknown = set(options) - set(_DEFAULTS)
+        if unknown:
+            raise TypeError(f'ProgressBarStyle got unexpected options: '
+                            f'{", ".join(sorted(unknown))}')
+        values = dict(_DEFAULTS)
+        values.update(options)
+        if isinstance(values['telemetry'], list):
+            values['telemetry'] = tuple(values['telemetry'])
+
+        # Run check input parameters, start and stop are checked by each
+        # progress bar.
+        _CheckParams(start=0, stop=100, **values)
+
+        object.__setattr__(self, '_options', MappingProxyType(values))
+        # Filled by the progress bars of the style: the attributes derived
+        # from the options, and the render plans of the layouts (for the log
+        # output and for each width of the console).
+        object.__setattr__(self, '_compiled', None)
+        object.__setattr__(self, '_plans', {})
+
+    def __setattr__(self, name: str, value) -> None:
+        raise AttributeError('ProgressBarStyle is immutable, use replace()')
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError('ProgressBarStyle is immutable, use replace()')
+
+    def __repr__(self) -> str:
+        changed = ', '.join(f'{name}={value!r}'
+                            for name, value in self._options.items()
+                            if value is not _DEFAULTS[name]
+                            and value != _DEFAULTS[name])
+        return f'ProgressBarStyle({changed})'
+
+    @property
+    def options(self) -> MappingProxyType:
+        return self._options
+
+    def replace(self, **changes) -> 'ProgressBarStyle':
+        """Return a new style with the given options changed"""
+        options = dict(self._options)
+        options.update(changes)
+
+        return ProgressBarStyle(**options)
+
+    def _cache(self, name: str, value) -> None:
+        """Store the compiled attributes, for SimpleProgressBar only"""
+        object.__setattr__(self, name, value)
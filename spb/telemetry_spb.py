@@ -0,0 +1,182 @@
+import json
+import os
+import socket
+import threading
+
+
+class TelemetrySink:
+    """Base class of the telemetry sinks: the destinations, besides the
+    console, where a progress bar writes its state, for example to chart the
+    throughput of jobs on dashboards.
+
+    The progress bar calls write() with the state no more often than once
+    per telemetry_interval seconds, and once more with the final state:
+
+        {'iteration': 420, 'stop': 1000, 'percent': 42.0,
+         'elapsed': 12.5, 'eta': 17.3, 'rate': 1048576.0,
+         'loaded_bytes': 13107200, 'time': 1700000000.0,
+         'labels': {'job': 'backup'}}
+
+    elapsed and eta are in seconds, rate is in loaded bytes per second (the
+    Speed indicator shows it in bit/s or in B/s, see speed_unit), time is the
+    Unix time of the state. labels are the telemetry_labels of the progress
+    bar.
+
+    A sink may be shared by many progress bars, also in different threads.
+    The progress bar does not close its sinks: close them yourself, or use
+    them as context managers.
+    """
+
+    def write(self, state: dict) -> None:
+        raise NotImplementedError
+
+    def close(self) -> None:
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+
+class JsonLinesSink(TelemetrySink):
+    """Append each state as a line of JSON (JSON Lines) to a file.
+
+    The labels are written as fields of the object. Each line is flushed, so
+    that a log shipper (or `tail -f`) sees it at once.
+    https://jsonlines.org/
+
+    Parameters
+    ----------
+    file  : path-like or text file object
+        The path of the file (opened for appending), or an open file.
+    """
+
+    def __init__(self, file) -> None:
+        self._own_file = not hasattr(file, 'write')
+        self._file = open(file, 'a', encoding='utf-8') if self._own_file \
+            else file
+        self._lock = threading.Lock()
+
+    def write(self, state: dict) -> None:
+        record = {key: value for key, value in state.items()
+                  if key != 'labels'}
+        record.update(state['labels'])
+        line = json.dumps(record, ensure_ascii=False) + '\n'
+        with self._lock:
+            self._file.write(line)
+            self._file.flush()
+
+    def close(self) -> None:
+        if self._own_file and not self._file.closed:
+            self._file.close()
+
+
+class PrometheusTextfileSink(TelemetrySink):
+    """Write the latest states as gauges to a file for the textfile
+    collector of the Prometheus node exporter.
+
+    Each progress bar is a series of the gauges with its labels, so give the
+    progress bars that share the sink different telemetry_labels. The file
+    is written to a temporary file and then renamed, so that the collector
+    never reads half of it.
+    https://github.com/prometheus/node_exporter#textfile-collector
+
+    Parameters
+    ----------
+    path  : path-like
+        The path of the file, it must end with '.prom'.
+
+    prefix  : str, optional
+        The prefix of the names of the gauges.
+        [default: 'spb']
+    """
+    _METRICS = (
+        ('iteration', 'iteration', 'The number of the iteration.'),
+        ('stop', 'stop', 'The final number of iterations.'),
+        ('percent', 'percent', 'The share of the iterations, in percent.'),
+        ('elapsed', 'elapsed_seconds', 'The time since the start.'),
+        ('eta', 'eta_seconds', 'The estimated remaining time.'),
+        ('rate', 'rate_bytes_per_second', 'The transfer rate.'),
+        ('loaded_bytes', 'loaded_bytes', 'The number of loaded bytes.'),
+    )
+
+    def __init__(self, path, prefix: str = 'spb') -> None:
+        self._path = os.fspath(path)
+        self._prefix = prefix
+        self._series = {}  # the latest state of each set of labels
+        self._lock = threading.Lock()
+
+    def write(self, state: dict) -> None:
+        labels = ','.join(
+            f'{key}="{self._escape(str(value))}"'
+            for key, value in sorted(state['labels'].items())
+        )
+        with self._lock:
+            self._series[labels] = state
+            lines = []
+            for field, name, help_text in self._METRICS:
+                metric = f'{self._prefix}_{name}'
+                lines += [f'# HELP {metric} {help_text}',
+                          f'# TYPE {metric} gauge']
+                for series_labels, series in self._series.items():
+                    series_labels = f'{{{series_labels}}}' if series_labels \
+                        else ''
+                    lines.append(f'{metric}{series_labels} {series[field]!r}')
+            temporary = f'{self._path}.{os.getpid()}.tmp'
+            with open(temporary, 'w', encoding='utf-8') as f:
+                f.write('\n'.join(lines) + '\n')
+            os.replace(temporary, self._path)
+
+    @staticmethod
+    def _escape(value: str) -> str:
+        return value.replace('\\', r'\\').replace('"', r'\"') \
+            .replace('\n', r'\n')
+
+
+class StatsdSink(TelemetrySink):
+    """Send the state as StatsD gauges over UDP, all the gauges of a state in
+    one datagram. The labels are sent as tags (the DogStatsD extension, also
+    understood by Telegraf and the statsd_exporter of Prometheus).
+
+    UDP does not wait for the server: if nobody listens, the gauges are
+    lost, and the progress bar is not slowed down.
+    https://github.com/statsd/statsd/blob/master/docs/metric_types.md
+
+    Parameters
+    ----------
+    host  : str, optional
+        [default: '127.0.0.1']
+
+    port  : int, optional
+        [default: 8125]
+
+    prefix  : str, optional
+        The prefix of the names of the gauges.
+        [default: 'spb']
+    """
+    _FIELDS = ('iteration', 'stop', 'percent', 'elapsed', 'eta', 'rate',
+               'loaded_bytes')
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 8125,
+                 prefix: str = 'spb') -> None:
+        self._address = (host, port)
+        self._prefix = prefix
+        self._socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+
+    def write(self, state: dict) -> None:
+        tags = ','.join(f'{key}:{value}'
+                        for key, value in sorted(state['labels'].items()))
+        tags = f'|#{tags}' if tags else ''
+        datagram = '\n'.join(
+            f'{self._prefix}.{field}:{state[field]!r}|g{tags}'
+            for field in self._FIELDS
+        )
+        try:
+            self._socket.sendto(datagram.encode(), self._address)
+        except OSError:
+            pass  # telemetry must never stop the job
+
+    def close(self) -> None:
+        self._socket.close()
@@ -0,0 +1,93 @@
+import os
+import shutil
+import signal
+import threading
+
+
+class _TerminalWidth:
+    """The width of the console, shared by all the progress bars. Protected
+    class. Designed for internal use.
+
+    The width is queried on the file descriptor of the stream of a progress
+    bar (for example, stderr while stdout is redirected to a file), and, if
+    it is not a terminal, as the width of stdout or $COLUMNS. The width is
+    queried once for each file descriptor and cached. On Unix, a handler of
+    SIGWINCH (the signal sent to the process when the console window is
+    resized) drops the cached widths and increases the generation, so that a
+    progress bar only compares two numbers on each frame to know that it has
+    to pick another layout. The handler calls the previous handler of
+    SIGWINCH, if there was one. The number of lines of the console is
+    queried in the same way by lines(), for ProgressBarManager.
+
+    Where the handler cannot be installed (Windows, or the first progress bar
+    is created outside the main thread), the widths are queried again for
+    each new progress bar.
+
+    https://docs.python.org/3/library/signal.html
+    https://docs.python.org/3/library/os.html#os.get_terminal_size
+    https://docs.python.org/3/library/shutil.html#shutil.get_terminal_size
+    """
+
+    def __init__(self) -> None:
+        self.generation = 0
+        self._columns = {}
+        self._watching = False
+        self._previous_handler = None
+
+    def columns(self, fd: int = None) -> int:
+        """Return the number of columns of the console of the file
+        descriptor fd, or of stdout if fd is None or not a terminal.
+        """
+        columns = self._columns.get(fd)
+        if columns is None:
+            columns = self._columns[fd] = self._query(fd)
+
+        return columns
+
+    def lines(self, fd: int = None) -> int:
+        """Return the number of lines of the console of the file descriptor
+        fd, or of stdout if fd is None or not a terminal. Not cached: it is
+        queried once by each ProgressBarManager.
+        """
+        return self._query(fd, 'lines')
+
+    @staticmethod
+    def _query(fd: int = None, dimension: str = 'columns') -> int:
+        if fd is not None:
+            try:
+                size = getattr(os.get_terminal_size(fd), dimension)
+            except (OSError, ValueError):
+                size = 0
+            # A new pseudo-terminal may have 0 columns and 0 lines.
+            if size > 0:
+                return size
+
+        return getattr(shutil.get_terminal_size(), dimension)
+
+    def watch(self) -> None:
+        """Follow the resizes of the console, called by each new progress
+        bar.
+        """
+        if self._watching:
+            return
+        if hasattr(signal, 'SIGWINCH') and \
+                threading.current_thread() is threading.main_thread():
+            try:
+                self._previous_handler = signal.signal(signal.SIGWINCH,
+                                                       self._on_resize)
+                self._watching = True
+            except (ValueError, OSError):
+                pass
+        self._resized()
+
+    def _on_resize(self, signum, frame) -> None:
+        self._resized()
+        if callable(self._previous_handler):
+            self._previous_handler(signum, frame)
+
+    def _resized(self) -> None:
+        self._columns = {}
+        self.generation += 1
+
+
+_terminal = _TerminalWidth()
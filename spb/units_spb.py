@@ -0,0 +1,105 @@
+from bisect import bisect_right
+from functools import lru_cache
+
+
+# The base of the multiples and the prefixes of the units:
+# SI - decimal prefixes, 1 kB = 1000 B, as disk capacity and file sizes;
+# IEC - binary prefixes, 1 KiB = 1024 B, as memory.
+# https://en.wikipedia.org/wiki/Metric_prefix
+# https://en.wikipedia.org/wiki/Binary_prefix
+_PREFIXES = {
+    'si': (1000, ('', 'k', 'M', 'G', 'T', 'P', 'E', 'Z', 'Y')),
+    'iec': (1024, ('', 'Ki', 'Mi', 'Gi', 'Ti', 'Pi', 'Ei', 'Zi', 'Yi')),
+}
+
+# The number is shown with 2 decimals in 6 columns, so the next unit starts
+# at the smallest value that would be rounded to 1000.00.
+_LIMIT = 999.995
+
+
+@lru_cache(maxsize=None)
+def _unit_tables(units: str, suffix: str, factor: float, color_on: str,
+                 color_off: str) -> tuple:
+    """Return the lower limits of the units, the scales of the values and
+    the texts of the units, for _UnitFormatter.
+
+    There are only a few combinations of the parameters, so the tables are
+    shared by all the progress bars, and creating a formatter costs nothing.
+    """
+    base, prefixes = _PREFIXES[units]
+    # The limits and the scales are of the values before the factor, so
+    # that the factor costs nothing per call.
+    limits = tuple(_LIMIT * base ** k / factor for k in range(len(prefixes)))
+    scales = tuple(factor / base ** k for k in range(len(prefixes)))
+    texts = tuple(color_off + prefix + suffix for prefix in prefixes)
+
+    return limits, scales, texts
+
+
+def _widest_value(units: str, suffix: str) -> str:
+    """Return the widest text of a value, to measure the width of a layout"""
+    _, prefixes = _PREFIXES[units]
+
+    return '000.00' + max(prefixes, key=len) + suffix
+
+
+class _UnitFormatter:
+    """Human-readable representation of a number of bytes or of a transfer
+    rate, for example '  1.50MB' or ' 12.00Mibit/s'. Protected class.
+    Designed for internal use.
+
+    The unit is picked by a binary search in the precomputed lower limits of
+    the units (at most 4 comparisons for 9 units), instead of dividing the
+    value by 1000 unit by unit. The formatter also remembers its last value:
+    the loaded bytes often do not change between two frames, and then the
+    same text is returned without formatting.
+
+    Each indicator of a progress bar has its own formatter.
+
+    Parameters
+    ----------
+    units  : str, optional
+        The prefixes: 'si' (kB, MB, ...) or 'iec' (KiB, MiB, ...).
+        [default: 'si']
+
+    suffix  : str, optional
+        The unit after the prefix, for example 'B', 'B/s' or 'bit/s'.
+        [default: 'B']
+
+    factor  : int or float, optional
+        The multiplier of the values, for example 8 to show a rate in bytes
+        per second in bit/s.
+        [default: 1]
+
+    color_on, color_off  : str, optional
+        The colour escapes around the number.
+        [default: '']
+
+    Values from 1000 Yotta up are shown as '?'.
+    """
+    __slots__ = ('_limits', '_scales', '_units', '_color_on', '_last_value',
+                 '_last_text')
+
+    def __init__(self, units: str = 'si', suffix: str = 'B',
+                 factor: float = 1, color_on: str = '',
+                 color_off: str = '') -> None:
+        self._limits, self._scales, self._units = _unit_tables(
+            units, suffix, factor, color_on, color_off)
+        self._color_on = color_on
+        self._last_value = None
+        self._last_text = ''
+
+    def __call__(self, value: float) -> str:
+        if value == self._last_value:
+            return self._last_text
+        # The number of the units whose lower limit is reached
+        k = bisect_right(self._limits, abs(value))
+        if k < len(self._units):
+            text = f'{self._color_on}{value * self._scales[k]:6.2f}' \
+                   f'{self._units[k]}'
+        else:
+            text = '?'
+        self._last_value = value
+        self._last_text = text
+
+        return text
@@ -0,0 +1,128 @@
+import asyncio
+import io
+import threading
+import unittest
+from unittest import mock
+from spb import AsyncProgressBar
+
+
+def run(coroutine):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+async def source(count: int):
+    for i in range(count):
+        await asyncio.sleep(0)
+        yield i
+
+
+class AsyncProgressBarTest(unittest.TestCase):
+    def setUp(self):
+        """We record the threads in which the frames are written"""
+        self.threads = set()
+        self.patcher = mock.patch('sys.stdout', new_callable=io.StringIO)
+        self.out = self.patcher.start()
+
+    def tearDown(self):
+        self.patcher.stop()
+
+    def track(self, pb: AsyncProgressBar) -> AsyncProgressBar:
+        write = pb._write_progress_bar_to_console
+
+        def tracked_write(bar):
+            self.threads.add(threading.current_thread())
+            write(bar)
+
+        pb._write_progress_bar_to_console = tracked_write
+        return pb
+
+    def test_async_for_aiterable(self):
+        """
+        We verify the statement that:
+        `async for` returns the items of the asynchronous iterable, counts
+        them and draws the final frame
+        """
+        async def main():
+            pb = self.track(AsyncProgressBar(stop=200, aiterable=source(200),
+                                             refresh_rate=1000))
+            return [item async for item in pb], pb
+
+        items, pb = run(main())
+        self.assertEqual(items, list(range(200)))
+        self.assertEqual(pb.iteration, 200)
+        self.assertTrue(pb._finished)
+        self.assertIn('100.0', self.out.getvalue())
+
+    def test_async_for_counter(self):
+        """
+        We verify the statement that:
+        Without an iterable, `async for` returns the numbers of iterations
+        up to stop
+        """
+        async def main():
+            return [i async for i in AsyncProgressBar(start=5, stop=10)]
+
+        self.assertEqual(run(main()), [6, 7, 8, 9, 10])
+
+    def test_single_update(self):
+        """
+        We verify the statement that:
+        The render task draws the final frame when stop is reached before
+        its first frame, without aclose()
+        """
+        async def main():
+            pb = AsyncProgressBar(stop=5, output='tty')
+            await pb.update(5)
+            await asyncio.sleep(0.3)
+            return pb
+
+        pb = run(main())
+        self.assertTrue(pb._finished)
+        self.assertIn('100.0', self.out.getvalue())
+
+    def test_disable(self):
+        """
+        We verify the statement that:
+        A disabled AsyncProgressBar returns the items of the asynchronous
+        iterable from its own iterator and writes nothing
+        """
+        async def main():
+            pb = AsyncProgressBar(stop=3, aiterable=source(3), disable=True)
+            async with pb:
+                items = [item async for item in pb]
+                await pb.update(1, 10)
+            return items, pb
+
+        items, pb = run(main())
+        self.assertEqual(items, [0, 1, 2])
+        self.assertIsInstance(pb, AsyncProgressBar)
+        self.assertEqual((pb.iteration, pb.loaded_bytes), (1, 10))
+        self.assertEqual(self.out.getvalue(), '')
+
+    def test_update_never_draws_in_event_loop(self):
+        """
+        We verify the statement that:
+        update() only increases the counters, the frames are written outside
+        the thread of the event loop
+        """
+        async def main():
+            async with self.track(AsyncProgressBar(
+                    stop=1000, speed='hide', load='show', len_bar=10,
+                    refresh_rate=200)) as pb:
+                for _ in range(100):
+                    await pb.update(10, 1024)
+                    await asyncio.sleep(0.001)
+            return pb
+
+        pb = run(main())
+        self.assertEqual(pb.loaded_bytes, 100 * 1024)
+        self.assertTrue(self.threads)
+        self.assertNotIn(threading.main_thread(), self.threads)
+
+
+if __name__ == '__main__':
+    unittest.main()
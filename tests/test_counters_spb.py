@@ -0,0 +1,82 @@
+import io
+import threading
+import unittest
+from unittest import mock
+from spb import SimpleProgressBar as spb
+from spb.counters_spb import _ShardedCounter
+
+
+THREADS = 32
+INCREMENTS = 5_000
+CHUNK = 1024
+
+
+def run_in_threads(target) -> None:
+    threads = [threading.Thread(target=target) for _ in range(THREADS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+class ShardedCounterTest(unittest.TestCase):
+    def test_totals_are_exact(self):
+        """
+        We verify the statement that:
+        No update of the sharded counter is lost when many threads add to it
+        at the same time
+        """
+        counter = _ShardedCounter()
+
+        def work():
+            for _ in range(INCREMENTS):
+                counter.add(1, CHUNK)
+
+        run_in_threads(work)
+        self.assertEqual(counter.totals(),
+                         (THREADS * INCREMENTS, THREADS * INCREMENTS * CHUNK))
+        self.assertEqual(len(counter._shards), THREADS)
+
+    def test_progress_bar_increment_stress(self):
+        """
+        We verify the statement that:
+        After many threads call increment() and draw the progress bar at the
+        same time, the totals shown by the progress bar are exact
+        """
+        total = THREADS * INCREMENTS
+        with mock.patch('sys.stdout', new_callable=io.StringIO) as out:
+            pb = spb(stop=total, speed='show', load='show', len_bar=10,
+                     timer='hide', mininterval=0, output='tty')
+
+            def work():
+                for _ in range(INCREMENTS):
+                    pb.increment(1, CHUNK)
+
+            run_in_threads(work)
+            pb.close()
+        self.assertEqual(pb._counted_iterations(), total)
+        self.assertEqual(pb._counted_bytes(), total * CHUNK)
+        self.assertIn('100.0', out.getvalue())
+        self.assertEqual(out.getvalue().count('\x1b[?25h'), 1)
+
+    def test_progress_bar_counters_not_written(self):
+        """
+        We verify the statement that:
+        Drawing a frame does not write self.iteration and self.loaded_bytes,
+        the totals of increment() are shown together with them
+        """
+        with mock.patch('sys.stdout', new_callable=io.StringIO) as out:
+            pb = spb(stop=100, load='show', len_bar=10, timer='hide',
+                     mininterval=0, output='tty')
+            pb.increment(30, 1000)
+            pb.update(20, 500)
+            pb.progress_bar()
+        self.assertEqual((pb.iteration, pb.loaded_bytes), (20, 500))
+        self.assertEqual((pb._counted_iterations(), pb._counted_bytes()),
+                         (50, 1500))
+        self.assertIn('50.0', out.getvalue())
+        self.assertIn('1.50\x1b[0mkB', out.getvalue())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+import io
+import unittest
+from unittest import mock
+from spb import SimpleProgressBar as spb, EtaEstimator, AverageEta, \
+    EwmaEta, LeastSquaresEta
+
+
+def feed(model: EtaEstimator, rates: list, total: float) -> float:
+    """Feed the model with 0.1 s steps at the given rates, and return the
+    last estimate.
+    """
+    done = elapsed = 0.0
+    eta = 0.0
+    for rate in rates:
+        elapsed += 0.1
+        done += rate * 0.1
+        eta = model.estimate(elapsed, done, total)
+    return eta
+
+
+class EtaTest(unittest.TestCase):
+    def test_constant_rate(self):
+        """
+        We verify the statement that:
+        At a constant rate, all the models give the exact remaining time
+        """
+        for model in (AverageEta(), EwmaEta(), LeastSquaresEta()):
+            with self.subTest(model=type(model).__name__):
+                self.assertAlmostEqual(feed(model, [100] * 300, 100_000),
+                                       970, places=3)
+
+    def test_change_of_rate(self):
+        """
+        We verify the statement that:
+        After the rate has changed, the recent-rate models follow the new
+        rate, while the average since the start does not
+        """
+        rates = [100] * 600 + [1000] * 600  # 60 s slow, then 60 s fast
+        total = 6_000 + 60_000 + 100_000
+        average = feed(AverageEta(), rates, total)
+        self.assertGreater(average, 150)
+        for model in (EwmaEta(), LeastSquaresEta()):
+            with self.subTest(model=type(model).__name__):
+                self.assertAlmostEqual(feed(model, rates, total), 100,
+                                       delta=2)
+
+    def test_eta_parameter(self):
+        """
+        We verify the statement that:
+        The eta parameter chooses the model by name or takes an instance,
+        and a wrong name is rejected
+        """
+        self.assertIsInstance(spb()._eta, AverageEta)
+        self.assertIsInstance(spb(eta='ewma')._eta, EwmaEta)
+        self.assertIsInstance(spb(eta='lsq')._eta, LeastSquaresEta)
+        model = EwmaEta(half_life=1)
+        self.assertIs(spb(eta=model)._eta, model)
+        with mock.patch('sys.stdout', new_callable=io.StringIO) as out:
+            with self.assertRaises(SystemExit):
+                spb(eta='linear')
+        self.assertIn('eta', out.getvalue())
+
+    def test_remaining_time_of_progress_bar(self):
+        """
+        We verify the statement that:
+        The decreasing timer shows the remaining time of the chosen model
+        """
+        now = [0.0]
+        pb = spb(stop=1000, variant_timer='decreasing', eta='lsq',
+                 clock=lambda: now[0])
+        for _ in range(100):
+            now[0] += 0.5
+            pb.iteration += 5
+            remaining = pb._calculate_remaining_time()
+        self.assertAlmostEqual(remaining, 50)
+        self.assertIn('00:50.0', pb._get_time_string())
+
+
+if __name__ == '__main__':
+    unittest.main()
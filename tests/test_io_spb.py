@@ -0,0 +1,191 @@
+import errno
+import io
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+from spb import SimpleProgressBar as spb, ProgressFile, copyfile
+
+
+DATA = bytes(range(256)) * 1000
+
+
+class ProgressFileTest(unittest.TestCase):
+    def test_read_counts_bytes(self):
+        """
+        We verify the statement that:
+        read(), read1() and readline() count the bytes actually read, and
+        iterations only when requested
+        """
+        pb = spb(stop=len(DATA), mininterval=3600)
+        with mock.patch.object(pb, 'progress_bar'):
+            reader = ProgressFile(io.BufferedReader(io.BytesIO(DATA)), pb,
+                                  iterations=True)
+            self.assertEqual(len(reader.read(1000)), 1000)
+            reader.read1(24)
+            reader.readline()
+            rest = reader.read()
+        self.assertEqual(pb.loaded_bytes, len(DATA))
+        self.assertEqual(pb.iteration, len(DATA))
+        self.assertEqual(reader.tell(), len(DATA))  # delegated to the file
+        self.assertTrue(rest)
+
+        pb = spb(stop=10, mininterval=3600)
+        with mock.patch.object(pb, 'progress_bar'):
+            ProgressFile(io.BytesIO(DATA), pb).read()
+        self.assertEqual(pb.loaded_bytes, len(DATA))
+        self.assertEqual(pb.iteration, 0)
+
+    def test_readinto_is_zero_copy(self):
+        """
+        We verify the statement that:
+        readinto() and readinto1() pass the caller's memoryview to the
+        wrapped file and count the returned number of bytes
+        """
+        buffer = memoryview(bytearray(4096))
+        file = mock.Mock()
+        file.readinto.return_value = 4096
+        file.readinto1.return_value = 100
+        pb = spb(stop=10, mininterval=3600)
+        with mock.patch.object(pb, 'progress_bar'):
+            reader = ProgressFile(file, pb)
+            self.assertEqual(reader.readinto(buffer), 4096)
+            self.assertEqual(reader.readinto1(buffer), 100)
+        self.assertIs(file.readinto.call_args[0][0], buffer)
+        self.assertIs(file.readinto1.call_args[0][0], buffer)
+        self.assertEqual(pb.loaded_bytes, 4196)
+
+    def test_write_and_open(self):
+        """
+        We verify the statement that:
+        write() counts the written bytes, and open() creates a progress bar
+        with stop equal to the size of the file, finished on close
+        """
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'data.bin')
+            with mock.patch('sys.stdout', new_callable=io.StringIO):
+                pb = spb(stop=10, mininterval=3600)
+                with ProgressFile(open(path, 'wb'), pb) as writer:
+                    writer.write(DATA)
+                self.assertEqual(pb.loaded_bytes, len(DATA))
+
+                buffer = memoryview(bytearray(1 << 16))
+                with ProgressFile.open(path, len_bar=10,
+                                       timer='hide') as reader:
+                    while reader.readinto(buffer):
+                        pass
+            self.assertEqual(reader._pb._stop, len(DATA))
+            self.assertEqual(reader._pb.iteration, len(DATA))
+            self.assertTrue(reader._pb._finished)
+            self.assertTrue(reader.closed)
+
+    def test_open_wrong_parameters(self):
+        """
+        We verify the statement that:
+        open() closes the file if the progress bar cannot be created
+        """
+        files = []
+
+        def tracked_open(*args):
+            files.append(open(*args))
+            return files[-1]
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'data.bin')
+            with open(path, 'wb') as file:
+                file.write(DATA)
+            for kwargs, error in (({'color': 'nope'}, SystemExit),
+                                  ({'nope': 1}, TypeError)):
+                with self.subTest(error=error.__name__), \
+                        mock.patch('sys.stdout', new_callable=io.StringIO), \
+                        mock.patch('spb.io_spb.open', side_effect=tracked_open,
+                                   create=True):
+                    with self.assertRaises(error):
+                        ProgressFile.open(path, **kwargs)
+                    self.assertTrue(files[-1].closed)
+        self.assertEqual(len(files), 2)
+
+
+class CopyFileTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.src = os.path.join(self.tmp.name, 'src.bin')
+        self.dst = os.path.join(self.tmp.name, 'dst.bin')
+        with open(self.src, 'wb') as f:
+            f.write(DATA)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def copy(self, chunk_size: int) -> spb:
+        pb = spb(stop=len(DATA), mininterval=3600)
+        with mock.patch.object(pb, 'progress_bar'), \
+                mock.patch.object(pb, 'update', wraps=pb.update) as update:
+            copied = copyfile(self.src, self.dst, progress_bar=pb,
+                              iterations=True, chunk_size=chunk_size)
+        self.assertEqual(copied, len(DATA))
+        with open(self.dst, 'rb') as f:
+            self.assertEqual(f.read(), DATA)
+        self.assertEqual(pb.loaded_bytes, len(DATA))
+        self.assertEqual(pb.iteration, len(DATA))
+        self.assertEqual(update.call_count, -(-len(DATA) // chunk_size))
+
+        return pb
+
+    def test_kernel_copy(self):
+        """
+        We verify the statement that:
+        copyfile() copies the file exactly and updates the progress bar once
+        per chunk
+        """
+        self.copy(10_000)
+
+    def test_readinto_fallback(self):
+        """
+        We verify the statement that:
+        If the kernel copy is not supported, copyfile() copies the file with
+        the readinto() loop, still once per chunk
+        """
+        def unsupported(*args):
+            raise OSError(errno.ENOSYS, 'not supported')
+
+        with mock.patch('os.copy_file_range', unsupported, create=True), \
+                mock.patch('os.sendfile', unsupported, create=True):
+            self.copy(10_000)
+
+    def test_kernel_copy_stops_early(self):
+        """
+        We verify the statement that:
+        If the kernel copy returns 0 before the end of the file, the rest of
+        the file is copied by the readinto() loop
+        """
+        calls = []
+
+        def copy_once(infd, outfd, count):
+            calls.append(count)
+            return os.write(outfd, os.read(infd, count)) if len(calls) == 1 \
+                else 0
+
+        with mock.patch('os.copy_file_range', copy_once, create=True), \
+                mock.patch('os.sendfile', lambda *args: 0, create=True):
+            self.copy(100_000)
+
+    def test_own_progress_bar_and_same_file(self):
+        """
+        We verify the statement that:
+        copyfile() without progress_bar creates and closes its own progress
+        bar, and refuses to copy a file onto itself
+        """
+        with mock.patch('sys.stdout', new_callable=io.StringIO) as out:
+            copyfile(self.src, self.dst, len_bar=10, timer='hide',
+                     output='tty')
+        self.assertIn('100.0', out.getvalue())
+        self.assertIn('\x1b[?25h', out.getvalue())
+        with self.assertRaises(shutil.SameFileError):
+            copyfile(self.src, self.src)
+        self.assertEqual(os.path.getsize(self.src), len(DATA))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,159 @@
+import io
+import os
+import threading
+import unittest
+from unittest import mock
+from spb import ProgressBarManager
+
+
+class ProgressBarManagerTest(unittest.TestCase):
+    def setUp(self):
+        """
+        We create a manager whose thread practically never refreshes, so
+        that the test methods call refresh() themselves.
+        """
+        self.patcher = mock.patch('sys.stdout', new_callable=io.StringIO)
+        self.out = self.patcher.start()
+        with mock.patch('shutil.get_terminal_size',
+                        return_value=os.terminal_size((80, 100))):
+            self.manager = ProgressBarManager(refresh_rate=0.001,
+                                              output='tty')
+
+    def tearDown(self):
+        self.manager.close()
+        self.patcher.stop()
+
+    def test_refresh_single_write(self):
+        """
+        We verify the statement that:
+        refresh() draws the lines of all the progress bars in one write
+        """
+        bars = [self.manager.add(stop=100, timer='hide') for _ in range(50)]
+        for pb in bars:
+            pb.iteration = 50
+        with mock.patch.object(self.out, 'write') as write:
+            self.manager.refresh()
+        self.assertEqual(write.call_count, 1)
+        self.assertEqual(write.call_args[0][0].count('50.0'), 50)
+
+    def test_refresh_more_bars_than_lines(self):
+        """
+        We verify the statement that:
+        If there are more progress bars than lines in the console, the last
+        line shows the number of the progress bars that are not displayed
+        """
+        self.manager._max_lines = 5
+        for _ in range(12):
+            self.manager.add(stop=100, timer='hide')
+        self.manager.refresh()
+        self.assertEqual(len(self.manager._lines), 5)
+        self.assertEqual(self.manager._lines[-1], ' ... and 8 more')
+
+    def test_lines_of_stream(self):
+        """
+        We verify the statement that:
+        The number of lines is measured on the console of the stream of the
+        manager, and on the console of stdout if the stream is not a
+        terminal
+        """
+        class Stream(io.StringIO):
+            def fileno(self):
+                return 99
+
+        def get_terminal_size(fd):
+            if fd == 99:
+                return os.terminal_size((80, 6))
+            raise OSError('not a terminal')
+
+        with mock.patch('shutil.get_terminal_size',
+                        return_value=os.terminal_size((80, 100))), \
+                mock.patch('os.get_terminal_size',
+                           side_effect=get_terminal_size):
+            managers = [ProgressBarManager(stream=stream, output='tty')
+                        for stream in (Stream(), io.StringIO())]
+        for manager in managers:
+            manager.close()
+        self.assertEqual([manager._max_lines for manager in managers],
+                         [5, 99])
+
+    def test_refresh_changed_lines(self):
+        """
+        We verify the statement that:
+        After the first refresh, only the changed lines are rewritten
+        """
+        first = self.manager.add(stop=100, timer='hide')
+        second = self.manager.add(stop=100, timer='hide')
+        self.manager.refresh()
+        written = len(self.out.getvalue())
+        second.iteration = 42
+        self.manager.refresh()
+        frame = self.out.getvalue()[written:]
+        self.assertEqual(frame.count('%'), 1)
+        self.assertIn('42.0', frame)
+        self.assertTrue(frame.startswith('\r\x1b[1A'))
+        self.assertEqual(first._managed_line.count('0.0'), 1)
+
+    def test_finished_bars_collapse(self):
+        """
+        We verify the statement that:
+        A finished progress bar leaves the block, and its last line stays
+        above the lines of the active progress bars
+        """
+        bars = [self.manager.add(stop=1000, timer='hide') for _ in range(8)]
+
+        def work(pb):
+            for _ in range(1000):
+                next(pb)
+
+        threads = [threading.Thread(target=work, args=(pb,)) for pb in bars]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.manager.refresh()
+        self.assertEqual(self.manager._bars, [])
+        self.assertEqual(self.manager._lines, [])
+        self.assertEqual(self.out.getvalue().count('100.0'), 8)
+
+    def test_log_output(self):
+        """
+        We verify the statement that:
+        When the stream is not a terminal, the manager moves no cursor and
+        writes no ANSI escape codes: only the last lines of the finished
+        progress bars, as the lines of a log
+        """
+        out = io.StringIO()
+        with ProgressBarManager(refresh_rate=0.001, stream=out) as manager:
+            first = manager.add(stop=10, timer='hide', end_msg='Done')
+            second = manager.add(stop=10, timer='hide')
+            manager.refresh()
+            self.assertEqual(out.getvalue(), '')
+            first.update(10)
+            manager.refresh()
+            self.assertEqual(out.getvalue(), first._managed_line + '\nDone\n')
+            second.update(5)
+        self.assertNotIn('\x1b', out.getvalue())
+        self.assertEqual(out.getvalue().count('\n'), 3)
+        self.assertIn('50.0%', out.getvalue())
+
+    def test_disable(self):
+        """
+        We verify the statement that:
+        A disabled manager writes nothing, starts no thread, and its
+        progress bars are disabled
+        """
+        with mock.patch('sys.stdout', new_callable=io.StringIO) as out:
+            with ProgressBarManager(disable=True) as manager:
+                pb = manager.add(stop=10)
+                for _ in range(10):
+                    next(pb)
+                manager.refresh()
+                self.assertIsNone(manager._refresh_thread)
+                self.assertEqual(manager._bars, [])
+            self.assertEqual(out.getvalue(), '')
+            self.assertEqual(self.manager.add(disable=True).iteration, 0)
+        self.assertEqual(self.manager._bars, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+import io
+import os
+import unittest
+from unittest import mock
+from spb import SimpleProgressBar as spb, ProgressBarManager
+
+
+class OutputTest(unittest.TestCase):
+    def test_text_stream(self):
+        """
+        We verify the statement that:
+        A progress bar with a text stream writes only to that stream and
+        nothing to stdout
+        """
+        err = io.StringIO()
+        with mock.patch('sys.stdout', new_callable=io.StringIO) as out:
+            with spb(stop=10, stream=err, output='tty') as pb:
+                for _ in range(10):
+                    next(pb)
+        self.assertEqual(out.getvalue(), '')
+        self.assertIn('100.0', err.getvalue())
+        self.assertTrue(err.getvalue().endswith('\x1b[?25h\n'))
+
+    def test_file_descriptor_single_write_per_frame(self):
+        """
+        We verify the statement that:
+        With a file descriptor, each frame (and the final frame with the end
+        of the progress bar) is written by a single os.write() of UTF-8 bytes
+        """
+        read_fd, write_fd = os.pipe()
+        try:
+            with mock.patch('os.write', wraps=os.write) as write:
+                pb = spb(stop=3, stream=write_fd, output='tty',
+                         mininterval=0, end_msg='Done ✓')
+                for _ in range(3):
+                    next(pb)
+            data = os.read(read_fd, 65536)
+        finally:
+            os.close(read_fd)
+            os.close(write_fd)
+        self.assertEqual(write.call_count, 3)
+        text = data.decode('utf-8')
+        self.assertTrue(text.startswith('\n\x1b[?25l\r'))
+        self.assertIn('100.0', text)
+        self.assertTrue(text.endswith('\x1b[?25hDone ✓\n'))
+
+    def test_file_descriptor_log_output(self):
+        """
+        We verify the statement that:
+        A pipe is not a terminal, so a file descriptor of a pipe gets the log
+        output
+        """
+        read_fd, write_fd = os.pipe()
+        try:
+            with spb(stop=10, stream=write_fd) as pb:
+                pb.update(10)
+            data = os.read(read_fd, 65536).decode('utf-8')
+        finally:
+            os.close(read_fd)
+            os.close(write_fd)
+        self.assertTrue(pb._log)
+        self.assertNotIn('\x1b', data)
+        self.assertIn('100.0%', data)
+
+    def test_manager_stream(self):
+        """
+        We verify the statement that:
+        The manager writes its lines to its stream, and nothing to stdout
+        """
+        err = io.StringIO()
+        with mock.patch('sys.stdout', new_callable=io.StringIO) as out:
+            with ProgressBarManager(stream=err) as manager:
+                pb = manager.add(stop=10, timer='hide')
+                pb.update(10)
+        self.assertEqual(out.getvalue(), '')
+        self.assertIn('100.0', err.getvalue())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,65 @@
+import io
+import unittest
+from unittest import mock
+from spb import SimpleProgressBar as spb
+from spb.rate_spb import _RateEstimator
+
+
+class RateEstimatorTest(unittest.TestCase):
+    def test_steady_rate(self):
+        """
+        We verify the statement that:
+        At a steady transfer rate, the estimate is that rate
+        """
+        estimator = _RateEstimator(window=5, now=0)
+        for tick in range(1, 1000):
+            rate = estimator.rate(tick * 0.1, tick * 1000)
+        self.assertAlmostEqual(rate, 10_000)
+
+    def test_stall_and_burst(self):
+        """
+        We verify the statement that:
+        The estimate follows a stall and a burst within the window, while the
+        average since the start does not
+        """
+        estimator = _RateEstimator(window=5, now=0)
+        total = 0
+        for tick in range(1, 601):  # 60 s at 1 MB/s
+            total += 100_000
+            estimator.rate(tick * 0.1, total)
+        for tick in range(601, 701):  # 10 s of stall
+            rate = estimator.rate(tick * 0.1, total)
+        self.assertEqual(rate, 0)
+        for tick in range(701, 801):  # 10 s at 10 MB/s
+            total += 1_000_000
+            rate = estimator.rate(tick * 0.1, total)
+        self.assertAlmostEqual(rate, 10_000_000, delta=500_000)
+        self.assertLessEqual(total / 80, 2_000_000)  # the average
+
+    def test_before_the_window_is_full(self):
+        """
+        We verify the statement that:
+        Until a whole window has passed, the estimate is the average since the
+        first sample, and no time gives no rate
+        """
+        estimator = _RateEstimator(window=60, now=10)
+        self.assertEqual(estimator.rate(10, 0), 0)
+        self.assertAlmostEqual(estimator.rate(12, 4000), 2000)
+        self.assertAlmostEqual(estimator.rate(14, 4000), 1000)
+
+    def test_speed_window_parameter(self):
+        """
+        We verify the statement that:
+        speed_window=0 keeps the average since the start, and a negative
+        speed_window is rejected
+        """
+        self.assertIsNone(spb(speed_window=0)._rate)
+        self.assertIsNotNone(spb()._rate)
+        with mock.patch('sys.stdout', new_callable=io.StringIO) as out:
+            with self.assertRaises(SystemExit):
+                spb(speed_window=-1)
+        self.assertIn('speed_window', out.getvalue())
+
+
+if __name__ == '__main__':
+    unittest.main()
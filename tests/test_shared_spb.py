@@ -0,0 +1,95 @@
+import io
+import multiprocessing
+import unittest
+from unittest import mock
+from spb import SimpleProgressBar as spb, SharedCounter
+from spb import shared_spb
+
+
+WORKERS = 4
+TASKS = 40
+INCREMENTS = 500
+CHUNK = 4096
+
+counter = None
+
+
+def init_worker(shared_counter: SharedCounter) -> None:
+    global counter
+    counter = shared_counter
+
+
+def work(_) -> None:
+    for _ in range(INCREMENTS):
+        counter.increment(1, CHUNK)
+
+
+class SharedCounterTest(unittest.TestCase):
+    def run_pool(self, context: str) -> None:
+        total = TASKS * INCREMENTS
+        shared_counter = SharedCounter(slots=WORKERS, context=context)
+        with mock.patch('sys.stdout', new_callable=io.StringIO):
+            pb = spb(stop=total, timer='hide', refresh_rate=20)
+            pb.attach(shared_counter)
+            ctx = multiprocessing.get_context(context)
+            with ctx.Pool(WORKERS, initializer=init_worker,
+                          initargs=(shared_counter,)) as pool:
+                pool.map(work, range(TASKS))
+            pb.close()
+        self.assertEqual(shared_counter.totals(), (total, total * CHUNK))
+        self.assertEqual(pb._counted_iterations(), total)
+        self.assertEqual(pb._counted_bytes(), total * CHUNK)
+        shared_counter.close()
+
+    def test_pool_fork(self):
+        """
+        We verify the statement that:
+        The progress bar of the parent process shows the exact totals of the
+        workers of a pool created by fork
+        """
+        if 'fork' not in multiprocessing.get_all_start_methods():
+            self.skipTest('fork is not available')
+        self.run_pool('fork')
+
+    def test_pool_spawn(self):
+        """
+        We verify the statement that:
+        The shared counter is passed to the workers of a pool created by
+        spawn, and they write to the same shared memory
+        """
+        if shared_spb.shared_memory is None:
+            self.skipTest('multiprocessing.shared_memory is not available')
+        self.run_pool('spawn')
+
+    def test_pool_maxtasksperchild(self):
+        """
+        We verify the statement that:
+        The slots of the workers that have exited are reused by the new
+        workers of the pool, and their counts are kept in the totals
+        """
+        if 'fork' not in multiprocessing.get_all_start_methods():
+            self.skipTest('fork is not available')
+        total = TASKS * INCREMENTS
+        with SharedCounter(slots=8, context='fork') as shared_counter:
+            ctx = multiprocessing.get_context('fork')
+            with ctx.Pool(2, initializer=init_worker,
+                          initargs=(shared_counter,),
+                          maxtasksperchild=1) as pool:
+                pool.map(work, range(TASKS), chunksize=1)
+            self.assertEqual(shared_counter.totals(),
+                             (total, total * CHUNK))
+
+    def test_too_many_writers(self):
+        """
+        We verify the statement that:
+        A writer that does not get a free slot raises ValueError
+        """
+        with SharedCounter(slots=1) as shared_counter:
+            shared_counter.increment()
+            shared_counter._local.pid = None  # as if it were another writer
+            with self.assertRaises(ValueError):
+                shared_counter.increment()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,6 +1,9 @@
+import io
 import sys
 import unittest
+from unittest import mock
 from spb import SimpleProgressBar as spb
+from spb.monitor_spb import _monitor
 
 
 # Set the value of the parameters for testing:
@@ -44,7 +47,8 @@ class SimpleProgressBarTest(unittest.TestCase):
                        icon_timer, variant_icon_timer, timer_str,
                        reverse_timer_str, speed, icon_speed,
                        variant_icon_speed, speed_str, load, icon_load,
-                       variant_icon_load, load_str, color, end_msg)
+                       variant_icon_load, load_str, color, end_msg,
+                       output='tty')
 
     def tearDown(self):
         """
@@ -246,6 +250,439 @@ class SimpleProgressBarTest(unittest.TestCase):
             "Must be str"
         )
 
+    def test___next___throttles_redraws(self):
+        """
+        We verify the statement that:
+        With a large mininterval, the progress bar is drawn on the first
+        next() call only and not on every iteration
+        """
+        pb = spb(stop=stop, mininterval=3600)
+        with mock.patch.object(pb, 'progress_bar') as draw:
+            for _ in range(10_000):
+                next(pb)
+        self.assertEqual(draw.call_count, 1)
+
+    def test___next___draws_final_frame(self):
+        """
+        We verify the statement that:
+        The final state (iteration == stop) is always drawn, whatever the
+        throttling parameters are
+        """
+        pb = spb(stop=1000, mininterval=3600, miniters=300)
+        with mock.patch.object(pb, 'progress_bar') as draw:
+            for _ in range(1000):
+                next(pb)
+            self.assertEqual(pb.iteration, 1000)
+        self.assertEqual(draw.call_count, 2)
+
+    def test__refresh_adapts_miniters(self):
+        """
+        We verify the statement that:
+        With miniters=0, the number of iterations between checks of the clock
+        grows with the speed of the loop
+        """
+        pb = spb(stop=stop, mininterval=0.001)
+        with mock.patch.object(pb, 'progress_bar'):
+            for _ in range(200_000):
+                next(pb)
+        self.assertGreater(pb._miniters, 1)
+
+    def test__refresh_maxinterval(self):
+        """
+        We verify the statement that:
+        With miniters=0, when the loop slows down after a fast phase, the
+        progress bar is still redrawn within maxinterval seconds and miniters
+        is adapted to the new rate
+        """
+        now = [0.0]
+        pb = spb(stop=10 ** 9, clock=lambda: now[0], output='tty',
+                 stream=io.StringIO())
+        for _ in range(500_000):  # 0.5 s at 1M it/s
+            now[0] += 1e-6
+            next(pb)
+        self.assertGreater(pb._miniters, 10_000)
+        with mock.patch.object(pb, 'progress_bar') as draw:
+            for i in range(5000):  # 500 s at 10 it/s
+                now[0] += 0.1
+                next(pb)
+                if i % 10 == 0:  # the monitor wakes up once per second
+                    _monitor._check()
+        self.assertGreater(draw.call_count, 50)
+        self.assertLess(pb._miniters, 10)
+        self.assertLess(now[0] - pb._last_print_time, 10)
+
+    def test__render_plan(self):
+        """
+        We verify the statement that:
+        The static parts of the line are compiled once in the render plan and
+        the brackets are not shown on an increasing progress bar
+        """
+        self.assertEqual(self.obj._plan.bar_open, '|\x1b[32m')
+        pb = spb(variant_bar='increasing', output='tty')
+        line = pb._prepare_string_progress_bar(
+            *pb._calculate_basic_element_progress_bar()
+        )
+        self.assertTrue(line.startswith('\r \x1b[32m'))
+        self.assertNotIn('|', line)
+
+    def test__render_plan_tables(self):
+        """
+        We verify the statement that:
+        The tables of the render plan have one segment for each length of the
+        arrow and one string for each value of the percent
+        """
+        self.assertEqual(len(self.obj._plan.arrows), len_bar)
+        self.assertEqual(len(self.obj._plan.spaces), len_bar)
+        self.assertEqual(self.obj._plan.percents[1000],
+                         '\x1b[32m100.0\x1b[0m%')
+        self.obj.iteration = stop * 2  # the percent stops at 100%
+        line = self.obj._prepare_string_progress_bar(
+            *self.obj._calculate_basic_element_progress_bar()
+        )
+        self.assertIn('100.0', line)
+        self.assertNotIn('200.0', line)
+
+    def test_progress_bar_skips_same_frame(self):
+        """
+        We verify the statement that:
+        A frame that is the same as the previous one is not written to the
+        console
+        """
+        pb = spb(stop=stop, timer='hide')
+        with mock.patch.object(pb, '_write_progress_bar_to_console') as write:
+            pb.progress_bar()
+            pb.progress_bar()
+            pb.iteration += 1  # 0.0% -> 0.0%
+            pb.progress_bar()
+        self.assertEqual(write.call_count, 1)
+
+    def test_progress_bar_redraw_changes(self):
+        """
+        We verify the statement that:
+        With redraw='changes', only the changed indicator is rewritten at its
+        column of the console
+        """
+        with mock.patch('sys.stdout', new_callable=io.StringIO) as out:
+            pb = spb(stop=1000, timer='hide', redraw='changes',
+                     output='tty')
+            pb.iteration = 10
+            pb.progress_bar()
+            written = len(out.getvalue())
+            pb.iteration = 11
+            pb.progress_bar()
+        self.assertEqual(out.getvalue()[written:],
+                         '\r\x1b[37C\x1b[32m1.1\x1b[0m%')
+
+    def test_refresh_rate_background_thread(self):
+        """
+        We verify the statement that:
+        With refresh_rate, next() reaches the check only at stop, and the
+        background thread draws the final frame and stops
+        """
+        with mock.patch('sys.stdout', new_callable=io.StringIO) as out:
+            pb = spb(stop=10_000, refresh_rate=100, output='tty')
+            with mock.patch.object(pb, '_refresh') as refresh:
+                for _ in range(10_000):
+                    next(pb)
+            pb._refresh_thread.join(5)
+            self.assertFalse(pb._refresh_thread.is_alive())
+            pb.close()
+        refresh.assert_called_once_with()
+        self.assertTrue(pb._finished)
+        self.assertIn('100.0', out.getvalue())
+        self.assertTrue(out.getvalue().endswith('\x1b[?25h\n'))
+
+    def test_refresh_rate_loop_end(self):
+        """
+        We verify the statement that:
+        With refresh_rate, the final frame is drawn and the console cursor
+        is shown as soon as a for loop over the progress bar (or over its
+        iterable) ends, without waiting for the background thread
+        """
+        for options in ({'stop': 1000}, {'iterable': range(1000)}):
+            with self.subTest(options=list(options)), \
+                    mock.patch('sys.stdout', new_callable=io.StringIO) as out:
+                pb = spb(refresh_rate=10, output='tty', **options)
+                for _ in pb:
+                    pass
+                self.assertTrue(pb._finished)
+                self.assertIsNone(pb._refresh_thread)
+                self.assertIn('100.0', out.getvalue())
+                self.assertTrue(out.getvalue().endswith('\x1b[?25h\n'))
+
+    def test_refresh_rate_stop(self):
+        """
+        We verify the statement that:
+        With refresh_rate, the final frame is drawn and the console cursor
+        is shown as soon as next() or update() reaches stop, without waiting
+        for the background thread
+        """
+        def call_next(pb):
+            for _ in range(1000):
+                next(pb)
+
+        def call_update(pb):
+            for _ in range(10):
+                pb.update(100)
+
+        for count in (call_next, call_update):
+            with self.subTest(count=count.__name__), \
+                    mock.patch('sys.stdout', new_callable=io.StringIO) as out:
+                pb = spb(stop=1000, refresh_rate=10, output='tty')
+                count(pb)
+                self.assertTrue(pb._finished)
+                self.assertIsNone(pb._refresh_thread)
+                self.assertIn('100.0', out.getvalue())
+                self.assertTrue(out.getvalue().endswith('\x1b[?25h\n'))
+                with self.assertRaises(StopIteration):
+                    next(pb)
+                self.assertEqual(pb.iteration, 1000)
+
+    def test_close(self):
+        """
+        We verify the statement that:
+        close() stops the background thread before the end of iterations and
+        shows the console cursor only once
+        """
+        with mock.patch('sys.stdout', new_callable=io.StringIO) as out:
+            with spb(stop=stop, refresh_rate=10, output='tty') as pb:
+                next(pb)
+            pb.close()
+        self.assertIsNone(pb._refresh_thread)
+        self.assertEqual(out.getvalue().count('\x1b[?25h'), 1)
+
+    def test___next___stop_iteration(self):
+        """
+        We verify the statement that:
+        After the last iteration, __next__() raises StopIteration, so that
+        a for loop over the progress bar ends
+        """
+        with mock.patch('sys.stdout', new_callable=io.StringIO):
+            self.assertEqual(list(spb(start=3, stop=8)), [4, 5, 6, 7, 8])
+            pb = spb(stop=5, refresh_rate=100)
+            self.assertEqual(list(pb), [1, 2, 3, 4, 5])
+            pb.close()
+
+    def test_iterable(self):
+        """
+        We verify the statement that:
+        The items of the iterable are returned unchanged, stop is taken from
+        its length and the final frame is drawn
+        """
+        items = ['a', 'b', 'c'] * 1000
+        with mock.patch('sys.stdout', new_callable=io.StringIO) as out:
+            pb = spb(iterable=items)
+            self.assertEqual(pb._stop, 3000)
+            self.assertEqual(list(pb), items)
+        self.assertEqual(pb.iteration, 3000)
+        self.assertTrue(pb._finished)
+        self.assertIn('100.0', out.getvalue())
+
+    def test_iterable_explicit_stop(self):
+        """
+        We verify the statement that:
+        An explicit stop is kept with an iterable of known length, and
+        without stop and without a known length, stop is 100
+        """
+        with mock.patch('sys.stdout', new_callable=io.StringIO):
+            self.assertEqual(spb(stop=50, iterable=range(200))._stop, 50)
+            self.assertEqual(spb(start=5, iterable=range(20))._stop, 25)
+            self.assertEqual(spb(iterable=iter([]))._stop, 100)
+            self.assertEqual(spb()._stop, 100)
+
+    def test_iterable_generator(self):
+        """
+        We verify the statement that:
+        A generator of unknown length, longer than stop, is returned whole,
+        and the progress bar is finished when the loop is left early
+        """
+        with mock.patch('sys.stdout', new_callable=io.StringIO):
+            pb = spb(stop=10, iterable=(i for i in range(20)))
+            self.assertEqual(list(pb), list(range(20)))
+            self.assertEqual(pb.iteration, 20)
+            pb = spb(iterable=range(100))
+            for i in pb:
+                if i == 10:
+                    break
+        self.assertTrue(pb._finished)
+
+    def test_update(self):
+        """
+        We verify the statement that:
+        update() advances the counters by blocks, draws at most once per call
+        and draws the final frame
+        """
+        pb = spb(stop=100_000, mininterval=0)
+        with mock.patch.object(pb, 'progress_bar') as draw:
+            for _ in range(10):
+                self.assertEqual(draw.call_count, _)
+                pb.update(10_000, 1024)
+        self.assertEqual(draw.call_count, 10)
+        self.assertEqual(pb.iteration, 100_000)
+        self.assertEqual(pb.loaded_bytes, 10 * 1024)
+
+        # The last block overshoots stop
+        with mock.patch('sys.stdout', new_callable=io.StringIO) as out:
+            pb = spb(stop=25_000, mininterval=3600, output='tty')
+            for _ in range(3):
+                pb.update(10_000)
+        self.assertTrue(pb._finished)
+        self.assertIn('100.0', out.getvalue())
+        self.assertNotIn('120.0', out.getvalue())
+        self.assertTrue(out.getvalue().endswith('\x1b[?25h\n'))
+
+    def test_add_bytes(self):
+        """
+        We verify the statement that:
+        add_bytes() counts the loaded bytes and draws no more often than once
+        per mininterval
+        """
+        pb = spb(stop=stop, mininterval=3600)
+        with mock.patch.object(pb, 'progress_bar') as draw:
+            for _ in range(1000):
+                pb.add_bytes(1024)
+        self.assertEqual(pb.loaded_bytes, 1000 * 1024)
+        self.assertEqual(draw.call_count, 1)
+
+    def test_log_output(self):
+        """
+        We verify the statement that:
+        The log output writes plain lines without ANSI escape codes, only
+        every log_percent percent and the last one
+        """
+        with mock.patch('sys.stdout', new_callable=io.StringIO) as out:
+            pb = spb(stop=1000, speed='show', load='show', len_bar=10,
+                     timer='hide', mininterval=0, log_percent=25,
+                     log_interval=3600, end_msg='Done')
+            for _ in range(1000):
+                pb.update(1, 1000)
+        lines = out.getvalue().splitlines()
+        self.assertTrue(pb._log)
+        self.assertNotIn('\x1b', out.getvalue())
+        self.assertNotIn('\r', out.getvalue())
+        self.assertEqual(len(lines), 6)
+        self.assertIn('0.1%', lines[0])
+        self.assertIn('25.0%', lines[1])
+        self.assertIn('100.0%', lines[4])
+        self.assertIn('Loaded[  1.00MB]', lines[4])
+        self.assertEqual(lines[5], 'Done')
+
+    def test_log_output_interval_and_close(self):
+        """
+        We verify the statement that:
+        Without the percent, the log output writes a line every log_interval
+        seconds, and close() writes the last line
+        """
+        now = [0.0]
+        with mock.patch('sys.stdout', new_callable=io.StringIO) as out:
+            pb = spb(progress_bar='hide', progress_str='', percent='hide',
+                     load='show', output='log', log_interval=10,
+                     mininterval=0, clock=lambda: now[0])
+            for _ in range(50):
+                now[0] += 1
+                pb.add_bytes(1000)
+            pb.close()
+        lines = out.getvalue().splitlines()
+        self.assertEqual(len(lines), 6)
+        self.assertIn('50.00kB', lines[-1])
+
+    def test_clock_per_instance(self):
+        """
+        We verify the statement that:
+        Each progress bar counts the time from its own creation by its own
+        clock
+        """
+        now = [1000.0]
+        first = spb(stop=stop, clock=lambda: now[0])
+        now[0] += 60
+        second = spb(stop=stop, clock=lambda: now[0])
+        now[0] += 1.5
+        self.assertEqual(first._calculate_passed_time(), 61.5)
+        self.assertEqual(second._calculate_passed_time(), 1.5)
+        self.assertIn('00:1.5', second._get_time_string())
+
+    def test_pause_resume(self):
+        """
+        We verify the statement that:
+        The time between pause() and resume() is left out of the timer and
+        of the speed
+        """
+        now = [0.0]
+        pb = spb(stop=stop, timer='hide', speed='show',
+                 clock=lambda: now[0], output='tty')
+        now[0] = 10
+        pb.loaded_bytes = 10_000
+        pb.pause()
+        pb.pause()
+        now[0] = 100
+        self.assertEqual(pb._calculate_passed_time(), 10)
+        pb.resume()
+        pb.resume()
+        now[0] = 110
+        pb.loaded_bytes = 20_000
+        self.assertEqual(pb._calculate_passed_time(), 20)
+        # 1000 B/s
+        self.assertIn('8.00\x1b[0mkbit/s',
+                      pb._convert_bytes_to_human_readable('bit/s'))
+
+    def test_overhead(self):
+        """
+        We verify the statement that:
+        The progress bar measures the wall time spent drawing its frames,
+        whatever its clock, shows it with overhead='show', and stops counting
+        the wall time after the final frame
+        """
+        with mock.patch('sys.stdout', new_callable=io.StringIO) as out:
+            pb = spb(stop=10, len_bar=10, timer='hide', overhead='show',
+                     mininterval=0, clock=lambda: 0.0, output='tty')
+            for _ in range(10):
+                next(pb)
+        self.assertGreater(pb.overhead_time, 0)
+        self.assertTrue(0 < pb.overhead <= 1)
+        self.assertEqual(pb.overhead, pb.overhead)
+        self.assertRegex(out.getvalue(), r' spb \x1b\[32m\d+\.\d\x1b\[0m%')
+
+        with mock.patch('sys.stdout', new_callable=io.StringIO) as out:
+            pb = spb(stop=10, output='tty')
+            pb.progress_bar()
+        self.assertNotIn(' spb ', out.getvalue())
+
+    def test_disable(self):
+        """
+        We verify the statement that:
+        A disabled progress bar (disable=True or SPB_DISABLE=1) checks no
+        parameters, queries nothing and writes nothing, only counts, and
+        returns the iterator of a wrapped iterable itself
+        """
+        items = [1, 2, 3]
+        with mock.patch('sys.stdout', new_callable=io.StringIO) as out, \
+                mock.patch('shutil.get_terminal_size') as size:
+            pb = spb(stop=3, color='pink', disable=True)
+            self.assertIsInstance(pb, spb)
+            self.assertEqual([i for i in pb], [1, 2, 3])
+            self.assertEqual(pb.update(2, 100), 5)
+            pb.add_bytes(10)
+            pb.progress_bar()
+            pb.close()
+            self.assertEqual(pb.loaded_bytes, 110)
+            self.assertEqual(pb.overhead, 0.0)
+
+            pb = spb(iterable=items, disable=True)
+            self.assertIs(type(iter(pb)), type(iter(items)))
+            self.assertEqual(list(pb), items)
+
+            with mock.patch.dict('os.environ', {'SPB_DISABLE': '1'}):
+                with spb(stop=2) as pb:
+                    next(pb)
+            self.assertEqual(pb.iteration, 1)
+        self.assertEqual(out.getvalue(), '')
+        size.assert_not_called()
+
+        with mock.patch.dict('os.environ', {'SPB_DISABLE': '0'}), \
+                mock.patch('sys.stdout', new_callable=io.StringIO) as out:
+            spb(stop=2, output='tty')
+        self.assertIn('\x1b[?25l', out.getvalue())
+
 
 if __name__ == '__main__':
     unittest.main()  # running tests
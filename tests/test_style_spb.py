@@ -0,0 +1,97 @@
+import inspect
+import io
+import unittest
+from unittest import mock
+from spb import SimpleProgressBar as spb, ProgressBarStyle, EwmaEta
+
+
+class StyleTest(unittest.TestCase):
+    def test_defaults(self):
+        """
+        We verify the statement that:
+        The options of a style have the defaults of SimpleProgressBar
+        """
+        parameters = inspect.signature(spb.__init__).parameters
+        options = ProgressBarStyle().options
+        for name, value in options.items():
+            self.assertEqual(value, parameters[name].default, name)
+        for name in ('start', 'stop', 'telemetry_labels', 'manager',
+                     'iterable', 'style'):
+            self.assertNotIn(name, options)
+
+    def test_immutable(self):
+        """
+        We verify the statement that:
+        A style cannot be changed, replace() makes a new style, and unknown
+        or wrong options are rejected when the style is created
+        """
+        style = ProgressBarStyle(color='blue')
+        with self.assertRaises(AttributeError):
+            style.color = 'red'
+        with self.assertRaises(TypeError):
+            style.options['color'] = 'red'
+        other = style.replace(len_bar=10)
+        self.assertEqual(style.options['len_bar'], 35)
+        self.assertEqual(other.options['len_bar'], 10)
+        self.assertEqual(other.options['color'], 'blue')
+        with self.assertRaises(TypeError):
+            ProgressBarStyle(stop=10)
+        with mock.patch('sys.stdout', new=io.StringIO()), \
+                self.assertRaises(SystemExit):
+            ProgressBarStyle(color='pink')
+        with self.assertRaises(TypeError):
+            spb(style={'color': 'blue'})
+
+    def test_same_output(self):
+        """
+        We verify the statement that:
+        A progress bar with a style draws the same line as a progress bar
+        with the same options, and shares the render plan of the style
+        """
+        options = dict(len_bar=10, timer='hide', color='blue', output='tty')
+        style = ProgressBarStyle(**options)
+        lines = []
+        for kwargs in (options, {'style': style}, {'style': style}):
+            with mock.patch('sys.stdout', new=io.StringIO()) as out:
+                pb = spb(stop=4, **kwargs)
+                for _ in range(4):
+                    next(pb)
+                    pb.progress_bar()
+                lines.append(out.getvalue())
+        self.assertEqual(lines[0], lines[1])
+        self.assertEqual(lines[1], lines[2])
+        with mock.patch('sys.stdout', new=io.StringIO()):
+            first = spb(stop=3, style=style)
+            second = spb(stop=5, start=1, style=style)
+        self.assertIs(first._plan, second._plan)
+        self.assertEqual((second.iteration, second._stop), (1, 5))
+
+    def test_start_stop_checked(self):
+        """
+        We verify the statement that:
+        start and stop are still checked for each progress bar of a style
+        """
+        style = ProgressBarStyle(output='tty')
+        with mock.patch('sys.stdout', new=io.StringIO()) as out, \
+                self.assertRaises(SystemExit):
+            spb(start=10, stop=5, style=style)
+        self.assertIn('Wrong Input', out.getvalue())
+
+    def test_eta_copied(self):
+        """
+        We verify the statement that:
+        An eta model given to a style is copied for each progress bar, so
+        that the progress bars do not mix their samples
+        """
+        model = EwmaEta()
+        style = ProgressBarStyle(eta=model, output='tty')
+        with mock.patch('sys.stdout', new=io.StringIO()):
+            first = spb(style=style)
+            second = spb(style=style)
+        self.assertIsNot(first._eta, model)
+        self.assertIsNot(first._eta, second._eta)
+        self.assertIsInstance(first._eta, EwmaEta)
+
+
+if __name__ == '__main__':
+    unittest.main()
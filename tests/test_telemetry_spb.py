@@ -0,0 +1,97 @@
+import io
+import json
+import os
+import socket
+import tempfile
+import unittest
+from unittest import mock
+from spb import SimpleProgressBar as spb, JsonLinesSink, \
+    PrometheusTextfileSink, StatsdSink
+
+
+FIELDS = {'iteration', 'stop', 'percent', 'elapsed', 'eta', 'rate',
+          'loaded_bytes', 'time'}
+
+
+def run_progress_bar(sink, **kwargs) -> None:
+    """Run a progress bar of 100 iterations of 1 second each"""
+    now = [0.0]
+    with mock.patch('sys.stdout', new_callable=io.StringIO):
+        pb = spb(stop=100, mininterval=0, clock=lambda: now[0],
+                 telemetry=sink, **kwargs)
+        for _ in range(100):
+            now[0] += 1
+            pb.update(1, 1000)
+
+
+class TelemetryTest(unittest.TestCase):
+    def test_json_lines_rate_bounded(self):
+        """
+        We verify the statement that:
+        The state is written no more often than once per telemetry_interval
+        seconds, and the final state is always written
+        """
+        out = io.StringIO()
+        run_progress_bar(JsonLinesSink(out), telemetry_interval=30,
+                         telemetry_labels={'job': 'backup'})
+        states = [json.loads(line) for line in out.getvalue().splitlines()]
+        self.assertEqual([state['iteration'] for state in states],
+                         [1, 31, 61, 91, 100])
+        self.assertEqual(set(states[-1]), FIELDS | {'job'})
+        self.assertEqual(states[-1]['job'], 'backup')
+        self.assertEqual(states[-1]['percent'], 100)
+        self.assertEqual(states[-1]['loaded_bytes'], 100_000)
+        self.assertEqual(states[-1]['rate'], 1000)
+        self.assertEqual(states[-1]['elapsed'], 100)
+
+    def test_prometheus_textfile(self):
+        """
+        We verify the statement that:
+        The textfile has one series of gauges per set of labels
+        """
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'spb.prom')
+            sink = PrometheusTextfileSink(path)
+            run_progress_bar(sink, telemetry_labels={'file': 'a'})
+            run_progress_bar(sink, telemetry_labels={'file': 'b'})
+            with open(path) as f:
+                text = f.read()
+            self.assertEqual(os.listdir(tmp), ['spb.prom'])
+        self.assertIn('# TYPE spb_loaded_bytes gauge', text)
+        self.assertIn('spb_loaded_bytes{file="a"} 100000', text)
+        self.assertIn('spb_percent{file="b"} 100.0', text)
+        self.assertEqual(text.count('# TYPE'), 7)
+
+    def test_statsd_udp(self):
+        """
+        We verify the statement that:
+        The gauges of a state are sent in one UDP datagram with the labels as
+        tags
+        """
+        server = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        server.bind(('127.0.0.1', 0))
+        server.settimeout(5)
+        with StatsdSink(port=server.getsockname()[1]) as sink:
+            run_progress_bar(sink, telemetry_interval=3600,
+                             telemetry_labels={'job': 'backup'})
+        first = server.recv(65536).decode()
+        last = server.recv(65536).decode()
+        server.close()
+        self.assertIn('spb.iteration:1|g|#job:backup', first.splitlines())
+        self.assertIn('spb.loaded_bytes:100000|g|#job:backup',
+                      last.splitlines())
+        self.assertEqual(len(last.splitlines()), 7)
+
+    def test_wrong_sink(self):
+        """
+        We verify the statement that:
+        An object that is not a TelemetrySink is rejected
+        """
+        with mock.patch('sys.stdout', new_callable=io.StringIO) as out:
+            with self.assertRaises(SystemExit):
+                spb(telemetry=[io.StringIO()])
+        self.assertIn('telemetry', out.getvalue())
+
+
+if __name__ == '__main__':
+    unittest.main()
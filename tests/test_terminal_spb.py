@@ -0,0 +1,133 @@
+import io
+import os
+import signal
+import unittest
+from unittest import mock
+from spb import SimpleProgressBar as spb
+from spb.render_plan_spb import MIN_LEN_BAR, _display_width
+from spb.terminal_spb import _terminal
+
+
+def console(columns: int):
+    """Patch the size of the console"""
+    return mock.patch('shutil.get_terminal_size',
+                      return_value=os.terminal_size((columns, 24)))
+
+
+def lines(out: io.StringIO) -> list:
+    """Return the lines of the progress bar, without the control symbols"""
+    return [line.split('\r')[-1].replace('\b', '')
+            for line in out.getvalue().split('\n') if '\r' in line]
+
+
+class TerminalTest(unittest.TestCase):
+    def setUp(self):
+        _terminal._resized()
+
+    def tearDown(self):
+        _terminal._resized()
+
+    def test_full_layout(self):
+        """
+        We verify the statement that:
+        In a wide console the layout is not changed
+        """
+        with console(200), mock.patch('sys.stdout', new=io.StringIO()):
+            pb = spb(output='tty', speed='show', load='show')
+        self.assertEqual(pb._plan.len_bar, 35)
+        self.assertTrue(pb._plan.animated_timer)
+        self.assertEqual(pb._plan.speed_open, ' 🚀 Speed[')
+
+    def test_narrow_console(self):
+        """
+        We verify the statement that:
+        In a narrow console the progress bar does not exit: the bar is
+        shrunk first, then the icons and then the labels are dropped, and
+        the line fits into the console
+        """
+        cases = (
+            (70, lambda plan: MIN_LEN_BAR <= plan.len_bar < 35 and
+             plan.animated_timer and plan.speed_open == ' 🚀 Speed['),
+            (60, lambda plan: plan.len_bar >= MIN_LEN_BAR and
+             not plan.animated_timer and plan.speed_open == ' Speed['),
+            (50, lambda plan: plan.len_bar >= MIN_LEN_BAR and
+             plan.speed_open == ' [' and 'Timer' not in plan.timer_open),
+        )
+        for columns, check in cases:
+            with self.subTest(columns=columns), console(columns), \
+                    mock.patch('sys.stdout', new=io.StringIO()) as out:
+                _terminal._resized()
+                pb = spb(stop=10, output='tty', speed='show')
+                pb.update(10, 999_000)
+                self.assertTrue(check(pb._plan))
+                self.assertLess(pb._plan.width, columns)
+                for line in lines(out):
+                    self.assertLess(_display_width(line), columns)
+
+    def test_resize(self):
+        """
+        We verify the statement that:
+        After the console is resized (SIGWINCH), the next frame is drawn in
+        the layout for the new width, and the plans are compiled only once
+        for each width
+        """
+        if not hasattr(signal, 'SIGWINCH'):
+            self.skipTest('SIGWINCH is not available')
+        with console(200), mock.patch('sys.stdout', new=io.StringIO()) as out:
+            pb = spb(stop=10, output='tty', mininterval=0)
+            next(pb)
+            wide = pb._plan
+            with console(50):
+                os.kill(os.getpid(), signal.SIGWINCH)
+                next(pb)
+            narrow = pb._plan
+            self.assertLess(narrow.len_bar, wide.len_bar)
+            self.assertIn('\r\x1b[K', out.getvalue())
+            self.assertLess(_display_width(lines(out)[-1]), 50)
+
+            os.kill(os.getpid(), signal.SIGWINCH)
+            next(pb)
+            self.assertIs(pb._plan, wide)
+            with console(50):
+                os.kill(os.getpid(), signal.SIGWINCH)
+                next(pb)
+            self.assertIs(pb._plan, narrow)
+
+    def test_console_of_stream(self):
+        """
+        We verify the statement that:
+        The width is measured on the console of the stream of the progress
+        bar (for example, stderr while stdout is redirected to a file)
+        """
+        class Stream(io.StringIO):
+            def fileno(self):
+                return 99
+
+        def get_terminal_size(fd):
+            if fd == 99:
+                return os.terminal_size((50, 24))
+            raise OSError('not a terminal')
+
+        with console(200), mock.patch('os.get_terminal_size',
+                                      side_effect=get_terminal_size):
+            narrow = spb(output='tty', speed='show', stream=Stream())
+            wide = spb(output='tty', speed='show', stream=io.StringIO())
+        self.assertLess(narrow._plan.width, 50)
+        self.assertLess(narrow._plan.len_bar, 35)
+        self.assertEqual(wide._plan.len_bar, 35)
+        self.assertEqual(set(_terminal._columns), {99, None})
+
+    def test_log_output_not_limited(self):
+        """
+        We verify the statement that:
+        The lines of the log output are not shrunk in a narrow console
+        """
+        with console(30), mock.patch('sys.stdout', new=io.StringIO()):
+            _terminal._resized()
+            pb = spb(output='log', speed='show', load='show')
+        self.assertEqual(pb._plan.len_bar, 35)
+        self.assertIn('Timer', pb._plan.timer_open)
+
+
+if __name__ == '__main__':
+    unittest.main()
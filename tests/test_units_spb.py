@@ -0,0 +1,99 @@
+import io
+import unittest
+from spb import SimpleProgressBar as spb
+from spb.units_spb import _UnitFormatter, _widest_value
+
+
+class UnitFormatterTest(unittest.TestCase):
+    def test_si(self):
+        """
+        We verify the statement that:
+        The SI unit is switched at the value which would be rounded to
+        1000.00, as with the division by 1000 unit by unit
+        """
+        cases = (
+            (0, '  0.00B'),
+            (999.99, '999.99B'),
+            (999.995, '  1.00kB'),
+            (1000, '  1.00kB'),
+            (12_345_678, ' 12.35MB'),
+            (999_994_999, '999.99MB'),
+            (10 ** 24, '  1.00YB'),
+        )
+        format_size = _UnitFormatter('si', 'B')
+        for value, text in cases:
+            with self.subTest(value=value):
+                self.assertEqual(format_size(value), text)
+
+    def test_iec(self):
+        """
+        We verify the statement that:
+        The IEC units are the multiples of 1024
+        """
+        format_size = _UnitFormatter('iec', 'B')
+        self.assertEqual(format_size(999), '999.00B')
+        self.assertEqual(format_size(1000), '  0.98KiB')
+        self.assertEqual(format_size(1536), '  1.50KiB')
+        self.assertEqual(format_size(3 * 1024 ** 3), '  3.00GiB')
+
+    def test_bits(self):
+        """
+        We verify the statement that:
+        A rate in bytes per second is shown in bit/s with the factor 8
+        """
+        self.assertEqual(_UnitFormatter('si', 'bit/s', 8)(1000),
+                         '  8.00kbit/s')
+        self.assertEqual(_UnitFormatter('iec', 'bit/s', 8)(128),
+                         '  1.00Kibit/s')
+        self.assertEqual(_UnitFormatter('si', 'B/s')(1000), '  1.00kB/s')
+
+    def test_too_large(self):
+        """
+        We verify the statement that:
+        The values from 1000 Yotta up are shown as '?'
+        """
+        self.assertEqual(_UnitFormatter()(10 ** 27), '?')
+
+    def test_same_value(self):
+        """
+        We verify the statement that:
+        The text of the last value is reused while the value is the same
+        """
+        format_size = _UnitFormatter('si', 'B', 1, '\x1b[32m', '\x1b[0m')
+        text = format_size(123_456)
+        self.assertEqual(text, '\x1b[32m123.46\x1b[0mkB')
+        self.assertIs(format_size(123_456), text)
+        self.assertEqual(format_size(654_321), '\x1b[32m654.32\x1b[0mkB')
+
+    def test_widest_value(self):
+        """
+        We verify the statement that:
+        No value is wider than the widest value of its units
+        """
+        for units in ('si', 'iec'):
+            format_rate = _UnitFormatter(units, 'bit/s', 8)
+            widest = len(_widest_value(units, 'bit/s'))
+            for power in range(0, 27):
+                with self.subTest(units=units, power=power):
+                    self.assertLessEqual(len(format_rate(10 ** power)),
+                                         widest)
+
+    def test_progress_bar(self):
+        """
+        We verify the statement that:
+        The Speed and Loaded indicators of a progress bar are shown in the
+        units and in the unit of the speed given by units and speed_unit
+        """
+        now = [0.0]
+        out = io.StringIO()
+        pb = spb(stop=10, speed='show', load='show', units='iec',
+                 speed_unit='B/s', clock=lambda: now[0], output='tty',
+                 stream=out)
+        now[0] = 2
+        pb.update(10, 2048)
+        self.assertIn('1.00\x1b[0mKiB/s', out.getvalue())
+        self.assertIn('2.00\x1b[0mKiB]', out.getvalue())
+
+
+if __name__ == '__main__':
+    unittest.main()